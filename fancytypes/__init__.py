@@ -27,14 +27,72 @@ classes that inherit some subset of the aforementioned features.
 # For performing deep copies.
 import copy
 
+# For grouping consecutive core attributes.
+import itertools
+
+# For maintaining least-recently-used caches of loaded core attributes.
+import collections
+
 # For serializing and deserializing JSON objects.
 import json
 
+# For wrapping binary streams in text streams.
+import io
+
+# For decoding binary streams incrementally.
+import codecs
+
+# For skipping whitespace in JSON documents.
+import re
+
+# For compressing and decompressing files.
+import gzip
+import bz2
+import lzma
+
 # For performing operations on file and directory paths.
 import pathlib
 
+# For prefetching parameter sets in a background thread.
+import threading
+import queue
+
+# For retrieving the default values of constructor parameters.
+import inspect
+
+# For keeping track of the caches of memoizable validation and conversion
+# functions without keeping them alive.
+import weakref
+
+# For wrapping memoizable validation and conversion functions.
+import functools
+
+# For defining context managers that batch updates.
+import contextlib
+
+# For atomically replacing files and flushing them to disk.
+import os
+
+# For preserving the permission bits of overwritten files.
+import stat
+
+# For generating unique names of temporary files.
+import uuid
+
+# For computing content digests of serialized representations.
+import hashlib
+
+# For creating read-only views of projected core attributes.
+import types
+
+# For storing and querying instances in SQLite databases.
+import sqlite3
 
 
+
+# For general array handling and memory-mapping arrays stored in files.
+import numpy as np
+
 # For validating and converting objects.
 import czekitout.check
 import czekitout.convert
@@ -55,9 +113,16 @@ __all__ = ["Checkable",
            "Updatable",
            "PreSerializable",
            "PreSerializableAndUpdatable",
+           "batch_dump",
+           "sweep",
+           "ColumnarCollection",
+           "SQLiteStore",
            "return_validation_and_conversion_funcs",
            "return_pre_serialization_funcs",
-           "return_de_pre_serialization_funcs"]
+           "return_de_pre_serialization_funcs",
+           "mark_as_memoizable",
+           "get_validator_memoization_stats",
+           "clear_validator_memoization_caches"]
 
 
 
@@ -128,10 +193,13 @@ def _check_and_convert_core_attrs_candidate(params):
             raise KeyError(err_msg)
                     
     for key in validation_and_conversion_funcs:
-        validation_and_conversion_func = validation_and_conversion_funcs[key]
-        
-        kwargs = {"params": core_attrs_candidate}
-        core_attr_candidate = validation_and_conversion_func(**kwargs)
+        kwargs = {"validation_and_conversion_func": \
+                  validation_and_conversion_funcs[key],
+                  "core_attrs_candidate": \
+                  core_attrs_candidate,
+                  "validator_cache": \
+                  params.get("validator_cache", None)}
+        core_attr_candidate = _call_validation_and_conversion_func(**kwargs)
         
         core_attrs_candidate[key] = core_attr_candidate
 
@@ -139,6 +207,30 @@ def _check_and_convert_core_attrs_candidate(params):
 
 
 
+def _check_and_convert_subset_of_core_attrs_candidate(params):
+    core_attrs_candidate = params["core_attrs_candidate"].copy()
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+    names_of_core_attrs_to_check_and_convert = \
+        params["names_of_core_attrs_to_check_and_convert"]
+
+    for key in validation_and_conversion_funcs:
+        if key in names_of_core_attrs_to_check_and_convert:
+            kwargs = {"validation_and_conversion_func": \
+                      validation_and_conversion_funcs[key],
+                      "core_attrs_candidate": \
+                      core_attrs_candidate,
+                      "validator_cache": \
+                      params.get("validator_cache", None)}
+            core_attr_candidate = \
+                _call_validation_and_conversion_func(**kwargs)
+        
+            core_attrs_candidate[key] = core_attr_candidate
+
+    return core_attrs_candidate
+
+
+
 def _check_and_convert_deep_copy(params):
     obj_name = "deep_copy"
     kwargs = {"obj": params[obj_name], "obj_name": obj_name}
@@ -148,9 +240,276 @@ def _check_and_convert_deep_copy(params):
 
 
 
+def _check_and_convert_on_error(params):
+    obj_name = "on_error"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    on_error = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    kwargs["obj"] = on_error
+    kwargs["accepted_strings"] = ("raise", "skip", "yield", "collect")
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    return on_error
+
+
+
+def _check_and_convert_chunk_size(params):
+    obj_name = "chunk_size"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    chunk_size = czekitout.convert.to_positive_int(**kwargs)
+
+    return chunk_size
+
+
+
+def _check_and_convert_error_budget(params):
+    obj_name = "error_budget"
+    obj = params[obj_name]
+
+    if obj is not None:
+        kwargs = {"obj": obj, "obj_name": obj_name}
+        error_budget = czekitout.convert.to_nonnegative_int(**kwargs)
+    else:
+        error_budget = obj
+
+    return error_budget
+
+
+
+def _check_and_convert_core_attrs_candidate_collecting_errors(params):
+    # Unlike ``_check_and_convert_core_attrs_candidate``, every validation and
+    # conversion function is called, even after a failure, and failures are
+    # recorded in an error report rather than raised. A core attribute that
+    # fails to validate keeps its unconverted value, and core attributes
+    # missing from the candidate are not validated.
+    core_attrs_candidate = params["core_attrs_candidate"].copy()
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+    error_report = tuple()
+
+    for key in core_attrs_candidate:
+        if key not in validation_and_conversion_funcs:
+            unformatted_err_msg = \
+                _check_and_convert_core_attrs_candidate_err_msg_1
+            obj_name = "params"
+            err_msg = unformatted_err_msg.format(obj_name, obj_name, key)
+            error_report += ({"attr_name": key,
+                              "message": err_msg,
+                              "exception_type": KeyError},)
+
+    for key in validation_and_conversion_funcs:
+        if key in core_attrs_candidate:
+            kwargs = {"validation_and_conversion_func": \
+                      validation_and_conversion_funcs[key],
+                      "core_attrs_candidate": \
+                      core_attrs_candidate,
+                      "validator_cache": \
+                      params.get("validator_cache", None)}
+
+            try:
+                core_attr_candidate = \
+                    _call_validation_and_conversion_func(**kwargs)
+                core_attrs_candidate[key] = core_attr_candidate
+            except Exception as err:
+                error_report += ({"attr_name": key,
+                                  "message": str(err),
+                                  "exception_type": type(err)},)
+
+    return core_attrs_candidate, error_report
+
+
+
+def _check_and_convert_prefetch_size(params):
+    obj_name = "prefetch_size"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    prefetch_size = czekitout.convert.to_nonnegative_int(**kwargs)
+
+    return prefetch_size
+
+
+
+def _generate_prefetched_items(iterable, prefetch_size):
+    # The items are fetched by a background thread into a bounded queue, so
+    # that at most ``prefetch_size`` items are held in memory ahead of the
+    # consumer. The producer polls a stop event while the queue is full, so
+    # that it exits once the consumer stops iterating.
+    item_queue = queue.Queue(maxsize=prefetch_size)
+    stop_event = threading.Event()
+
+    def put(entry):
+        while not stop_event.is_set():
+            try:
+                item_queue.put(entry, timeout=_prefetch_poll_interval)
+                break
+            except queue.Full:
+                pass
+
+        return None
+
+    def produce():
+        try:
+            for item in iterable:
+                put(("item", item))
+            put(("end", None))
+        except Exception as err:
+            put(("error", err))
+
+        return None
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        entry_type, payload = item_queue.get()
+        while entry_type == "item":
+            yield payload
+            entry_type, payload = item_queue.get()
+        if entry_type == "error":
+            raise payload
+    finally:
+        stop_event.set()
+
+
+
+def _check_and_convert_capacity(params):
+    obj_name = "capacity"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    capacity = czekitout.convert.to_positive_int(**kwargs)
+
+    return capacity
+
+
+
+class _LRUCache():
+    # Maps keys to values, evicting the least recently used entries once the
+    # capacity is exceeded. Used both to cache the core attributes of loaded
+    # instances, and the results of memoizable validation and conversion
+    # functions.
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._entries = collections.OrderedDict()
+        self._num_hits = 0
+        self._num_misses = 0
+
+        return None
+
+
+
+    def get(self, key, default=None):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._num_hits += 1
+            val = self._entries[key]
+        else:
+            self._num_misses += 1
+            val = default
+
+        return val
+
+
+
+    def put(self, key, val):
+        self._entries[key] = val
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+        return None
+
+
+
+    def clear(self):
+        self._entries.clear()
+        self._num_hits = 0
+        self._num_misses = 0
+
+        return None
+
+
+
+    def get_stats(self):
+        stats = {"capacity": self._capacity,
+                 "num_entries": len(self._entries),
+                 "num_hits": self._num_hits,
+                 "num_misses": self._num_misses}
+
+        return stats
+
+
+
+# Every validator cache is registered here, so that statistics can be gathered,
+# and the caches cleared, process-wide.
+_validator_caches = weakref.WeakSet()
+
+_name_of_attr_storing_relevant_attr_names = \
+    "_relevant_attr_names_of_memoizable_func_"
+_name_of_attr_storing_deep_copy = \
+    "_deep_copy_of_memoizable_func_"
+
+
+
+def _call_validation_and_conversion_func(validation_and_conversion_func,
+                                         core_attrs_candidate,
+                                         validator_cache):
+    relevant_attr_names = \
+        getattr(validation_and_conversion_func,
+                _name_of_attr_storing_relevant_attr_names,
+                None)
+
+    if (validator_cache is None) or (relevant_attr_names is None):
+        validator_cache_key = None
+    else:
+        try:
+            # The cache key is built from the wrapped function rather than the
+            # wrapper, so that wrappers created by repeated calls to
+            # :func:`mark_as_memoizable` share cache entries. The types of the
+            # relevant inputs are part of the cache key, so that e.g. ``1`` and
+            # ``1.0`` do not share a cache entry.
+            validator_cache_key = \
+                ((validation_and_conversion_func.__wrapped__,
+                  relevant_attr_names)
+                 + tuple((type(core_attrs_candidate[name]),
+                          core_attrs_candidate[name])
+                         for name in relevant_attr_names))
+            hash(validator_cache_key)
+        except TypeError:
+            validator_cache_key = None
+
+    if validator_cache_key is None:
+        kwargs = {"params": core_attrs_candidate}
+        core_attr = validation_and_conversion_func(**kwargs)
+    else:
+        # Unless the memoizable function was marked with ``deep_copy=False``,
+        # the cache holds a deep copy of each result, and a deep copy of the
+        # cached result is returned upon each cache hit, so that mutating a
+        # core attribute cannot corrupt the cache.
+        deep_copy = getattr(validation_and_conversion_func,
+                            _name_of_attr_storing_deep_copy)
+        copy_func = copy.deepcopy if deep_copy else (lambda obj: obj)
+        
+        cached_result = validator_cache.get(validator_cache_key, _cache_miss)
+        if cached_result is _cache_miss:
+            kwargs = {"params": core_attrs_candidate}
+            core_attr = validation_and_conversion_func(**kwargs)
+            validator_cache.put(validator_cache_key, copy_func(core_attr))
+        else:
+            core_attr = copy_func(cached_result)
+
+    return core_attr
+
+
+
 _default_skip_validation_and_conversion = False
 _default_skip_cls_tests = _default_skip_validation_and_conversion
 _default_deep_copy = True
+_default_capacity = 128
+_cache_miss = object()
+_default_params_iterable = tuple()
+_default_on_error = "raise"
+_default_error_budget = None
+_default_chunk_size = 1
+_default_prefetch_size = 0
+_prefetch_poll_interval = 0.01
 
 
 
@@ -239,7 +598,9 @@ class Checkable():
                       "params_to_be_mapped_to_core_attrs": \
                       params_to_be_mapped_to_core_attrs,
                       "skip_validation_and_conversion": \
-                      skip_validation_and_conversion}
+                      skip_validation_and_conversion,
+                      "validator_cache": \
+                      type(self).__dict__.get("_validator_cache_")}
             self._core_attrs = func_alias(params)
         else:
             self._core_attrs = params_to_be_mapped_to_core_attrs.copy()
@@ -263,6 +624,45 @@ class Checkable():
 
 
 
+    @classmethod
+    def get_column_validation_and_conversion_funcs(cls):
+        r"""Return the column-level validation and conversion functions.
+
+        Column-level validation and conversion functions are used when
+        constructing many instances at once, e.g. via the class
+        :class:`fancytypes.ColumnarCollection`. Let
+        ``validation_and_conversion_funcs`` denote
+        ``cls.get_validation_and_conversion_funcs()``, and let ``columns`` be a
+        `dict` with the same keys as ``validation_and_conversion_funcs``, where
+        each value of ``columns`` is a sequence, e.g. a `list` object or a NumPy
+        array, storing the values of a given core attribute for a set of
+        instances.
+
+        Every key of ``column_validation_and_conversion_funcs`` must also be a
+        key of ``validation_and_conversion_funcs``. For each such key ``key``,
+        ``column_validation_and_conversion_funcs[key](columns)`` is expected to
+        validate and convert the whole column ``columns[key]`` in a single call,
+        returning a sequence of the same length, equivalently to calling
+        ``validation_and_conversion_funcs[key]`` once per instance. Core
+        attributes without a column-level validation and conversion function
+        are validated and converted one instance at a time.
+
+        By default, an empty `dict` is returned. Subclasses may override this
+        class method to register vectorized validations and conversions, e.g.
+        range checks of numeric core attributes via NumPy.
+
+        Returns
+        -------
+        column_validation_and_conversion_funcs : `dict`
+            The column-level validation and conversion functions.
+
+        """
+        column_validation_and_conversion_funcs = dict()
+
+        return column_validation_and_conversion_funcs
+
+
+
     @property
     def validation_and_conversion_funcs(self):
         r"""`dict`: The validation and conversion functions.
@@ -335,11 +735,423 @@ class Checkable():
 
 
 
+    @classmethod
+    def enable_validator_memoization(cls, capacity=_default_capacity):
+        r"""Enable the memoization of the memoizable validation and conversion
+        functions of the current class.
+
+        A validation and conversion function is memoizable if it has been
+        marked as such via the function :func:`fancytypes.mark_as_memoizable`,
+        which requires that the function be pure, and that the names of the
+        core attributes that it depends on be given. Once validator memoization
+        is enabled for the current class, each call to a memoizable validation
+        and conversion function, upon construction or update, first looks up
+        its result in a least-recently-used cache keyed on the function and the
+        types and values of the core attributes that it depends on. Upon a
+        cache hit, the function is not called, and a deep copy of the cached
+        result is used instead, unless the function was marked as memoizable
+        with ``deep_copy=False``, in which case the cached result itself is
+        used. Calls for which any of the relevant values is
+        unhashable bypass the cache, as do calls that raise exceptions.
+
+        Validator memoization is enabled per class, i.e. the cache of the
+        current class is not shared with its subclasses. Calling this method
+        when validator memoization is already enabled replaces the existing
+        cache with an empty one.
+
+        Parameters
+        ----------
+        capacity : `int`, optional
+            The maximum number of entries in the cache. Once the number of
+            entries exceeds ``capacity``, the least recently used entry is
+            evicted.
+
+        """
+        params = {"capacity": capacity}
+        capacity = _check_and_convert_capacity(params)
+        
+        cls._validator_cache_ = _LRUCache(capacity=capacity)
+        _validator_caches.add(cls._validator_cache_)
+
+        return None
+
+
+
+    @classmethod
+    def disable_validator_memoization(cls):
+        r"""Disable the memoization of the memoizable validation and conversion
+        functions of the current class, and discard the cache.
+
+        See the documentation for the method
+        :meth:`~fancytypes.Checkable.enable_validator_memoization` for details
+        on validator memoization.
+
+        """
+        cls._validator_cache_ = None
+
+        return None
+
+
+
+    @classmethod
+    def get_validator_memoization_stats(cls):
+        r"""Return the statistics of the validator cache of the current class.
+
+        See the documentation for the method
+        :meth:`~fancytypes.Checkable.enable_validator_memoization` for details
+        on validator memoization.
+
+        Returns
+        -------
+        validator_memoization_stats : `dict` | `None`
+            If validator memoization is disabled for the current class, then
+            ``validator_memoization_stats`` is set to ``None``. Otherwise,
+            ``validator_memoization_stats`` is a `dict` object with the same
+            keys as those described in the documentation for the method
+            :meth:`~fancytypes.PreSerializable.get_load_cache_stats`.
+
+        """
+        validator_cache = cls.__dict__.get("_validator_cache_")
+
+        validator_memoization_stats = (None
+                                       if (validator_cache is None)
+                                       else validator_cache.get_stats())
+
+        return validator_memoization_stats
+
+
+
+    @classmethod
+    def iter_validate(cls,
+                      params_iterable=_default_params_iterable,
+                      on_error=_default_on_error,
+                      chunk_size=_default_chunk_size,
+                      prefetch_size=_default_prefetch_size,
+                      error_budget=_default_error_budget):
+        r"""Lazily validate and convert many sets of construction parameters.
+
+        The class-level setup, i.e. the retrieval and testing of the validation
+        and conversion functions, is performed once, rather than once per
+        instance. The sets of construction parameters are then consumed one
+        chunk at a time, and an instance is constructed from each set, as the
+        returned iterator is consumed.
+
+        Parameters
+        ----------
+        params_iterable : `iterable` (`dict`), optional
+            The sets of construction parameters, each of which is a `dict`
+            mapping constructor parameter names to values. Parameters that are
+            omitted from a set take on their default values.
+        on_error : `str`, optional
+            The policy for sets of construction parameters that fail to
+            validate, which can be one of ``"raise"``, ``"skip"``, ``"yield"``,
+            or ``"collect"``. If ``on_error`` is set to ``"raise"``, then the
+            exception is raised. If ``on_error`` is set to ``"skip"``, then the
+            set is skipped. If ``on_error`` is set to ``"yield"``, then the pair
+            ``(idx, err)`` is yielded in place of an instance, where ``idx`` is
+            the index of the set in ``params_iterable``, and ``err`` is the
+            exception.
+
+            If ``on_error`` is set to ``"collect"``, then the pair ``(idx,
+            error_report)`` is yielded in place of an instance, where
+            ``error_report`` is a `tuple` with one `dict` per failure. Rather
+            than stopping at the first failure, every validation and conversion
+            function is called, and each failure is recorded in
+            ``error_report`` as a `dict` with the keys ``"attr_name"``,
+            ``"message"``, and ``"exception_type"``, storing respectively the
+            name of the core attribute that failed to validate, the error
+            message, and the type of the exception raised. A core attribute
+            that fails to validate keeps its unconverted value when the
+            remaining validation and conversion functions are called.
+        chunk_size : `int`, optional
+            The number of sets of construction parameters to validate and
+            convert together. If ``chunk_size`` is greater than ``1``, then each
+            chunk is validated and converted column by column, as in the
+            construction of a :class:`fancytypes.ColumnarCollection` object,
+            using the column-level validation and conversion functions returned
+            by the class method
+            :meth:`get_column_validation_and_conversion_funcs`.
+            Only the sets of construction parameters that fail said
+            validation and conversion are validated and converted again, one
+            at a time, in order to generate their errors. Since a failing
+            column-level validation and conversion function cannot be
+            attributed to any particular set, all the sets of the chunk that
+            remain at that stage are validated and converted again in that
+            case.
+        prefetch_size : `int`, optional
+            If ``prefetch_size`` is greater than ``0``, then the sets of
+            construction parameters are fetched from ``params_iterable`` in a
+            background thread, into a queue holding at most ``prefetch_size``
+            sets, so that fetching, e.g. reading from a file or a database,
+            overlaps with validation. Otherwise, no prefetching is performed.
+        error_budget : `int` | `None`, optional
+            If ``error_budget`` is set to a nonnegative integer, and
+            ``on_error`` is not set to ``"raise"``, then an exception is raised
+            as soon as the number of sets of construction parameters that failed
+            to validate exceeds ``error_budget``, which makes for a cheap
+            fail-fast mode. Otherwise, no limit is imposed.
+
+        Returns
+        -------
+        results : `iterator`
+            An iterator over the constructed instances, in the order of
+            ``params_iterable``, interleaved with pairs ``(idx, err)`` or
+            ``(idx, error_report)`` if ``on_error`` is set to ``"yield"`` or
+            ``"collect"`` respectively.
+
+        """
+        params = {key: val
+                  for key, val in locals().items()
+                  if (key not in ("cls", "__class__"))}
+        on_error = _check_and_convert_on_error(params)
+        chunk_size = _check_and_convert_chunk_size(params)
+        prefetch_size = _check_and_convert_prefetch_size(params)
+        error_budget = _check_and_convert_error_budget(params)
+
+        params = {"validation_and_conversion_funcs": \
+                  cls.get_validation_and_conversion_funcs()}
+        _check_and_convert_validation_and_conversion_funcs(params)
+
+        if prefetch_size > 0:
+            params_iterable = _generate_prefetched_items(params_iterable,
+                                                         prefetch_size)
+
+        kwargs = {"params_iterable": params_iterable,
+                  "on_error": on_error,
+                  "chunk_size": chunk_size,
+                  "error_budget": error_budget}
+        results = cls._generate_validation_results(**kwargs)
+
+        return results
+
+
+
+    @classmethod
+    def _generate_validation_results(cls,
+                                     params_iterable,
+                                     on_error,
+                                     chunk_size,
+                                     error_budget):
+        ctor_param_names = cls.__init__.__code__.co_varnames
+        skip_kwargs = {key: True
+                       for key in ("skip_cls_tests",)
+                       if key in ctor_param_names}
+        collect_errors = (on_error == "collect")
+        num_failures = 0
+
+        enumerated_params = enumerate(params_iterable)
+        chunk = tuple(itertools.islice(enumerated_params, chunk_size))
+
+        while len(chunk) > 0:
+            kwargs = {"chunk": chunk,
+                      "skip_kwargs": skip_kwargs,
+                      "collect_errors": collect_errors}
+            chunk_results = (cls._validate_chunk(**kwargs)
+                             if (chunk_size > 1)
+                             else cls._validate_chunk_row_by_row(**kwargs))
+
+            for idx, fancytype_instance, err in chunk_results:
+                if err is None:
+                    yield fancytype_instance
+                elif on_error == "raise":
+                    raise err
+                else:
+                    num_failures += 1
+                    if ((error_budget is not None)
+                        and (num_failures > error_budget)):
+                        unformatted_err_msg = _checkable_err_msg_2
+                        err_msg = unformatted_err_msg.format(error_budget, idx)
+                        raise ValueError(err_msg)
+                    if on_error != "skip":
+                        yield (idx, err)
+
+            chunk = tuple(itertools.islice(enumerated_params, chunk_size))
+
+
+
+    @classmethod
+    def _validate_chunk(cls, chunk, skip_kwargs, collect_errors):
+        columns = cls._convert_chunk_to_columns(chunk)
+
+        if columns is None:
+            chunk_results = tuple()
+            rows_to_validate_individually = chunk
+        else:
+            # Only the rows that fail the column-wise validation and
+            # conversion are validated and converted again, row by row, in
+            # order to generate their errors.
+            kwargs = {"columns": \
+                      columns,
+                      "num_rows": \
+                      len(chunk),
+                      "validation_and_conversion_funcs": \
+                      cls.get_validation_and_conversion_funcs(),
+                      "column_validation_and_conversion_funcs": \
+                      cls.get_column_validation_and_conversion_funcs(),
+                      "skip_failed_rows": \
+                      True}
+            columns, failed_row_positions = \
+                _validate_and_convert_columns(**kwargs)
+            
+            kwargs = {"fancytype_cls": cls,
+                      "columns": columns,
+                      "skip_validation_and_conversion": True}
+            columnar_collection = ColumnarCollection(**kwargs)
+            
+            rows_to_validate_individually = \
+                tuple(chunk[row_position]
+                      for row_position in failed_row_positions)
+            rows_to_keep = \
+                tuple(row
+                      for row_position, row in enumerate(chunk)
+                      if row_position not in failed_row_positions)
+            chunk_results = \
+                tuple((idx, fancytype_instance, None)
+                      for (idx, _), fancytype_instance
+                      in zip(rows_to_keep, columnar_collection))
+
+        kwargs = {"chunk": rows_to_validate_individually,
+                  "skip_kwargs": skip_kwargs,
+                  "collect_errors": collect_errors}
+        chunk_results += cls._validate_chunk_row_by_row(**kwargs)
+        chunk_results = tuple(sorted(chunk_results,
+                                     key=lambda chunk_result: chunk_result[0]))
+
+        return chunk_results
+
+
+
+    @classmethod
+    def _return_defaults_of_core_attrs(cls):
+        ctor_params = inspect.signature(cls.__init__).parameters
+        core_attr_names = cls.get_validation_and_conversion_funcs().keys()
+        defaults_of_core_attrs = \
+            {key: ctor_params[key].default
+             for key in core_attr_names
+             if ((key in ctor_params)
+                 and (ctor_params[key].default is not inspect.Parameter.empty))}
+
+        return defaults_of_core_attrs
+
+
+
+    @classmethod
+    def _convert_chunk_to_columns(cls, chunk):
+        # ``columns`` is set to ``None`` if any set of parameters in ``chunk``
+        # is not a `dict`, has unknown keys, or lacks a required parameter, in
+        # which case the chunk is to be validated row by row.
+        core_attr_names = cls.get_validation_and_conversion_funcs().keys()
+        defaults_of_core_attrs = cls._return_defaults_of_core_attrs()
+        columns = {key: [] for key in core_attr_names}
+
+        for _, params in chunk:
+            params_are_convertible = \
+                ((columns is not None)
+                 and isinstance(params, dict)
+                 and (params.keys() <= core_attr_names)
+                 and (core_attr_names
+                      <= (params.keys() | defaults_of_core_attrs.keys())))
+
+            if params_are_convertible:
+                for key in core_attr_names:
+                    column_elem = \
+                        (params[key]
+                         if (key in params)
+                         else copy.deepcopy(defaults_of_core_attrs[key]))
+                    columns[key].append(column_elem)
+            else:
+                columns = None
+
+        return columns
+
+
+
+    @classmethod
+    def _validate_chunk_row_by_row(cls, chunk, skip_kwargs, collect_errors):
+        chunk_results = tuple()
+        
+        for idx, params in chunk:
+            if collect_errors:
+                fancytype_instance, err = \
+                    cls._validate_params_collecting_errors(params)
+            else:
+                try:
+                    kwargs = {**params, **skip_kwargs}
+                    fancytype_instance = cls(**kwargs)
+                    err = None
+                except Exception as caught_err:
+                    fancytype_instance = None
+                    err = caught_err
+            chunk_results += ((idx, fancytype_instance, err),)
+
+        return chunk_results
+
+
+
+    @classmethod
+    def _validate_params_collecting_errors(cls, params):
+        validation_and_conversion_funcs = \
+            cls.get_validation_and_conversion_funcs()
+        defaults_of_core_attrs = cls._return_defaults_of_core_attrs()
+        error_report = tuple()
+
+        if isinstance(params, dict):
+            core_attrs_candidate = params.copy()
+        else:
+            core_attrs_candidate = dict()
+            error_report += ({"attr_name": None,
+                              "message": _checkable_err_msg_3,
+                              "exception_type": TypeError},)
+
+        for key in validation_and_conversion_funcs:
+            if key in core_attrs_candidate:
+                pass
+            elif key in defaults_of_core_attrs:
+                default_val = defaults_of_core_attrs[key]
+                core_attrs_candidate[key] = copy.deepcopy(default_val)
+            else:
+                error_report += ({"attr_name": key,
+                                  "message": _checkable_err_msg_4.format(key),
+                                  "exception_type": TypeError},)
+
+        func_alias = _check_and_convert_core_attrs_candidate_collecting_errors
+        params = {"core_attrs_candidate": \
+                  core_attrs_candidate,
+                  "validation_and_conversion_funcs": \
+                  validation_and_conversion_funcs,
+                  "validator_cache": \
+                  cls.__dict__.get("_validator_cache_")}
+        core_attrs_candidate, additional_error_report = func_alias(params)
+        error_report += additional_error_report
+
+        if len(error_report) == 0:
+            kwargs = core_attrs_candidate
+            ctor_param_names = cls.__init__.__code__.co_varnames
+            for key in ("skip_validation_and_conversion", "skip_cls_tests"):
+                if key in ctor_param_names:
+                    kwargs[key] = True
+            try:
+                fancytype_instance = cls(**kwargs)
+                error_report = None
+            except Exception as err:
+                fancytype_instance = None
+                error_report = ({"attr_name": None,
+                                 "message": str(err),
+                                 "exception_type": type(err)},)
+        else:
+            fancytype_instance = None
+
+        return fancytype_instance, error_report
+
+
+
 def _update_old_core_attr_set_and_return_new_core_attr_set(
         skip_validation_and_conversion,
         new_core_attr_subset_candidate,
         old_core_attr_set,
-        validation_and_conversion_funcs):
+        validation_and_conversion_funcs,
+        validator_cache=None,
+        names_of_core_attrs_to_skip=tuple()):
     params = \
         {"skip_validation_and_conversion": skip_validation_and_conversion}
     skip_validation_and_conversion = \
@@ -356,53 +1168,187 @@ def _update_old_core_attr_set_and_return_new_core_attr_set(
             new_core_attr_candidate = old_core_attr_set[core_attr_name]
             new_core_attr_set[core_attr_name] = new_core_attr_candidate
 
-    names_of_core_attrs_to_update = tuple()
-    for core_attr_name in new_core_attr_subset_candidate:
-        if core_attr_name not in old_core_attr_set:
-            del new_core_attr_set[core_attr_name]
-        else:
-            names_of_core_attrs_to_update += (core_attr_name,)
+    # The keys of ``new_core_attr_subset_candidate`` are expected to be names
+    # of core attributes, namely those that changed, along with those that
+    # depend on them, as filtered by the method ``Updatable.update``.
+    names_of_core_attrs_to_update = tuple(new_core_attr_subset_candidate)
 
     for ctor_param_name in names_of_core_attrs_to_update:
         validation_and_conversion_func = \
             validation_and_conversion_funcs[ctor_param_name]
 
-        if (skip_validation_and_conversion == False):
-            new_core_attr = validation_and_conversion_func(new_core_attr_set)
+        if ((skip_validation_and_conversion == False)
+            and (ctor_param_name not in names_of_core_attrs_to_skip)):
+            kwargs = {"validation_and_conversion_func": \
+                      validation_and_conversion_func,
+                      "core_attrs_candidate": \
+                      new_core_attr_set,
+                      "validator_cache": \
+                      validator_cache}
+            new_core_attr = _call_validation_and_conversion_func(**kwargs)
             new_core_attr_set[ctor_param_name] = new_core_attr
 
     return new_core_attr_set
 
 
 
-_default_new_core_attr_subset_candidate = dict()
+def _check_and_convert_compare_by_equality(params):
+    obj_name = "compare_by_equality"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    compare_by_equality = czekitout.convert.to_bool(**kwargs)
 
+    return compare_by_equality
 
 
-class Updatable(Checkable):
-    r"""A type that can perform user-defined validations and conversions of a 
-    set of parameters upon construction, and that has an updatable subset of 
-    attributes.
 
-    One cannot construct an instance of the class :class:`fancytypes.Updatable`
-    without raising an exception. In order to make use of this class, one must
-    create a subclass that inherits from :class:`fancytypes.Updatable` and then
-    override the class method
-    :class:`~fancytypes.Checkable.get_validation_and_conversion_funcs` in a way
-    that is consistent with the method's description.
+def _return_names_of_changed_core_attrs(new_core_attr_subset_candidate,
+                                        old_core_attr_set,
+                                        compare_by_equality):
+    kwargs = {"obj": new_core_attr_subset_candidate,
+              "obj_name": "new_core_attr_subset_candidate"}
+    czekitout.check.if_dict_like(**kwargs)
 
-    Parameters
-    ----------
-    skip_validation_and_conversion : `bool`, optional
-        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
-        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-        and :attr:`~fancytypes.Checkable.core_attrs` respectively, both of which
-        being `dict` objects.
+    names_of_changed_core_attrs = tuple()
+    for core_attr_name in new_core_attr_subset_candidate:
+        if core_attr_name in old_core_attr_set:
+            new_core_attr_candidate = \
+                new_core_attr_subset_candidate[core_attr_name]
+            old_core_attr = \
+                old_core_attr_set[core_attr_name]
+
+            # Equality is only tested for immutable types that are cheap to
+            # compare, and only between objects of the exact same type, so
+            # that e.g. ``True`` is not considered equal to ``1``.
+            core_attr_is_unchanged = \
+                ((new_core_attr_candidate is old_core_attr)
+                 or (compare_by_equality
+                     and (type(new_core_attr_candidate) is type(old_core_attr))
+                     and isinstance(old_core_attr,
+                                    _types_comparable_by_equality)
+                     and (new_core_attr_candidate == old_core_attr)))
+
+            if not core_attr_is_unchanged:
+                names_of_changed_core_attrs += (core_attr_name,)
+
+    return names_of_changed_core_attrs
+
+
+
+def _return_names_of_dependent_core_attrs(names_of_changed_core_attrs,
+                                          names_of_candidate_core_attrs,
+                                          validation_and_conversion_funcs):
+    # A validation and conversion function is assumed to depend on every core
+    # attribute, unless it has been marked as memoizable, in which case it
+    # depends only on its relevant core attributes.
+    names_of_dependent_core_attrs = tuple()
+    for core_attr_name in names_of_candidate_core_attrs:
+        validation_and_conversion_func = \
+            validation_and_conversion_funcs[core_attr_name]
+        relevant_attr_names = \
+            getattr(validation_and_conversion_func,
+                    _name_of_attr_storing_relevant_attr_names,
+                    validation_and_conversion_funcs.keys())
+        if ((core_attr_name not in names_of_changed_core_attrs)
+            and (set(relevant_attr_names) & set(names_of_changed_core_attrs))):
+            names_of_dependent_core_attrs += (core_attr_name,)
 
-        Let ``params_to_be_mapped_to_core_attrs`` denote the `dict`
-        representation of the constructor parameters excluding the parameters
-        ``skip_validation_and_conversion`` and ``skip_cls_tests``, where each
-        `dict` key ``key`` is a different constructor parameter name, excluding
+    return names_of_dependent_core_attrs
+
+
+
+def _check_and_convert_callback(params):
+    obj_name = "callback"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    czekitout.check.if_callable(**kwargs)
+    callback = params[obj_name]
+
+    return callback
+
+
+
+def _check_and_convert_coalesce(params):
+    obj_name = "coalesce"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    coalesce = czekitout.convert.to_bool(**kwargs)
+
+    return coalesce
+
+
+
+def _check_and_convert_subscription_id(params):
+    obj_name = "subscription_id"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    subscription_id = czekitout.convert.to_nonnegative_int(**kwargs)
+
+    return subscription_id
+
+
+
+def _check_and_convert_max_depth(params):
+    obj_name = "max_depth"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    max_depth = czekitout.convert.to_positive_int(**kwargs)
+
+    return max_depth
+
+
+
+def _split_new_core_attr_subset_candidate(new_core_attr_subset_candidate):
+    kwargs = {"obj": new_core_attr_subset_candidate,
+              "obj_name": "new_core_attr_subset_candidate"}
+    czekitout.check.if_dict_like(**kwargs)
+
+    # Keys of the form ``"<name>.<path>"`` specify updates of nested
+    # fancytypes, which are grouped by the name of the core attribute storing
+    # the nested fancytype, i.e. ``"<name>"``.
+    flat_core_attr_subset_candidate = dict()
+    nested_core_attr_subset_candidates = dict()
+    for key in new_core_attr_subset_candidate:
+        val = new_core_attr_subset_candidate[key]
+        if isinstance(key, str) and ("." in key):
+            core_attr_name, path = key.split(".", 1)
+            if core_attr_name not in nested_core_attr_subset_candidates:
+                nested_core_attr_subset_candidates[core_attr_name] = dict()
+            nested_core_attr_subset_candidates[core_attr_name][path] = val
+        else:
+            flat_core_attr_subset_candidate[key] = val
+
+    return flat_core_attr_subset_candidate, nested_core_attr_subset_candidates
+
+
+
+_default_new_core_attr_subset_candidate = dict()
+_default_compare_by_equality = False
+_default_coalesce = False
+_default_max_depth = 100
+_types_comparable_by_equality = (bool, int, float, complex, str, bytes)
+
+
+
+class Updatable(Checkable):
+    r"""A type that can perform user-defined validations and conversions of a 
+    set of parameters upon construction, and that has an updatable subset of 
+    attributes.
+
+    One cannot construct an instance of the class :class:`fancytypes.Updatable`
+    without raising an exception. In order to make use of this class, one must
+    create a subclass that inherits from :class:`fancytypes.Updatable` and then
+    override the class method
+    :class:`~fancytypes.Checkable.get_validation_and_conversion_funcs` in a way
+    that is consistent with the method's description.
+
+    Parameters
+    ----------
+    skip_validation_and_conversion : `bool`, optional
+        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
+        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+        and :attr:`~fancytypes.Checkable.core_attrs` respectively, both of which
+        being `dict` objects.
+
+        Let ``params_to_be_mapped_to_core_attrs`` denote the `dict`
+        representation of the constructor parameters excluding the parameters
+        ``skip_validation_and_conversion`` and ``skip_cls_tests``, where each
+        `dict` key ``key`` is a different constructor parameter name, excluding
         the names ``"skip_validation_and_conversion"`` and ``"skip_cls_tests"``,
         and ``params_to_be_mapped_to_core_attrs[key]`` would yield the value of
         the constructor parameter with the name given by ``key``.
@@ -444,17 +1390,194 @@ class Updatable(Checkable):
                          skip_cls_tests,
                          **kwargs)
 
+        self._pending_core_attr_subset = None
+        self._names_of_unvalidated_pending_core_attrs = set()
+        self._update_lock = threading.RLock()
+        self._thread_safety_is_enabled = False
+        self._core_attrs_version = 0
+        self._subscriptions = dict()
+        self._next_subscription_id = 0
+        self._history = None
+
+        return None
+
+
+
+    def __getstate__(self):
+        # Locks cannot be copied or pickled, hence copies of the current
+        # instance, e.g. those made via :func:`copy.deepcopy` or :mod:`pickle`,
+        # are given their own locks upon restoring their state. Moreover, the
+        # subscribers of the current instance are not notified of updates of
+        # its copies, and the copies do not inherit its undo/redo history.
+        state = self.__dict__.copy()
+        del state["_update_lock"]
+        state["_subscriptions"] = dict()
+        state["_history"] = None
+
+        return state
+
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._update_lock = threading.RLock()
+
+        return None
+
+
+
+    def enable_thread_safety(self):
+        r"""Make updates of the current instance thread-safe.
+
+        Once thread safety is enabled, calls to the methods
+        :meth:`~fancytypes.Updatable.update`,
+        :meth:`~fancytypes.Updatable.subscribe`, and
+        :meth:`~fancytypes.Updatable.unsubscribe`, as well as
+        :meth:`~fancytypes.Updatable.batch_update` blocks, are serialized via a
+        reentrant lock owned by the current instance, so that concurrent
+        writers cannot interleave. In particular, a
+        :meth:`~fancytypes.Updatable.batch_update` block holds the lock until
+        its changes have been applied, so that other threads cannot have their
+        updates swept into it.
+
+        Readers need not acquire the lock: since every update publishes a new
+        `dict` of core attributes by swapping a single reference, rather than
+        modifying the published `dict` in place, the method
+        :meth:`~fancytypes.Updatable.get_core_attrs_snapshot` always returns a
+        consistent snapshot without copying. This relies only on attribute
+        assignment being atomic, and thus also holds on free-threaded builds of
+        CPython.
+
+        Enabling thread safety more than once has no further effect.
+
+        """
+        # The lock is created upon construction, rather than here, so that
+        # concurrent calls to the current method cannot end up with distinct
+        # locks.
+        self._thread_safety_is_enabled = True
+
         return None
 
 
 
+    def _return_update_lock_context(self):
+        update_lock_context = (self._update_lock
+                               if self._thread_safety_is_enabled
+                               else contextlib.nullcontext())
+
+        return update_lock_context
+
+
+
+    def get_core_attrs_snapshot(self):
+        r"""Return a read-only snapshot of the core attributes, without copying.
+
+        Unlike the method :meth:`~fancytypes.Checkable.get_core_attrs`, no copy
+        of the core attributes is made: the returned snapshot is a read-only
+        view of the `dict` of core attributes that is current at the time of
+        the call. Subsequent updates publish a new `dict` of core attributes
+        rather than modifying the existing one, hence the snapshot never
+        changes. Note however that the values of the snapshot are the core
+        attributes themselves, rather than copies, and should be considered
+        **read-only**.
+
+        To cheaply detect whether a snapshot is stale, read the attribute
+        :attr:`~fancytypes.Updatable.core_attrs_version` before taking the
+        snapshot, and compare it to its value later on: if the two values are
+        equal, then the snapshot is still current.
+
+        Returns
+        -------
+        core_attrs_snapshot : `types.MappingProxyType`
+            The read-only snapshot of the core attributes.
+
+        """
+        core_attrs_snapshot = types.MappingProxyType(self._core_attrs)
+
+        return core_attrs_snapshot
+
+
+
+    @property
+    def core_attrs_version(self):
+        r"""`int`: The version of the core attributes.
+
+        The version is incremented each time an update of the current instance
+        changes its core attributes, after the new core attributes have been
+        published. As such, a snapshot returned by the method
+        :meth:`~fancytypes.Updatable.get_core_attrs_snapshot` after reading
+        ``core_attrs_version`` is at least as recent as that version.
+
+        """
+        result = self._core_attrs_version
+
+        return result
+
+
+
     def update(self,
                new_core_attr_subset_candidate=\
                _default_new_core_attr_subset_candidate,
                skip_validation_and_conversion=\
-               _default_skip_validation_and_conversion):
+               _default_skip_validation_and_conversion,
+               compare_by_equality=\
+               _default_compare_by_equality):
         r"""Update a subset of the core attributes.
 
+        Values in ``new_core_attr_subset_candidate`` that are unchanged are
+        treated as though they were omitted from
+        ``new_core_attr_subset_candidate``, i.e. their validation and
+        conversion functions are not called, and any work that depends on which
+        core attributes were updated, e.g. journaling, is skipped for them,
+        unless their validation and conversion functions depend on a core
+        attribute that does change, in which case they are validated and
+        converted as usual, so that checks spanning several core attributes are
+        still performed. A value is unchanged if it is the same object as the
+        corresponding core attribute, or, if ``compare_by_equality`` is set to
+        ``True``, if it is a `bool`, `int`, `float`, `complex`, `str`, or
+        `bytes` object that is equal to, and of the same type as, the
+        corresponding core attribute. As such, the cost of an update is roughly
+        proportional to the number of core attributes that actually change, or
+        that depend on those that do.
+
+        Note that a validation and conversion function is assumed to depend on
+        every core attribute, unless it has been marked as memoizable via the
+        function :func:`fancytypes.mark_as_memoizable`, in which case it
+        depends only on the relevant core attributes given upon marking it.
+        Consequently, if none of the validation and conversion functions have
+        been marked as memoizable, then every unchanged value in
+        ``new_core_attr_subset_candidate`` is validated and converted as soon
+        as any other value changes, e.g. passing every core attribute with only
+        one of them changed validates and converts every core attribute, as
+        upon construction. In order for unchanged values to be skipped in such
+        cases, the validation and conversion functions must be marked as
+        memoizable, with the core attributes that they actually depend on.
+
+        If the update is performed within a
+        :meth:`~fancytypes.Updatable.batch_update` block, then the changes are
+        deferred until the end of the block.
+
+        Core attributes of nested fancytypes can be updated by using dotted
+        paths as keys of ``new_core_attr_subset_candidate``, e.g.
+        ``{"optics.lens.focal_length": 3.0}``, where ``optics`` is a core
+        attribute of the current instance that is itself an instance of
+        :class:`fancytypes.Updatable`, and so on. Nested fancytypes are never
+        modified in place: rather, at each level of nesting, the nested
+        fancytype is copied, the copy is updated, and the copy is then stored
+        as the new value of the corresponding core attribute, as if it had been
+        passed directly in ``new_core_attr_subset_candidate``. As such, only
+        the updated core attribute of the innermost nested fancytype is
+        validated and converted, followed by, at each level of nesting, the
+        validation and conversion functions of the sibling core attributes that
+        depend on the core attribute storing the updated nested fancytype. The
+        validation and conversion function of the latter core attribute is
+        skipped, since the updated copy has already been validated by its own
+        update, unless said function depends on other core attributes that
+        are changed by the same update. Dependencies are determined as
+        described above. If any validation fails, then the current instance is
+        left unchanged. Dotted paths cannot be used within a
+        :meth:`~fancytypes.Updatable.batch_update` block.
+
         Parameters
         ----------
         new_core_attr_subset_candidate : `dict`, optional
@@ -480,500 +1603,5063 @@ class Updatable(Checkable):
             copies and/or conversions of the `dict` values of
             ``new_core_attr_subset_candidate``, as it is guaranteed that no
             copies or conversions are made in this case.
+        compare_by_equality : `bool`, optional
+            If ``compare_by_equality`` is set to ``True``, then unchanged values
+            are detected by equality for cheap immutable types, in addition to
+            identity. Otherwise, unchanged values are detected by identity only.
 
         """
+        params = {"compare_by_equality": compare_by_equality,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion}
+        compare_by_equality = _check_and_convert_compare_by_equality(params)
+        skip_validation_and_conversion = \
+            _check_and_convert_skip_validation_and_conversion(params)
+
+        with self._return_update_lock_context():
+            kwargs = {"new_core_attr_subset_candidate": \
+                      new_core_attr_subset_candidate}
+            split_candidates = _split_new_core_attr_subset_candidate(**kwargs)
+            new_core_attr_subset_candidate = split_candidates[0]
+            nested_core_attr_subset_candidates = split_candidates[1]
+
+            if ((self._pending_core_attr_subset is not None)
+                and nested_core_attr_subset_candidates):
+                raise ValueError(_updatable_err_msg_5)
+
+            names_of_core_attrs_storing_updated_copies = tuple()
+            if nested_core_attr_subset_candidates:
+                method_alias = \
+                    self._add_updated_copies_of_nested_instances_to_candidate
+                kwargs = {"nested_core_attr_subset_candidates": \
+                          nested_core_attr_subset_candidates,
+                          "new_core_attr_subset_candidate": \
+                          new_core_attr_subset_candidate,
+                          "skip_validation_and_conversion": \
+                          skip_validation_and_conversion,
+                          "compare_by_equality": \
+                          compare_by_equality}
+                new_core_attr_subset_candidate, \
+                    names_of_core_attrs_storing_updated_copies = \
+                    method_alias(**kwargs)
+
+            kwargs = {"new_core_attr_subset_candidate": \
+                      new_core_attr_subset_candidate,
+                      "old_core_attr_set": \
+                      self._core_attrs,
+                      "compare_by_equality": \
+                      compare_by_equality}
+            names_of_changed_core_attrs = \
+                _return_names_of_changed_core_attrs(**kwargs)
+
+            if self._pending_core_attr_subset is not None:
+                kwargs = {"new_core_attr_subset_candidate": \
+                          new_core_attr_subset_candidate,
+                          "names_of_changed_core_attrs": \
+                          names_of_changed_core_attrs,
+                          "skip_validation_and_conversion": \
+                          skip_validation_and_conversion}
+                self._defer_update(**kwargs)
+            else:
+                names_of_candidate_core_attrs = \
+                    tuple(core_attr_name
+                          for core_attr_name in new_core_attr_subset_candidate
+                          if core_attr_name in self._core_attrs)
+                kwargs = {"names_of_changed_core_attrs": \
+                          names_of_changed_core_attrs,
+                          "names_of_candidate_core_attrs": \
+                          names_of_candidate_core_attrs,
+                          "validation_and_conversion_funcs": \
+                          self._validation_and_conversion_funcs}
+                names_of_dependent_core_attrs = \
+                    (_return_names_of_dependent_core_attrs(**kwargs)
+                     if (skip_validation_and_conversion == False)
+                     else tuple())
+                names_of_updated_core_attrs = \
+                    tuple(core_attr_name
+                          for core_attr_name in names_of_candidate_core_attrs
+                          if ((core_attr_name in names_of_changed_core_attrs)
+                              or (core_attr_name
+                                  in names_of_dependent_core_attrs)))
+
+                kwargs = {"names_of_core_attrs_storing_updated_copies": \
+                          names_of_core_attrs_storing_updated_copies,
+                          "names_of_changed_core_attrs": \
+                          names_of_changed_core_attrs}
+                names_of_core_attrs_to_skip = \
+                    self._return_names_of_updated_copies_to_skip(**kwargs)
+
+                kwargs = {"new_core_attr_subset_candidate": \
+                          new_core_attr_subset_candidate,
+                          "skip_validation_and_conversion": \
+                          skip_validation_and_conversion,
+                          "names_of_updated_core_attrs": \
+                          names_of_updated_core_attrs,
+                          "names_of_core_attrs_to_skip": \
+                          names_of_core_attrs_to_skip,
+                          "compare_by_equality": \
+                          compare_by_equality}
+                self._update(**kwargs)
+
+        return None
+
+
+
+    def _add_updated_copies_of_nested_instances_to_candidate(
+            self,
+            nested_core_attr_subset_candidates,
+            new_core_attr_subset_candidate,
+            skip_validation_and_conversion,
+            compare_by_equality):
+        # Nested fancytypes are updated copy-on-write: each nested fancytype is
+        # copied, the copy is updated, and the copy is then stored as a new
+        # value of the corresponding core attribute of the current instance.
+        # As such, the nested fancytypes themselves are never modified, hence
+        # they can be safely shared, e.g. with snapshots of the core attributes
+        # of the current instance, or with its undo/redo history.
+        updated_copies_of_nested_instances = dict()
+        names_of_core_attrs_storing_updated_copies = tuple()
+
+        validation_and_conversion_funcs = self._validation_and_conversion_funcs
+        names_of_core_attrs_to_update = \
+            tuple(core_attr_name
+                  for core_attr_name in validation_and_conversion_funcs
+                  if core_attr_name in nested_core_attr_subset_candidates)
+
+        for core_attr_name in names_of_core_attrs_to_update:
+            nested_instance = \
+                (new_core_attr_subset_candidate[core_attr_name]
+                 if (core_attr_name in new_core_attr_subset_candidate)
+                 else self._core_attrs[core_attr_name])
+            if not isinstance(nested_instance, Updatable):
+                err_msg = _updatable_err_msg_6.format(core_attr_name)
+                raise TypeError(err_msg)
+
+            copy_of_nested_instance = copy.copy(nested_instance)
+            old_version = copy_of_nested_instance._core_attrs_version
+            kwargs = {"new_core_attr_subset_candidate": \
+                      nested_core_attr_subset_candidates[core_attr_name],
+                      "skip_validation_and_conversion": \
+                      skip_validation_and_conversion,
+                      "compare_by_equality": \
+                      compare_by_equality}
+            copy_of_nested_instance.update(**kwargs)
+
+            if copy_of_nested_instance._core_attrs_version != old_version:
+                updated_copies_of_nested_instances[core_attr_name] = \
+                    copy_of_nested_instance
+                if core_attr_name not in new_core_attr_subset_candidate:
+                    names_of_core_attrs_storing_updated_copies += \
+                        (core_attr_name,)
+
+        # The sibling core attributes that depend on the updated nested
+        # fancytypes are validated and converted again, even if they are not
+        # in ``new_core_attr_subset_candidate``.
+        kwargs = {"names_of_changed_core_attrs": \
+                  tuple(updated_copies_of_nested_instances),
+                  "names_of_candidate_core_attrs": \
+                  tuple(self._core_attrs),
+                  "validation_and_conversion_funcs": \
+                  validation_and_conversion_funcs}
+        names_of_dependent_core_attrs = \
+            _return_names_of_dependent_core_attrs(**kwargs)
+
+        new_core_attr_subset_candidate = \
+            {**{core_attr_name: self._core_attrs[core_attr_name]
+                for core_attr_name in names_of_dependent_core_attrs},
+             **new_core_attr_subset_candidate,
+             **updated_copies_of_nested_instances}
+
+        return (new_core_attr_subset_candidate,
+                names_of_core_attrs_storing_updated_copies)
+
+
+
+    def _return_names_of_updated_copies_to_skip(
+            self,
+            names_of_core_attrs_storing_updated_copies,
+            names_of_changed_core_attrs):
+        # An updated copy of a nested fancytype that was stored in the current
+        # instance has already been validated and converted by its own update,
+        # hence the validation and conversion function of the core attribute
+        # storing it is skipped, unless said function depends on other core
+        # attributes that are changed by the same update. The sibling core
+        # attributes that depend on the updated copy are still validated and
+        # converted.
+        names_of_core_attrs_to_skip = tuple()
+        for core_attr_name in names_of_core_attrs_storing_updated_copies:
+            kwargs = {"names_of_changed_core_attrs": \
+                      tuple(name
+                            for name in names_of_changed_core_attrs
+                            if (name != core_attr_name)),
+                      "names_of_candidate_core_attrs": \
+                      (core_attr_name,),
+                      "validation_and_conversion_funcs": \
+                      self._validation_and_conversion_funcs}
+            if not _return_names_of_dependent_core_attrs(**kwargs):
+                names_of_core_attrs_to_skip += (core_attr_name,)
+
+        return names_of_core_attrs_to_skip
+
+
+
+    def _update(self,
+                new_core_attr_subset_candidate,
+                skip_validation_and_conversion,
+                names_of_updated_core_attrs,
+                names_of_core_attrs_to_skip,
+                compare_by_equality):
+        old_core_attr_set = self._core_attrs
+        
         kwargs = \
             {"skip_validation_and_conversion": \
              skip_validation_and_conversion,
              "new_core_attr_subset_candidate": \
-             new_core_attr_subset_candidate,
+             {core_attr_name: new_core_attr_subset_candidate[core_attr_name]
+              for core_attr_name in names_of_updated_core_attrs},
              "old_core_attr_set": \
              self._core_attrs,
              "validation_and_conversion_funcs": \
-             self._validation_and_conversion_funcs}
+             self._validation_and_conversion_funcs,
+             "validator_cache": \
+             type(self).__dict__.get("_validator_cache_"),
+             "names_of_core_attrs_to_skip": \
+             names_of_core_attrs_to_skip}
         self._core_attrs = \
             _update_old_core_attr_set_and_return_new_core_attr_set(**kwargs)
 
+        # Core attributes that were only validated and converted again, as
+        # dependents of those that changed, are not reported as updated unless
+        # their values changed as a result.
+        kwargs = {"new_core_attr_subset_candidate": \
+                  {core_attr_name: self._core_attrs[core_attr_name]
+                   for core_attr_name in names_of_updated_core_attrs},
+                  "old_core_attr_set": \
+                  old_core_attr_set,
+                  "compare_by_equality": \
+                  compare_by_equality}
+        names_of_updated_core_attrs = \
+            _return_names_of_changed_core_attrs(**kwargs)
+        if names_of_updated_core_attrs:
+            self._core_attrs_version += 1
+
+        self._handle_core_attr_subset_update(names_of_updated_core_attrs)
+
         return None
 
 
 
-def _preliminary_check_of_pre_serialization_funcs(params):
-    obj_name = "pre_serialization_funcs"
-    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
-    pre_serialization_funcs = czekitout.convert.to_dict(**kwargs)
+    def _defer_update(self,
+                      new_core_attr_subset_candidate,
+                      names_of_changed_core_attrs,
+                      skip_validation_and_conversion):
+        pending_core_attr_subset = self._pending_core_attr_subset
+        names_of_unvalidated_pending_core_attrs = \
+            self._names_of_unvalidated_pending_core_attrs
+
+        for core_attr_name in new_core_attr_subset_candidate:
+            if core_attr_name in self._core_attrs:
+                # Unchanged core attributes are reverted to their stored
+                # values, but are kept pending, so that they are still
+                # validated and converted if they depend on core attributes
+                # that are changed by the end of the ``with`` block.
+                pending_core_attr_subset[core_attr_name] = \
+                    (new_core_attr_subset_candidate[core_attr_name]
+                     if (core_attr_name in names_of_changed_core_attrs)
+                     else self._core_attrs[core_attr_name])
+                if skip_validation_and_conversion:
+                    names_of_unvalidated_pending_core_attrs.add(core_attr_name)
+                else:
+                    names_of_unvalidated_pending_core_attrs.discard(
+                        core_attr_name)
 
-    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+        return None
 
-    current_func_name = "_preliminary_check_of_pre_serialization_funcs"
 
-    key_set_1 = sorted(list(validation_and_conversion_funcs.keys()))
-    key_set_2 = sorted(list(pre_serialization_funcs.keys()))
-    if key_set_1 != key_set_2:
-        err_msg = globals()[current_func_name+"_err_msg_1"]
-        raise KeyError(err_msg)
-    
-    for key in pre_serialization_funcs:
-        pre_serialization_func = pre_serialization_funcs[key]
-        if not callable(pre_serialization_func):
-            err_msg = globals()[current_func_name+"_err_msg_2"]
-            raise TypeError(err_msg)
 
-    return None
+    @contextlib.contextmanager
+    def batch_update(self):
+        r"""Return a context manager that batches updates into a single
+        transaction.
 
+        Within the ``with`` block, calls to the method
+        :meth:`~fancytypes.Updatable.update` are deferred: the changes are
+        collected, and the core attributes are left unchanged, without calling
+        any validation and conversion functions. Upon exiting the ``with``
+        block, the union of the changes is validated and converted in a single
+        pass, in the same order as that of the keys of the attribute
+        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, i.e. in
+        the same dependency order as upon construction. Each core attribute is
+        validated against the final values of the other core attributes, rather
+        than against intermediate values, and only once, regardless of how many
+        times it was updated within the ``with`` block. Changes passed with
+        ``skip_validation_and_conversion`` set to ``True`` are applied without
+        validation or conversion.
 
+        If the validation and conversion succeeds, then all the changes are
+        applied atomically. Otherwise, or if an exception is raised within the
+        ``with`` block, then no changes are applied, the instance is left
+        unchanged, and the exception is propagated.
 
-def _preliminary_check_of_de_pre_serialization_funcs(params):
-    obj_name = "de_pre_serialization_funcs"
-    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
-    de_pre_serialization_funcs = czekitout.convert.to_dict(**kwargs)
+        Nested ``with`` blocks are merged into the outermost one.
 
-    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+        Returns
+        -------
+        context_manager : `contextlib.AbstractContextManager`
+            The context manager.
 
-    current_func_name = "_preliminary_check_of_de_pre_serialization_funcs"
+        """
+        with self._return_update_lock_context():
+            if self._pending_core_attr_subset is None:
+                self._pending_core_attr_subset = dict()
+                self._names_of_unvalidated_pending_core_attrs = set()
+                try:
+                    yield None
+                    self._apply_pending_core_attr_subset()
+                finally:
+                    self._pending_core_attr_subset = None
+                    self._names_of_unvalidated_pending_core_attrs = set()
+            else:
+                yield None
+
+
+
+    def _apply_pending_core_attr_subset(self):
+        pending_core_attr_subset = self._pending_core_attr_subset
+        names_of_changed_core_attrs = \
+            tuple(core_attr_name
+                  for core_attr_name in pending_core_attr_subset
+                  if (pending_core_attr_subset[core_attr_name]
+                      is not self._core_attrs[core_attr_name]))
+        names_of_candidate_core_attrs = \
+            tuple(core_attr_name
+                  for core_attr_name in pending_core_attr_subset
+                  if (core_attr_name
+                      not in self._names_of_unvalidated_pending_core_attrs))
+
+        kwargs = {"names_of_changed_core_attrs": \
+                  names_of_changed_core_attrs,
+                  "names_of_candidate_core_attrs": \
+                  names_of_candidate_core_attrs,
+                  "validation_and_conversion_funcs": \
+                  self._validation_and_conversion_funcs}
+        names_of_dependent_core_attrs = \
+            _return_names_of_dependent_core_attrs(**kwargs)
+        names_of_updated_core_attrs = \
+            tuple(core_attr_name
+                  for core_attr_name in pending_core_attr_subset
+                  if ((core_attr_name in names_of_changed_core_attrs)
+                      or (core_attr_name in names_of_dependent_core_attrs)))
+        names_of_core_attrs_to_check_and_convert = \
+            tuple(core_attr_name
+                  for core_attr_name in names_of_updated_core_attrs
+                  if (core_attr_name
+                      not in self._names_of_unvalidated_pending_core_attrs))
+
+        params = {"core_attrs_candidate": \
+                  {**self._core_attrs, **pending_core_attr_subset},
+                  "validation_and_conversion_funcs": \
+                  self._validation_and_conversion_funcs,
+                  "names_of_core_attrs_to_check_and_convert": \
+                  names_of_core_attrs_to_check_and_convert,
+                  "validator_cache": \
+                  type(self).__dict__.get("_validator_cache_")}
+        func_alias = _check_and_convert_subset_of_core_attrs_candidate
+        new_core_attr_set = func_alias(params)
+
+        # As in the method ``_update``, core attributes that were only
+        # validated and converted again are not reported as updated unless
+        # their values changed as a result.
+        kwargs = {"new_core_attr_subset_candidate": \
+                  {core_attr_name: new_core_attr_set[core_attr_name]
+                   for core_attr_name in names_of_updated_core_attrs},
+                  "old_core_attr_set": \
+                  self._core_attrs,
+                  "compare_by_equality": \
+                  False}
+        names_of_updated_core_attrs = \
+            _return_names_of_changed_core_attrs(**kwargs)
+
+        # Updates made while handling the batched update, e.g. by subclasses,
+        # are applied immediately rather than deferred.
+        self._pending_core_attr_subset = None
+        self._core_attrs = new_core_attr_set
+        if names_of_updated_core_attrs:
+            self._core_attrs_version += 1
+
+        self._handle_core_attr_subset_update(names_of_updated_core_attrs)
 
-    key_set_1 = sorted(list(validation_and_conversion_funcs.keys()))
-    key_set_2 = sorted(list(de_pre_serialization_funcs.keys()))
-    if key_set_1 != key_set_2:
-        err_msg = globals()[current_func_name+"_err_msg_1"]
-        raise KeyError(err_msg)
-    
-    for key in de_pre_serialization_funcs:
-        de_pre_serialization_func = de_pre_serialization_funcs[key]
-        if not callable(de_pre_serialization_func):
-            err_msg = globals()[current_func_name+"_err_msg_2"]
-            raise TypeError(err_msg)
+        return None
 
-    return None
 
 
+    def _handle_core_attr_subset_update(self, names_of_updated_core_attrs):
+        # Subclasses can override this method in order to react to updates,
+        # after the updated core attributes have been stored, in which case
+        # they should call this method in order to notify the subscribers.
+        if self._history is not None:
+            self._record_history_step(names_of_updated_core_attrs)
+        
+        if names_of_updated_core_attrs:
+            self._notify_subscribers(frozenset(names_of_updated_core_attrs))
 
-def _check_and_convert_filename(params):
-    obj_name = "filename"
-    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
-    filename = czekitout.convert.to_str_from_str_like(**kwargs)
+        return None
 
-    return filename
 
 
+    def _record_history_step(self, names_of_updated_core_attrs):
+        history = self._history
 
-def _check_and_convert_overwrite(params):
-    obj_name = "overwrite"
-    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
-    overwrite = czekitout.convert.to_bool(**kwargs)
+        # Since updates publish a new `dict` of core attributes rather than
+        # modifying the existing one, the previous `dict` still stores the
+        # previous values of the updated core attributes. Only these values
+        # are stored in each step, and they are shared with, rather than
+        # copied from, the previous `dict`.
+        if names_of_updated_core_attrs and not history["is_being_replayed"]:
+            old_core_attr_set = history["last_core_attr_set"]
+            new_core_attr_set = self._core_attrs
+            step = ({core_attr_name: old_core_attr_set[core_attr_name]
+                     for core_attr_name in names_of_updated_core_attrs},
+                    {core_attr_name: new_core_attr_set[core_attr_name]
+                     for core_attr_name in names_of_updated_core_attrs})
+            history["undo_steps"].append(step)
+            history["redo_steps"].clear()
 
-    return overwrite
+        history["last_core_attr_set"] = self._core_attrs
 
+        return None
 
 
-_default_serializable_rep = _default_new_core_attr_subset_candidate
-_default_filename = "serialized_rep_of_fancytype.json"
-_default_overwrite = False
-_default_serialized_rep = str(_default_serializable_rep)
 
+    def enable_history(self, max_depth=_default_max_depth):
+        r"""Enable the undo/redo history of the current instance.
 
+        Once the history is enabled, each update that changes the core
+        attributes of the current instance, e.g. via the method
+        :meth:`~fancytypes.Updatable.update`, or at the end of a
+        :meth:`~fancytypes.Updatable.batch_update` block, records a step in the
+        history, which can then be undone via the method
+        :meth:`~fancytypes.Updatable.undo`, and redone via the method
+        :meth:`~fancytypes.Updatable.redo`. Recording a new step discards the
+        steps that can be redone.
 
-class PreSerializable(Checkable):
-    r"""A type that is pre-serializable, that can be constructed from a 
-    serializable representation, and that can perform user-defined validations 
-    and conversions of a set of parameters upon construction.
+        Each step stores only the previous and new values of the core
+        attributes that changed, and these values are shared with the
+        instance, rather than copied. As such, the memory used by the history
+        is proportional to the size of the changes rather than to the size of
+        the instance. Undoing and redoing steps restores the stored values
+        without validating or converting them again.
 
-    We define pre-serialization as the process of converting an object into a
-    form that can be subsequently serialized into a JSON format. We refer to
-    objects resulting from pre-serialization as serializable objects.
+        Calling this method when the history is already enabled replaces the
+        existing history with an empty one.
 
-    We define de-pre-serialization as the process of converting a serializable
-    object into an instance of the current class, i.e. de-pre-serialization is
-    the reverse process of pre-serialization.
+        Parameters
+        ----------
+        max_depth : `int`, optional
+            The maximum number of steps that can be undone. Once the number of
+            such steps exceeds ``max_depth``, the oldest step is discarded.
 
-    One cannot construct an instance of the class
-    :class:`fancytypes.PreSerializable` without raising an exception. In order
-    to make use of this class, one must create a subclass that inherits from
-    :class:`fancytypes.PreSerializable` and then override the class methods
-    :class:`~fancytypes.Checkable.get_validation_and_conversion_funcs`,
-    :class:`~fancytypes.PreSerializable.pre_serialization_funcs`, and
-    :class:`~fancytypes.PreSerializable.de_pre_serialization_funcs` in ways that
-    are consistent with the respective descriptions of the methods.
+        """
+        params = {"max_depth": max_depth}
+        max_depth = _check_and_convert_max_depth(params)
+
+        with self._return_update_lock_context():
+            self._history = {"undo_steps": \
+                             collections.deque(maxlen=max_depth),
+                             "redo_steps": \
+                             collections.deque(maxlen=max_depth),
+                             "last_core_attr_set": \
+                             self._core_attrs,
+                             "is_being_replayed": \
+                             False}
 
-    Parameters
-    ----------
-    skip_validation_and_conversion : `bool`, optional
-        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
-        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-        and :attr:`~fancytypes.Checkable.core_attrs` respectively, both of which
-        being `dict` objects.
+        return None
 
-        Let ``params_to_be_mapped_to_core_attrs`` denote the `dict`
-        representation of the constructor parameters excluding the parameters
-        ``skip_validation_and_conversion`` and ``skip_cls_tests``, where each
-        `dict` key ``key`` is a different constructor parameter name, excluding
-        the names ``"skip_validation_and_conversion"`` and ``"skip_cls_tests"``,
-        and ``params_to_be_mapped_to_core_attrs[key]`` would yield the value of
-        the constructor parameter with the name given by ``key``.
 
-        If ``skip_validation_and_conversion`` is set to ``False``, then for each
-        key ``key`` in ``params_to_be_mapped_to_core_attrs``,
-        ``core_attrs[key]`` is set to ``validation_and_conversion_funcs[key]
-        (params_to_be_mapped_to_core_attrs)``.
 
-        Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
-        then ``core_attrs`` is set to
-        ``params_to_be_mapped_to_core_attrs.copy()``. This option is desired
-        primarily when the user wants to avoid potentially expensive deep copies
-        and/or conversions of the `dict` values of
-        ``params_to_be_mapped_to_core_attrs``, as it is guaranteed that no
-        copies or conversions are made in this case.  
-    skip_cls_test : `bool`, optional
-        If ``skip_cls_test`` is set to ``False``, then upon construction, tests
-        will be performed to check whether the class was properly
-        defined. If any of the tests fail, an exception will be raised.
+    def disable_history(self):
+        r"""Disable the undo/redo history of the current instance, and discard
+        the history.
 
-        Otherwise, if ``skip_cls_test`` is set to ``True``, these tests will be
-        skipped. 
+        See the documentation for the method
+        :meth:`~fancytypes.Updatable.enable_history` for details on the
+        undo/redo history.
 
-        One should only skip the tests if they are sure that the class is
-        properly defined. Skipping the tests will yield some improvement in
-        performance.
-    **kwargs 
-        The remaining constructor parameters.
+        """
+        with self._return_update_lock_context():
+            self._history = None
 
-    """
-    def __init__(self,
-                 skip_validation_and_conversion=\
-                 _default_skip_validation_and_conversion,
-                 skip_cls_tests=\
-                 _default_skip_cls_tests,
-                 **kwargs):
-        super().__init__(skip_validation_and_conversion,
-                         skip_cls_tests,
-                         **kwargs)
+        return None
 
-        params = {"skip_cls_tests": skip_cls_tests}
-        skip_cls_tests = _check_and_convert_skip_cls_tests(params)
 
-        params = {"validation_and_conversion_funcs": \
-                  self._validation_and_conversion_funcs,
-                  "pre_serialization_funcs": \
-                  self.get_pre_serialization_funcs(),
-                  "de_pre_serialization_funcs": \
-                  self.get_de_pre_serialization_funcs()}
+
+    @property
+    def num_undoable_steps(self):
+        r"""`int`: The number of steps of the undo/redo history that can be
+        undone.
+
+        If the undo/redo history is disabled, then ``num_undoable_steps`` is
+        equal to ``0``.
+
+        """
+        result = (0
+                  if (self._history is None)
+                  else len(self._history["undo_steps"]))
+
+        return result
+
+
+
+    @property
+    def num_redoable_steps(self):
+        r"""`int`: The number of steps of the undo/redo history that can be
+        redone.
+
+        If the undo/redo history is disabled, then ``num_redoable_steps`` is
+        equal to ``0``.
+
+        """
+        result = (0
+                  if (self._history is None)
+                  else len(self._history["redo_steps"]))
+
+        return result
+
+
+
+    def undo(self):
+        r"""Undo the most recent step of the undo/redo history.
+
+        See the documentation for the method
+        :meth:`~fancytypes.Updatable.enable_history` for details on the
+        undo/redo history. Subscribers and journals are notified of the
+        changes as for any other update.
+
+        """
+        self._replay_history_step(action="undo")
+
+        return None
+
+
+
+    def redo(self):
+        r"""Redo the most recently undone step of the undo/redo history.
+
+        See the documentation for the method
+        :meth:`~fancytypes.Updatable.enable_history` for details on the
+        undo/redo history. Subscribers and journals are notified of the
+        changes as for any other update.
+
+        """
+        self._replay_history_step(action="redo")
+
+        return None
+
+
+
+    def _replay_history_step(self, action):
+        # Each step stores the previous and new values of the updated core
+        # attributes, in that order: undoing a step restores the former,
+        # whereas redoing a step restores the latter.
+        name_of_source_steps, name_of_target_steps, idx = \
+            (("undo_steps", "redo_steps", 0)
+             if (action == "undo")
+             else ("redo_steps", "undo_steps", 1))
+        
+        with self._return_update_lock_context():
+            history = self._history
+
+            if history is None:
+                raise ValueError(_updatable_err_msg_2)
+            if self._pending_core_attr_subset is not None:
+                raise ValueError(_updatable_err_msg_3)
+            if len(history[name_of_source_steps]) == 0:
+                err_msg = _updatable_err_msg_4.format(action)
+                raise ValueError(err_msg)
+
+            step = history[name_of_source_steps].pop()
+            core_attr_subset_to_restore = step[idx]
+
+            history["is_being_replayed"] = True
+            try:
+                kwargs = {"new_core_attr_subset_candidate": \
+                          core_attr_subset_to_restore,
+                          "skip_validation_and_conversion": \
+                          True,
+                          "names_of_updated_core_attrs": \
+                          tuple(core_attr_subset_to_restore),
+                          "names_of_core_attrs_to_skip": \
+                          tuple(),
+                          "compare_by_equality": \
+                          False}
+                self._update(**kwargs)
+            finally:
+                history["is_being_replayed"] = False
+                history[name_of_target_steps].append(step)
+
+        return None
+
+
+
+    def _notify_subscribers(self, names_of_changed_core_attrs):
+        for subscription in tuple(self._subscriptions.values()):
+            if subscription["coalesce"]:
+                subscription["names_of_changed_core_attrs"] |= \
+                    names_of_changed_core_attrs
+            else:
+                subscription["callback"](names_of_changed_core_attrs)
+
+        return None
+
+
+
+    def subscribe(self, callback, coalesce=_default_coalesce):
+        r"""Subscribe to notifications of changes of the core attributes.
+
+        After each update that changes the core attributes of the current
+        instance, e.g. via the method :meth:`~fancytypes.Updatable.update`, or
+        at the end of a :meth:`~fancytypes.Updatable.batch_update` block, each
+        subscriber is notified by calling its callback with a `frozenset` of
+        the names of the core attributes that changed. Core attributes that
+        are validated and converted again, because they depend on those that
+        changed, are only included if their values changed as a result, as
+        determined in the same way as in the method
+        :meth:`~fancytypes.Updatable.update`. Updates that change no core
+        attributes do not trigger notifications. Callbacks are called after
+        the new core attributes have been stored, in the order in which they
+        subscribed, and in the thread that performed the update. An exception
+        raised by a callback is propagated to the caller of the update, which
+        has been applied nonetheless.
+
+        Parameters
+        ----------
+        callback : `callable`
+            The callback, which is called with a single positional argument.
+        coalesce : `bool`, optional
+            If ``coalesce`` is set to ``True``, then notifications are
+            coalesced: rather than being called after each update, the callback
+            is called at most once per call to the method
+            :meth:`~fancytypes.Updatable.flush_notifications`, with the union of
+            the names of the core attributes that changed since the previous
+            call. Otherwise, the callback is called after each update.
+
+        Returns
+        -------
+        subscription_id : `int`
+            The ID of the subscription, which can be passed to the method
+            :meth:`~fancytypes.Updatable.unsubscribe`.
+
+        """
+        params = {"callback": callback, "coalesce": coalesce}
+        callback = _check_and_convert_callback(params)
+        coalesce = _check_and_convert_coalesce(params)
+
+        with self._return_update_lock_context():
+            subscription_id = self._next_subscription_id
+            self._next_subscription_id += 1
+        
+            self._subscriptions[subscription_id] = \
+                {"callback": callback,
+                 "coalesce": coalesce,
+                 "names_of_changed_core_attrs": frozenset()}
+
+        return subscription_id
+
+
+
+    def unsubscribe(self, subscription_id):
+        r"""Cancel a subscription to notifications of changes of the core
+        attributes.
+
+        Pending coalesced notifications of the subscription are discarded.
+
+        Parameters
+        ----------
+        subscription_id : `int`
+            The ID of the subscription, as returned by the method
+            :meth:`~fancytypes.Updatable.subscribe`.
+
+        """
+        params = {"subscription_id": subscription_id}
+        subscription_id = _check_and_convert_subscription_id(params)
+
+        with self._return_update_lock_context():
+            if subscription_id not in self._subscriptions:
+                err_msg = _updatable_err_msg_1.format(subscription_id)
+                raise KeyError(err_msg)
+            
+            del self._subscriptions[subscription_id]
+
+        return None
+
+
+
+    def flush_notifications(self):
+        r"""Deliver the pending coalesced notifications.
+
+        For each subscription with coalesced notifications, if any core
+        attributes changed since the previous call to the current method, then
+        the callback of the subscription is called once, with a `frozenset` of
+        the names of all the core attributes that changed in the meantime.
+
+        See the documentation for the method
+        :meth:`~fancytypes.Updatable.subscribe` for details on subscriptions.
+
+        """
+        for subscription in tuple(self._subscriptions.values()):
+            names_of_changed_core_attrs = \
+                subscription["names_of_changed_core_attrs"]
+            if names_of_changed_core_attrs:
+                subscription["names_of_changed_core_attrs"] = frozenset()
+                subscription["callback"](names_of_changed_core_attrs)
+
+        return None
+
+
+
+def _preliminary_check_of_pre_serialization_funcs(params):
+    obj_name = "pre_serialization_funcs"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    pre_serialization_funcs = czekitout.convert.to_dict(**kwargs)
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = "_preliminary_check_of_pre_serialization_funcs"
+
+    key_set_1 = sorted(list(validation_and_conversion_funcs.keys()))
+    key_set_2 = sorted(list(pre_serialization_funcs.keys()))
+    if key_set_1 != key_set_2:
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise KeyError(err_msg)
+    
+    for key in pre_serialization_funcs:
+        pre_serialization_func = pre_serialization_funcs[key]
+        if not callable(pre_serialization_func):
+            err_msg = globals()[current_func_name+"_err_msg_2"]
+            raise TypeError(err_msg)
+
+    return None
+
+
+
+def _preliminary_check_of_de_pre_serialization_funcs(params):
+    obj_name = "de_pre_serialization_funcs"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    de_pre_serialization_funcs = czekitout.convert.to_dict(**kwargs)
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = "_preliminary_check_of_de_pre_serialization_funcs"
+
+    key_set_1 = sorted(list(validation_and_conversion_funcs.keys()))
+    key_set_2 = sorted(list(de_pre_serialization_funcs.keys()))
+    if key_set_1 != key_set_2:
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise KeyError(err_msg)
+    
+    for key in de_pre_serialization_funcs:
+        de_pre_serialization_func = de_pre_serialization_funcs[key]
+        if not callable(de_pre_serialization_func):
+            err_msg = globals()[current_func_name+"_err_msg_2"]
+            raise TypeError(err_msg)
+
+    return None
+
+
+
+def _check_and_convert_filename(params):
+    obj_name = "filename"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    filename = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    return filename
+
+
+
+def _check_and_convert_filename_or_file_obj(params):
+    obj_name = "filename"
+    obj = params[obj_name]
+
+    # ``name_of_required_method`` is ``"write"`` when dumping, and ``"read"``
+    # when loading.
+    name_of_required_method = params["name_of_required_method"]
+
+    if hasattr(obj, name_of_required_method):
+        filename_or_file_obj = obj
+    else:
+        filename_or_file_obj = _check_and_convert_filename(params)
+
+    return filename_or_file_obj
+
+
+
+def _check_and_convert_overwrite(params):
+    obj_name = "overwrite"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    overwrite = czekitout.convert.to_bool(**kwargs)
+
+    return overwrite
+
+
+
+def _check_and_convert_file_format(params):
+    obj_name = "file_format"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    file_format = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    kwargs["obj"] = file_format
+    kwargs["accepted_strings"] = ("json", "archive")
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    return file_format
+
+
+
+def _check_and_convert_mmap(params):
+    obj_name = "mmap"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    mmap = czekitout.convert.to_bool(**kwargs)
+
+    return mmap
+
+
+
+_archive_magic_bytes = b"\x93FANCYTYPES-ARCHIVE\n"
+_journal_magic_bytes = b"\x93FANCYTYPES-JOURNAL\n"
+_archive_alignment = 64
+
+
+
+def _align_archive_offset(offset):
+    aligned_offset = (-(-offset // _archive_alignment)) * _archive_alignment
+
+    return aligned_offset
+
+
+
+def _is_raw_array_attr(core_attr):
+    result = (isinstance(core_attr, np.ndarray)
+              and (not core_attr.dtype.hasobject)
+              and (core_attr.dtype.fields is None))
+
+    return result
+
+
+
+def _write_archive(serializable_rep, array_attrs, file_obj):
+    manifest = {"serializable_rep": serializable_rep, "array_attrs": dict()}
+    contiguous_array_attrs = dict()
+
+    offset = 0
+    for core_attr_name, array_attr in array_attrs.items():
+        contiguous_array_attr = np.ascontiguousarray(array_attr)
+        contiguous_array_attrs[core_attr_name] = contiguous_array_attr
+        manifest["array_attrs"][core_attr_name] = \
+            {"dtype": contiguous_array_attr.dtype.str,
+             "shape": list(contiguous_array_attr.shape),
+             "offset": offset,
+             "nbytes": contiguous_array_attr.nbytes}
+        offset = _align_archive_offset(offset+contiguous_array_attr.nbytes)
+
+    header = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+    header_size = len(header)
+
+    file_obj.write(_archive_magic_bytes)
+    file_obj.write(header_size.to_bytes(8, "little"))
+    file_obj.write(header)
+
+    position = len(_archive_magic_bytes) + 8 + header_size
+    data_section_start = _align_archive_offset(position)
+
+    for core_attr_name, array_attr in contiguous_array_attrs.items():
+        array_attr_spec = manifest["array_attrs"][core_attr_name]
+        array_attr_start = data_section_start + array_attr_spec["offset"]
+        file_obj.write(b"\0" * (array_attr_start-position))
+        file_obj.write(array_attr.reshape(-1).view(np.uint8))
+        position = array_attr_start + array_attr_spec["nbytes"]
+
+    return None
+
+
+
+def _read_up_to_num_bytes(file_obj, num_bytes):
+    # Unlike the ``read`` methods of raw streams, e.g. unbuffered pipes and
+    # sockets, this function only ever returns fewer bytes than requested upon
+    # reaching the end of the stream.
+    data = b""
+    while len(data) < num_bytes:
+        chunk = file_obj.read(num_bytes-len(data))
+        if len(chunk) == 0:
+            break
+        data += chunk
+
+    return data
+
+
+
+def _readinto_fully(file_obj, buffer):
+    num_bytes_read = 0
+    while num_bytes_read < len(buffer):
+        num_new_bytes_read = file_obj.readinto(buffer[num_bytes_read:])
+        if not num_new_bytes_read:
+            break
+        num_bytes_read += num_new_bytes_read
+
+    return num_bytes_read
+
+
+
+def _read_archive(filename, file_obj, mmap):
+    # The archive is read sequentially, i.e. without seeking, so that it can be
+    # read from non-seekable streams, e.g. pipes and sockets.
+    position = len(_archive_magic_bytes) + 8
+    leading_bytes = _read_up_to_num_bytes(file_obj, position)
+    header_size = int.from_bytes(leading_bytes[len(_archive_magic_bytes):],
+                                 "little")
+    header = _read_up_to_num_bytes(file_obj, header_size)
+    manifest = json.loads(header.decode("utf-8"))
+
+    position += header_size
+    data_section_start = _align_archive_offset(position)
+
+    serializable_rep = manifest["serializable_rep"]
+    array_attrs = dict()
+
+    current_func_name = "_read_archive"
+
+    for core_attr_name, array_attr_spec in manifest["array_attrs"].items():
+        dtype = np.dtype(array_attr_spec["dtype"])
+        shape = tuple(array_attr_spec["shape"])
+        nbytes = array_attr_spec["nbytes"]
+        offset = data_section_start + array_attr_spec["offset"]
+
+        if dtype.itemsize*int(np.prod(shape)) != nbytes:
+            err_msg = globals()[current_func_name+"_err_msg_1"]
+            raise ValueError(err_msg.format(core_attr_name))
+
+        if mmap and (nbytes > 0):
+            kwargs = {"filename": filename,
+                      "dtype": dtype,
+                      "mode": "r",
+                      "offset": offset,
+                      "shape": shape}
+            array_attr = np.memmap(**kwargs)
+        else:
+            array_attr = np.empty(shape, dtype=dtype)
+            if not mmap:
+                num_padding_bytes = offset - position
+                padding = _read_up_to_num_bytes(file_obj, num_padding_bytes)
+                buffer = array_attr.reshape(-1).view(np.uint8)
+                num_bytes_read = _readinto_fully(file_obj, buffer)
+                if ((len(padding) != num_padding_bytes)
+                    or (num_bytes_read != nbytes)):
+                    err_msg = globals()[current_func_name+"_err_msg_1"]
+                    raise ValueError(err_msg.format(core_attr_name))
+                position = offset + nbytes
+            array_attr.flags.writeable = (not mmap)
+
+        array_attrs[core_attr_name] = array_attr
+
+    return serializable_rep, array_attrs
+
+
+
+def _check_and_convert_compression(params):
+    obj_name = "compression"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    compression = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    kwargs["obj"] = compression
+    kwargs["accepted_strings"] = ("infer", "none", "gzip", "bz2", "lzma")
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    return compression
+
+
+
+_compression_magic_bytes = {"gzip": b"\x1f\x8b",
+                            "bz2": b"BZh",
+                            "lzma": b"\xfd7zXZ\x00"}
+_compression_suffixes = {".gz": "gzip",
+                         ".bz2": "bz2",
+                         ".xz": "lzma",
+                         ".lzma": "lzma"}
+
+
+
+def _infer_compression_from_suffix(filename):
+    suffix = pathlib.Path(filename).suffix.lower()
+    compression = _compression_suffixes.get(suffix, "none")
+
+    return compression
+
+
+
+def _infer_compression_from_leading_bytes(leading_bytes, filename):
+    # ``filename`` is ``None`` if the stream being read is a file object that
+    # was passed in by the user, in which case there is no suffix to fall back
+    # on.
+    compression = ("none"
+                   if (filename is None)
+                   else _infer_compression_from_suffix(filename))
+    for candidate, magic_bytes in _compression_magic_bytes.items():
+        if leading_bytes.startswith(magic_bytes):
+            compression = candidate
+
+    return compression
+
+
+
+class _BinaryStreamWithPrefix(io.RawIOBase):
+    # A readable binary stream that yields the given prefix, followed by the
+    # remaining bytes of the given underlying stream. This allows the leading
+    # bytes of non-seekable streams, e.g. pipes and sockets, to be inspected
+    # without being lost.
+    def __init__(self, prefix, file_obj):
+        self._prefix = memoryview(prefix)
+        self._file_obj = file_obj
+
+        return None
+
+
+
+    def readable(self):
+        return True
+
+
+
+    def readinto(self, buffer):
+        if len(self._prefix) > 0:
+            num_bytes_read = min(len(buffer), len(self._prefix))
+            buffer[:num_bytes_read] = self._prefix[:num_bytes_read]
+            self._prefix = self._prefix[num_bytes_read:]
+        elif hasattr(self._file_obj, "readinto"):
+            num_bytes_read = self._file_obj.readinto(buffer)
+        else:
+            data = self._file_obj.read(len(buffer))
+            num_bytes_read = len(data)
+            buffer[:num_bytes_read] = data
+
+        return num_bytes_read
+
+
+
+def _peek_leading_bytes(file_obj, num_bytes):
+    leading_bytes = _read_up_to_num_bytes(file_obj, num_bytes)
+    raw_file_obj = _BinaryStreamWithPrefix(leading_bytes, file_obj)
+    file_obj_with_leading_bytes = io.BufferedReader(raw_file_obj)
+
+    return leading_bytes, file_obj_with_leading_bytes
+
+
+
+def _wrap_file_obj_for_decompression(file_obj, compression):
+    if compression == "gzip":
+        wrapped_file_obj = gzip.GzipFile(fileobj=file_obj, mode="rb")
+    elif compression == "bz2":
+        wrapped_file_obj = bz2.BZ2File(file_obj, mode="rb")
+    else:
+        wrapped_file_obj = lzma.LZMAFile(file_obj, mode="rb")
+
+    return wrapped_file_obj
+
+
+
+def _open_binary_stream_for_reading(file_obj, filename, compression):
+    # The archive and journal magic bytes are longer than any of the
+    # compression magic bytes, hence a single peek suffices for uncompressed
+    # streams.
+    num_bytes_to_peek = len(_archive_magic_bytes)
+    leading_bytes, file_obj = _peek_leading_bytes(file_obj, num_bytes_to_peek)
+
+    if compression == "infer":
+        kwargs = {"leading_bytes": leading_bytes, "filename": filename}
+        compression = _infer_compression_from_leading_bytes(**kwargs)
+
+    if compression != "none":
+        file_obj = _wrap_file_obj_for_decompression(file_obj, compression)
+        kwargs = {"file_obj": file_obj, "num_bytes": num_bytes_to_peek}
+        leading_bytes, file_obj = _peek_leading_bytes(**kwargs)
+
+    file_formats = {_archive_magic_bytes: "archive",
+                    _journal_magic_bytes: "journal"}
+    file_format = file_formats.get(leading_bytes, "json")
+
+    return file_obj, compression, file_format
+
+
+
+def _wrap_file_obj_for_compression(file_obj, compression):
+    if compression == "gzip":
+        kwargs = {"filename": "", "mode": "wb", "fileobj": file_obj}
+        wrapped_file_obj = gzip.GzipFile(**kwargs)
+    elif compression == "bz2":
+        wrapped_file_obj = bz2.BZ2File(file_obj, mode="wb")
+    elif compression == "lzma":
+        wrapped_file_obj = lzma.LZMAFile(file_obj, mode="wb")
+    else:
+        wrapped_file_obj = file_obj
+
+    return wrapped_file_obj
+
+
+
+_json_whitespace_pattern = re.compile(r"[ \t\n\r]*")
+_json_decoder = json.JSONDecoder()
+_min_num_chars_per_json_read = 2**20
+
+
+
+class _IncrementalJSONObjReader():
+    # Reads the top-level items of a JSON object from a text stream, one at a
+    # time, so that the full text of the document never has to be held in
+    # memory at once: at any moment, only the text of the top-level value
+    # currently being decoded is buffered.
+    def __init__(self, read_text):
+        self._read_text = read_text
+        self._buffer = ""
+        self._pos = 0
+        self._at_eof = False
+
+        return None
+
+
+
+    def _read_more_text(self):
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+
+        # The read size grows geometrically with the size of the buffer, so
+        # that the total cost of re-decoding a large value that spans many
+        # reads stays proportional to the size of said value.
+        num_chars_to_read = max(_min_num_chars_per_json_read,
+                                3*len(self._buffer))
+        text = self._read_text(num_chars_to_read)
+        
+        self._at_eof = (len(text) == 0)
+        self._buffer += text
+
+        return None
+
+
+
+    def _skip_whitespace(self):
+        while True:
+            match = _json_whitespace_pattern.match(self._buffer, self._pos)
+            self._pos = match.end()
+            if (self._pos < len(self._buffer)) or self._at_eof:
+                break
+            self._read_more_text()
+
+        return None
+
+
+
+    def _consume_char(self, accepted_chars):
+        self._skip_whitespace()
+        
+        char = self._buffer[self._pos:self._pos+1]
+        if (len(char) == 0) or (char not in accepted_chars):
+            raise ValueError(_incremental_json_obj_reader_err_msg_1)
+        self._pos += 1
+
+        return char
+
+
+
+    def _decode_value(self):
+        self._skip_whitespace()
+
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(self._buffer, self._pos)
+
+                # A value that ends exactly where the buffer ends might have
+                # been cut short, e.g. a number whose digits are split across
+                # two reads.
+                if (end < len(self._buffer)) or self._at_eof:
+                    self._pos = end
+                    break
+            except json.JSONDecodeError:
+                if self._at_eof:
+                    raise
+            self._read_more_text()
+
+        return value
+
+
+
+    def iter_items(self):
+        self._consume_char(accepted_chars="{")
+        self._skip_whitespace()
+
+        if self._buffer[self._pos:self._pos+1] == "}":
+            self._pos += 1
+        else:
+            while True:
+                key = self._decode_value()
+                if not isinstance(key, str):
+                    raise ValueError(_incremental_json_obj_reader_err_msg_1)
+                self._consume_char(accepted_chars=":")
+                value = self._decode_value()
+
+                # The text of the decoded value is dropped before the value is
+                # handed over, once it makes up most of the buffer, so that the
+                # text and the value are not both held in memory longer than
+                # necessary.
+                if 2*self._pos > len(self._buffer):
+                    self._buffer = self._buffer[self._pos:]
+                    self._pos = 0
+                
+                yield key, value
+
+                if self._consume_char(accepted_chars=",}") == "}":
+                    break
+
+        self._skip_whitespace()
+        if self._pos < len(self._buffer):
+            raise ValueError(_incremental_json_obj_reader_err_msg_2)
+
+        return None
+
+
+
+def _read_json_obj(read_text):
+    json_obj_reader = _IncrementalJSONObjReader(read_text)
+    json_obj = dict(json_obj_reader.iter_items())
+
+    return json_obj
+
+
+
+def _generate_read_text_func(read_bytes, encoding):
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    def read_text(num_chars):
+        # Multi-byte characters can be split across reads, in which case the
+        # decoder may return no text for a non-empty read.
+        while True:
+            data = read_bytes(num_chars)
+            at_eof = (len(data) == 0)
+            text = decoder.decode(data, final=at_eof)
+            if (len(text) > 0) or at_eof:
+                break
+
+        return text
+
+    return read_text
+
+
+
+def _generate_read_bytes_func(bytes_like):
+    view = memoryview(bytes_like).cast("B")
+    position = 0
+
+    def read_bytes(num_bytes):
+        nonlocal position
+        data = view[position:position+num_bytes]
+        position += len(data)
+
+        return data
+
+    return read_bytes
+
+
+
+def _generate_write_text_func(write_bytes, encoding):
+    def write_text(text):
+        num_bytes_written = write_bytes(text.encode(encoding))
+
+        return num_bytes_written
+
+    return write_text
+
+
+
+def _write_journal_snapshot(serializable_rep, file_obj):
+    file_obj.write(_journal_magic_bytes)
+    file_obj.write(_encode_journal_record(serializable_rep))
+
+    return None
+
+
+
+def _encode_journal_record(serializable_rep):
+    # Each record occupies a single line, since ``json.dumps`` escapes all
+    # newline characters by default.
+    journal_record = (json.dumps(serializable_rep)+"\n").encode("utf-8")
+
+    return journal_record
+
+
+
+def _read_journal(file_obj):
+    _read_up_to_num_bytes(file_obj, len(_journal_magic_bytes))
+
+    serializable_rep = None
+    for journal_record in file_obj:
+        # The last record is incomplete if a crash occurred while it was being
+        # appended, in which case it is discarded.
+        if not journal_record.endswith(b"\n"):
+            break
+        if serializable_rep is None:
+            serializable_rep = json.loads(journal_record)
+        else:
+            serializable_rep.update(json.loads(journal_record))
+
+    if serializable_rep is None:
+        current_func_name = "_read_journal"
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise ValueError(err_msg)
+
+    return serializable_rep
+
+
+
+def _deserialize(serialized_rep):
+    if isinstance(serialized_rep, str):
+        serializable_rep = json.loads(serialized_rep)
+    else:
+        view = memoryview(serialized_rep).cast("B")
+        kwargs = {"read_bytes": _generate_read_bytes_func(view),
+                  "encoding": json.detect_encoding(view[:4].tobytes())}
+        read_text = _generate_read_text_func(**kwargs)
+        serializable_rep = _read_json_obj(read_text)
+
+    return serializable_rep
+
+
+
+_min_num_chars_per_json_write = 2**16
+
+
+
+def _write_json_doc(serializable_rep, write_text):
+    # The text is written in large chunks, rather than in the many small
+    # fragments yielded by the JSON encoder, which would be slow for
+    # unbuffered streams.
+    json_encoder = json.JSONEncoder(ensure_ascii=False, indent=4)
+
+    chunks = []
+    num_chars = 0
+    for chunk in json_encoder.iterencode(serializable_rep):
+        chunks.append(chunk)
+        num_chars += len(chunk)
+        if num_chars >= _min_num_chars_per_json_write:
+            write_text("".join(chunks))
+            chunks = []
+            num_chars = 0
+    write_text("".join(chunks))
+
+    return None
+
+
+
+def _write_to_file_obj(file_obj,
+                       serializable_rep,
+                       array_attrs,
+                       file_format,
+                       compression):
+    if isinstance(file_obj, io.TextIOBase):
+        _write_json_doc(serializable_rep, write_text=file_obj.write)
+    else:
+        kwargs = {"file_obj": file_obj, "compression": compression}
+        wrapped_file_obj = _wrap_file_obj_for_compression(**kwargs)
+
+        if file_format == "json":
+            kwargs = {"write_bytes": wrapped_file_obj.write,
+                      "encoding": "utf-8"}
+            write_text = _generate_write_text_func(**kwargs)
+            _write_json_doc(serializable_rep, write_text)
+        elif file_format == "journal":
+            _write_journal_snapshot(serializable_rep, wrapped_file_obj)
+        elif file_format == "npz":
+            _write_npz(serializable_rep, array_attrs, wrapped_file_obj)
+        else:
+            _write_archive(serializable_rep, array_attrs, wrapped_file_obj)
+
+        # Closing a compressed stream does not close the stream that it wraps.
+        if wrapped_file_obj is not file_obj:
+            wrapped_file_obj.close()
+
+    return None
+
+
+
+def _check_and_convert_fsync_policy(params):
+    obj_name = "fsync_policy"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    fsync_policy = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    kwargs["obj"] = fsync_policy
+    kwargs["accepted_strings"] = ("none", "file", "file_and_dir")
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    return fsync_policy
+
+
+
+def _generate_temp_filename(filename):
+    path = pathlib.Path(filename)
+    temp_filename = str(path.with_name("."+path.name+"."+uuid.uuid4().hex))
+
+    return temp_filename
+
+
+
+def _write_temp_file(temp_filename,
+                     filename,
+                     serializable_rep,
+                     array_attrs,
+                     file_format,
+                     fsync_policy,
+                     compression):
+    flags = (os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+    file_descriptor = os.open(temp_filename, flags, 0o666)
+
+    if compression == "infer":
+        compression = _infer_compression_from_suffix(filename)
+
+    with os.fdopen(file_descriptor, "wb") as raw_file_obj:
+        kwargs = {"file_obj": raw_file_obj,
+                  "serializable_rep": serializable_rep,
+                  "array_attrs": array_attrs,
+                  "file_format": file_format,
+                  "compression": compression}
+        _write_to_file_obj(**kwargs)
+
+        if fsync_policy != "none":
+            raw_file_obj.flush()
+            os.fsync(raw_file_obj.fileno())
+
+    if pathlib.Path(filename).is_file():
+        mode = stat.S_IMODE(os.stat(filename).st_mode)
+        os.chmod(temp_filename, mode)
+
+    return None
+
+
+
+def _fsync_dir_on_posix(dirname):
+    dir_file_descriptor = os.open(dirname, os.O_RDONLY)
+    try:
+        os.fsync(dir_file_descriptor)
+    finally:
+        os.close(dir_file_descriptor)
+
+    return None
+
+
+
+# Directories cannot be opened, and hence cannot be flushed, on Windows.
+_fsync_dir = (_fsync_dir_on_posix
+              if (os.name != "nt")
+              else (lambda dirname: None))
+
+
+
+def _dump_atomically(filenames,
+                     serializable_reps,
+                     array_attr_sets,
+                     file_format,
+                     fsync_policy,
+                     compression):
+    temp_filenames = tuple()
+
+    try:
+        zip_obj = zip(filenames, serializable_reps, array_attr_sets)
+        for filename, serializable_rep, array_attrs in zip_obj:
+            temp_filename = _generate_temp_filename(filename)
+            temp_filenames += (temp_filename,)
+
+            kwargs = {"temp_filename": temp_filename,
+                      "filename": filename,
+                      "serializable_rep": serializable_rep,
+                      "array_attrs": array_attrs,
+                      "file_format": file_format,
+                      "fsync_policy": fsync_policy,
+                      "compression": compression}
+            _write_temp_file(**kwargs)
+
+        for temp_filename, filename in zip(temp_filenames, filenames):
+            os.replace(temp_filename, filename)
+    except:
+        for temp_filename in temp_filenames:
+            pathlib.Path(temp_filename).unlink(missing_ok=True)
+        raise
+
+    if fsync_policy == "file_and_dir":
+        dirnames = {str(pathlib.Path(filename).resolve().parent)
+                    for filename in filenames}
+        for dirname in sorted(dirnames):
+            _fsync_dir(dirname)
+
+    return None
+
+
+
+class _Journal():
+    # Persists the serializable representation of an instance of the class
+    # :class:`fancytypes.PreSerializableAndUpdatable` as a snapshot, followed
+    # by one appended record per update, each of which stores only the updated
+    # core attributes in pre-serialized form.
+    def __init__(self, filename, compaction_threshold, fsync_policy):
+        self._filename = filename
+        self._compaction_threshold = compaction_threshold
+        self._fsync_policy = fsync_policy
+        self._file_obj = None
+        self._num_bytes_of_update_records = 0
+
+        return None
+
+
+
+    def write_snapshot(self, serializable_rep):
+        self.close()
+
+        kwargs = {"filenames": (self._filename,),
+                  "serializable_reps": (serializable_rep,),
+                  "array_attr_sets": (dict(),),
+                  "file_format": "journal",
+                  "fsync_policy": self._fsync_policy,
+                  "compression": "none"}
+        _dump_atomically(**kwargs)
+
+        self._file_obj = open(self._filename, "ab")
+        self._num_bytes_of_update_records = 0
+
+        return None
+
+
+
+    def append_update_record(self, serializable_rep_subset):
+        journal_record = _encode_journal_record(serializable_rep_subset)
+
+        self._file_obj.write(journal_record)
+        self._file_obj.flush()
+        if self._fsync_policy != "none":
+            os.fsync(self._file_obj.fileno())
+
+        self._num_bytes_of_update_records += len(journal_record)
+
+        return None
+
+
+
+    def requires_compaction(self):
+        result = (self._num_bytes_of_update_records
+                  > self._compaction_threshold)
+
+        return result
+
+
+
+    def close(self):
+        if self._file_obj is not None:
+            self._file_obj.close()
+            self._file_obj = None
+
+        return None
+
+
+
+def _check_and_convert_embed_digest(params):
+    obj_name = "embed_digest"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    embed_digest = czekitout.convert.to_bool(**kwargs)
+
+    current_func_name = "_check_and_convert_embed_digest"
+
+    if embed_digest and (params["file_format"] != "json"):
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise ValueError(err_msg)
+
+    return embed_digest
+
+
+
+def _check_and_convert_trusted_digests(params):
+    obj_name = "trusted_digests"
+    obj = params[obj_name]
+
+    current_func_name = "_check_and_convert_trusted_digests"
+
+    if (obj is not None) and (not hasattr(obj, "__contains__")):
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise TypeError(err_msg)
+
+    trusted_digests = obj
+
+    return trusted_digests
+
+
+
+_name_of_embedded_digest_metadata = "__fancytypes_digest__"
+
+
+
+def _return_cls_identity(cls):
+    cls_identity = cls.__module__ + "." + cls.__qualname__
+
+    return cls_identity
+
+
+
+def _compute_item_digest(key, elem_of_serializable_rep):
+    kwargs = {"obj": (key, elem_of_serializable_rep),
+              "sort_keys": True,
+              "separators": (",", ":"),
+              "ensure_ascii": False}
+    canonical_serialized_item = json.dumps(**kwargs)
+    
+    item_digest = \
+        hashlib.sha256(canonical_serialized_item.encode("utf-8")).hexdigest()
+
+    return item_digest
+
+
+
+def _compute_digest(cls, item_digests):
+    # The digest is computed from the digests of the individual items of the
+    # serializable representation, so that it can be computed while streaming
+    # the items from a file, without holding the whole serializable
+    # representation in memory.
+    hash_obj = hashlib.sha256()
+    hash_obj.update(_return_cls_identity(cls).encode("utf-8"))
+    for key in sorted(item_digests):
+        hash_obj.update(b"\n")
+        hash_obj.update(item_digests[key].encode("utf-8"))
+    digest = hash_obj.hexdigest()
+
+    return digest
+
+
+
+def _compute_item_digests(serializable_rep):
+    item_digests = {key: _compute_item_digest(key, elem_of_serializable_rep)
+                    for key, elem_of_serializable_rep
+                    in serializable_rep.items()}
+
+    return item_digests
+
+
+
+def _verify_and_strip_embedded_digest(cls,
+                                      serializable_rep,
+                                      item_digests,
+                                      trusted_digests):
+    key = _name_of_embedded_digest_metadata
+
+    current_func_name = "_verify_and_strip_embedded_digest"
+
+    if isinstance(serializable_rep, dict) and (key in serializable_rep):
+        serializable_rep = serializable_rep.copy()
+        embedded_digest_metadata = serializable_rep.pop(key)
+        if item_digests is None:
+            item_digests = _compute_item_digests(serializable_rep)
+        expected_embedded_digest_metadata = \
+            {"cls": _return_cls_identity(cls),
+             "sha256": _compute_digest(cls, item_digests)}
+        
+        if embedded_digest_metadata != expected_embedded_digest_metadata:
+            err_msg = globals()[current_func_name+"_err_msg_1"]
+            raise ValueError(err_msg)
+
+        digest = embedded_digest_metadata["sha256"]
+        is_trusted = ((trusted_digests is not None)
+                      and (digest in trusted_digests))
+    else:
+        is_trusted = False
+
+    return serializable_rep, is_trusted
+
+
+
+def _check_and_convert_deduplicate(params):
+    obj_name = "deduplicate"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    deduplicate = czekitout.convert.to_bool(**kwargs)
+
+    return deduplicate
+
+
+
+_name_of_shared_reps = "__fancytypes_shared_reps__"
+_name_of_shared_rep_ref = "__fancytypes_ref__"
+_min_size_of_fingerprinted_rep = 2**10
+_shared_reps_state = threading.local()
+
+
+
+def _compute_fingerprint(elem_of_serializable_rep):
+    kwargs = {"obj": elem_of_serializable_rep,
+              "separators": (",", ":"),
+              "ensure_ascii": False}
+    serialized_elem = json.dumps(**kwargs)
+
+    # Only large serializable representations are fingerprinted, since
+    # replacing small ones with references would not save any space.
+    fingerprint = \
+        (hashlib.sha256(serialized_elem.encode("utf-8")).hexdigest()
+         if (len(serialized_elem) >= _min_size_of_fingerprinted_rep)
+         else None)
+
+    return fingerprint
+
+
+
+class _SharedRepsRegistry():
+    # Records the objects that have been pre-serialized during a
+    # reference-aware pre-serialization. The first occurrence of an object is
+    # pre-serialized in place. Upon its next occurrence, its serializable
+    # representation is moved to the table of shared serializable
+    # representations, and every occurrence is replaced by a reference to the
+    # corresponding entry of the table. Objects are identified by identity if
+    # they are fancytypes, and by either identity or fingerprint otherwise, in
+    # which case only objects with large serializable representations are
+    # considered.
+    def __init__(self):
+        self.shared_reps = dict()
+        self._entries_by_identity = dict()
+        self._entries_by_fingerprint = dict()
+
+        # The recorded objects are kept alive, so that their identities are not
+        # reused by other objects during the pre-serialization.
+        self._objs = list()
+
+        return None
+
+
+
+    def pre_serialize(self,
+                      obj,
+                      pre_serialization_func,
+                      serializable_rep,
+                      key):
+        identity_key = (id(obj), pre_serialization_func)
+        entry = self._entries_by_identity.get(identity_key, None)
+
+        if entry is None:
+            elem_of_serializable_rep = pre_serialization_func(obj)
+            serializable_rep[key] = elem_of_serializable_rep
+
+            fingerprint = (None
+                           if isinstance(obj, PreSerializable)
+                           else _compute_fingerprint(elem_of_serializable_rep))
+            entry = self._entries_by_fingerprint.get(fingerprint, None)
+
+            if entry is None:
+                entry = {"site": (serializable_rep, key), "ref": None}
+                if fingerprint is not None:
+                    self._entries_by_fingerprint[fingerprint] = entry
+            else:
+                self._share(entry, serializable_rep, key)
+
+            if isinstance(obj, PreSerializable) or (fingerprint is not None):
+                self._entries_by_identity[identity_key] = entry
+                self._objs.append(obj)
+        else:
+            self._share(entry, serializable_rep, key)
+
+        return None
+
+
+
+    def _share(self, entry, serializable_rep, key):
+        if entry["ref"] is None:
+            ref = str(len(self.shared_reps))
+            site_serializable_rep, site_key = entry["site"]
+            self.shared_reps[ref] = site_serializable_rep[site_key]
+            site_serializable_rep[site_key] = {_name_of_shared_rep_ref: ref}
+            entry["ref"] = ref
+        serializable_rep[key] = {_name_of_shared_rep_ref: entry["ref"]}
+
+        return None
+
+
+
+class _SharedRepsResolver():
+    # De-pre-serializes each entry of a table of shared serializable
+    # representations at most once per de-pre-serialization function, so that
+    # the sharing of objects is restored.
+    def __init__(self, shared_reps):
+        self._shared_reps = shared_reps
+        self._resolved_objs = dict()
+
+        return None
+
+
+
+    def de_pre_serialize(self,
+                         elem_of_serializable_rep,
+                         de_pre_serialization_func):
+        is_ref = (isinstance(elem_of_serializable_rep, dict)
+                  and (tuple(elem_of_serializable_rep)
+                       == (_name_of_shared_rep_ref,)))
+        
+        if is_ref:
+            ref = elem_of_serializable_rep[_name_of_shared_rep_ref]
+            resolved_obj_key = (ref, de_pre_serialization_func)
+            if resolved_obj_key not in self._resolved_objs:
+                self._resolved_objs[resolved_obj_key] = \
+                    de_pre_serialization_func(self._shared_reps[ref])
+            obj = self._resolved_objs[resolved_obj_key]
+        else:
+            obj = de_pre_serialization_func(elem_of_serializable_rep)
+
+        return obj
+
+
+
+def _split_off_shared_reps(serializable_rep):
+    # ``shared_reps_resolver`` is ``None`` if ``serializable_rep`` does not
+    # store a table of shared serializable representations, in which case any
+    # references are resolved using the table of the enclosing serializable
+    # representation, if any.
+    if _name_of_shared_reps in serializable_rep:
+        serializable_rep = serializable_rep.copy()
+        shared_reps = serializable_rep.pop(_name_of_shared_reps)
+        shared_reps_resolver = _SharedRepsResolver(shared_reps)
+    else:
+        shared_reps_resolver = None
+
+    return serializable_rep, shared_reps_resolver
+
+
+
+@contextlib.contextmanager
+def _activate_shared_reps_resolver(shared_reps_resolver):
+    prev_shared_reps_resolver = getattr(_shared_reps_state, "resolver", None)
+    if shared_reps_resolver is not None:
+        _shared_reps_state.resolver = shared_reps_resolver
+    try:
+        yield None
+    finally:
+        _shared_reps_state.resolver = prev_shared_reps_resolver
+
+
+
+def _de_pre_serialize_elem(elem_of_serializable_rep, de_pre_serialization_func):
+    shared_reps_resolver = getattr(_shared_reps_state, "resolver", None)
+
+    if shared_reps_resolver is None:
+        obj = de_pre_serialization_func(elem_of_serializable_rep)
+    else:
+        kwargs = {"elem_of_serializable_rep": elem_of_serializable_rep,
+                  "de_pre_serialization_func": de_pre_serialization_func}
+        obj = shared_reps_resolver.de_pre_serialize(**kwargs)
+
+    return obj
+
+
+
+def _read_and_de_pre_serialize_json_obj(read_text, de_pre_serialization_funcs):
+    # Each top-level item of the JSON object is de-pre-serialized as soon as it
+    # has been decoded, after which its decoded value is dropped, so that the
+    # full decoded JSON object is never held in memory alongside the
+    # de-pre-serialized core attributes. If an item is not de-pre-serialized
+    # successfully, then the exception raised is returned, to be re-raised by
+    # the caller, and no further item is de-pre-serialized. Since an embedded
+    # digest may be stored in any item, and items are dropped once decoded,
+    # the digest of every other item is computed as it is decoded. A table of
+    # shared serializable representations, if any, precedes the items that
+    # refer to it.
+    json_obj_reader = _IncrementalJSONObjReader(read_text)
+
+    serializable_rep = dict()
+    core_attr_candidates = dict()
+    item_digests = dict()
+    shared_reps_resolver = None
+    de_pre_serialization_err = None
+    
+    for key, elem_of_serializable_rep in json_obj_reader.iter_items():
+        if key == _name_of_embedded_digest_metadata:
+            serializable_rep[key] = elem_of_serializable_rep
+        else:
+            kwargs = {"key": key,
+                      "elem_of_serializable_rep": elem_of_serializable_rep}
+            item_digests[key] = _compute_item_digest(**kwargs)
+            if key == _name_of_shared_reps:
+                serializable_rep[key] = elem_of_serializable_rep
+                shared_reps_resolver = \
+                    _SharedRepsResolver(elem_of_serializable_rep)
+            elif de_pre_serialization_err is None:
+                try:
+                    kwargs = {"elem_of_serializable_rep": \
+                              elem_of_serializable_rep,
+                              "de_pre_serialization_func": \
+                              de_pre_serialization_funcs[key]}
+                    with _activate_shared_reps_resolver(shared_reps_resolver):
+                        core_attr_candidates[key] = \
+                            _de_pre_serialize_elem(**kwargs)
+                except Exception as err:
+                    de_pre_serialization_err = err
+
+        del elem_of_serializable_rep
+
+    return (serializable_rep,
+            core_attr_candidates,
+            item_digests,
+            de_pre_serialization_err)
+
+
+
+def _is_equivalent_to_mapped_core_attr(converted_core_attr,
+                                       mapped_core_attr):
+    result = ((type(converted_core_attr) in (np.ndarray, np.memmap))
+              and (converted_core_attr.shape == mapped_core_attr.shape)
+              and (converted_core_attr.dtype == mapped_core_attr.dtype))
+
+    return result
+
+
+
+def _check_and_convert_fields(params):
+    obj_name = "fields"
+    obj = params[obj_name]
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = "_check_and_convert_fields"
+
+    if obj is not None:
+        kwargs = {"obj": obj, "obj_name": obj_name}
+        fields = czekitout.convert.to_tuple_of_strs(**kwargs)
+        fields = tuple(dict.fromkeys(fields))
+
+        for field in fields:
+            if field not in validation_and_conversion_funcs:
+                unformatted_err_msg = globals()[current_func_name+"_err_msg_1"]
+                err_msg = unformatted_err_msg.format(field)
+                raise KeyError(err_msg)
+    else:
+        fields = obj
+
+    return fields
+
+
+
+class _ProjectedCoreAttrsCandidate(dict):
+    # A ``dict`` of core attribute candidates that de-pre-serializes, and
+    # optionally validates and converts, each core attribute only upon first
+    # access. Validation and conversion functions access the other core
+    # attributes that they depend on via subscription, ``get``, or the methods
+    # returning values, hence only the requested core attributes and their
+    # dependencies are decoded. Membership tests and key views report every
+    # core attribute stored in the serializable representation, whether or not
+    # it has been decoded yet.
+    def __init__(self,
+                 serializable_rep,
+                 array_attrs,
+                 de_pre_serialization_funcs,
+                 validation_and_conversion_funcs,
+                 skip_validation_and_conversion):
+        self._serializable_rep = serializable_rep
+        self._array_attrs = array_attrs
+        self._de_pre_serialization_funcs = de_pre_serialization_funcs
+        self._validation_and_conversion_funcs = validation_and_conversion_funcs
+        self._skip_validation_and_conversion = skip_validation_and_conversion
+
+        self._core_attr_names = \
+            tuple(key
+                  for key in de_pre_serialization_funcs
+                  if ((key in serializable_rep) or (key in array_attrs)))
+
+        return None
+
+
+
+    def __contains__(self, key):
+        result = (key in self._core_attr_names)
+
+        return result
+
+
+
+    def __iter__(self):
+        result = iter(self._core_attr_names)
+
+        return result
+
+
+
+    def __len__(self):
+        result = len(self._core_attr_names)
+
+        return result
+
+
+
+    def keys(self):
+        result = dict.fromkeys(self._core_attr_names).keys()
+
+        return result
+
+
+
+    def values(self):
+        result = tuple(self[key] for key in self._core_attr_names)
+
+        return result
+
+
+
+    def items(self):
+        result = tuple((key, self[key]) for key in self._core_attr_names)
+
+        return result
+
+
+
+    def get(self, key, default=None):
+        result = self[key] if (key in self) else default
+
+        return result
+
+
+
+    def copy(self):
+        result = dict(self.items())
+
+        return result
+
+
+
+    def __missing__(self, key):
+        if key in self._array_attrs:
+            core_attr_candidate = self._array_attrs[key]
+        else:
+            kwargs = {"elem_of_serializable_rep": \
+                      self._serializable_rep[key],
+                      "de_pre_serialization_func": \
+                      self._de_pre_serialization_funcs[key]}
+            core_attr_candidate = _de_pre_serialize_elem(**kwargs)
+        self[key] = core_attr_candidate
+
+        if not self._skip_validation_and_conversion:
+            validation_and_conversion_func = \
+                self._validation_and_conversion_funcs[key]
+            self[key] = validation_and_conversion_func(params=self)
+
+        return self[key]
+
+
+
+def _check_and_convert_document_format(params):
+    obj_name = "document_format"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    document_format = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    kwargs["obj"] = document_format
+    kwargs["accepted_strings"] = ("json", "jsonl")
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    return document_format
+
+
+
+def _generate_load_cache_key(filename,
+                             skip_validation_and_conversion,
+                             compression):
+    try:
+        stat_result = os.stat(filename)
+        load_cache_key = (str(pathlib.Path(filename).resolve()),
+                          stat_result.st_mtime_ns,
+                          stat_result.st_size,
+                          skip_validation_and_conversion,
+                          compression)
+    except (OSError, TypeError):
+        load_cache_key = None
+
+    return load_cache_key
+
+
+
+_default_serializable_rep = _default_new_core_attr_subset_candidate
+_default_filename = "serialized_rep_of_fancytype.json"
+_default_overwrite = False
+_default_serialized_rep = str(_default_serializable_rep)
+_default_file_format = "json"
+_default_mmap = False
+_default_fsync_policy = "none"
+_default_compression = "infer"
+_default_embed_digest = False
+_default_trusted_digests = None
+_default_fields = None
+_default_fancytype_instances = tuple()
+_default_document_format = "json"
+_default_deduplicate = False
+
+
+
+class PreSerializable(Checkable):
+    r"""A type that is pre-serializable, that can be constructed from a 
+    serializable representation, and that can perform user-defined validations 
+    and conversions of a set of parameters upon construction.
+
+    We define pre-serialization as the process of converting an object into a
+    form that can be subsequently serialized into a JSON format. We refer to
+    objects resulting from pre-serialization as serializable objects.
+
+    We define de-pre-serialization as the process of converting a serializable
+    object into an instance of the current class, i.e. de-pre-serialization is
+    the reverse process of pre-serialization.
+
+    One cannot construct an instance of the class
+    :class:`fancytypes.PreSerializable` without raising an exception. In order
+    to make use of this class, one must create a subclass that inherits from
+    :class:`fancytypes.PreSerializable` and then override the class methods
+    :class:`~fancytypes.Checkable.get_validation_and_conversion_funcs`,
+    :class:`~fancytypes.PreSerializable.pre_serialization_funcs`, and
+    :class:`~fancytypes.PreSerializable.de_pre_serialization_funcs` in ways that
+    are consistent with the respective descriptions of the methods.
+
+    Parameters
+    ----------
+    skip_validation_and_conversion : `bool`, optional
+        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
+        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+        and :attr:`~fancytypes.Checkable.core_attrs` respectively, both of which
+        being `dict` objects.
+
+        Let ``params_to_be_mapped_to_core_attrs`` denote the `dict`
+        representation of the constructor parameters excluding the parameters
+        ``skip_validation_and_conversion`` and ``skip_cls_tests``, where each
+        `dict` key ``key`` is a different constructor parameter name, excluding
+        the names ``"skip_validation_and_conversion"`` and ``"skip_cls_tests"``,
+        and ``params_to_be_mapped_to_core_attrs[key]`` would yield the value of
+        the constructor parameter with the name given by ``key``.
+
+        If ``skip_validation_and_conversion`` is set to ``False``, then for each
+        key ``key`` in ``params_to_be_mapped_to_core_attrs``,
+        ``core_attrs[key]`` is set to ``validation_and_conversion_funcs[key]
+        (params_to_be_mapped_to_core_attrs)``.
+
+        Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
+        then ``core_attrs`` is set to
+        ``params_to_be_mapped_to_core_attrs.copy()``. This option is desired
+        primarily when the user wants to avoid potentially expensive deep copies
+        and/or conversions of the `dict` values of
+        ``params_to_be_mapped_to_core_attrs``, as it is guaranteed that no
+        copies or conversions are made in this case.  
+    skip_cls_test : `bool`, optional
+        If ``skip_cls_test`` is set to ``False``, then upon construction, tests
+        will be performed to check whether the class was properly
+        defined. If any of the tests fail, an exception will be raised.
+
+        Otherwise, if ``skip_cls_test`` is set to ``True``, these tests will be
+        skipped. 
+
+        One should only skip the tests if they are sure that the class is
+        properly defined. Skipping the tests will yield some improvement in
+        performance.
+    **kwargs 
+        The remaining constructor parameters.
+
+    """
+    def __init__(self,
+                 skip_validation_and_conversion=\
+                 _default_skip_validation_and_conversion,
+                 skip_cls_tests=\
+                 _default_skip_cls_tests,
+                 **kwargs):
+        super().__init__(skip_validation_and_conversion,
+                         skip_cls_tests,
+                         **kwargs)
+
+        params = {"skip_cls_tests": skip_cls_tests}
+        skip_cls_tests = _check_and_convert_skip_cls_tests(params)
+
+        params = {"validation_and_conversion_funcs": \
+                  self._validation_and_conversion_funcs,
+                  "pre_serialization_funcs": \
+                  self.get_pre_serialization_funcs(),
+                  "de_pre_serialization_funcs": \
+                  self.get_de_pre_serialization_funcs()}
         if (skip_cls_tests == False):
             _preliminary_check_of_pre_serialization_funcs(params)
             _preliminary_check_of_de_pre_serialization_funcs(params)            
         self._pre_serialization_funcs = params["pre_serialization_funcs"]
         self._de_pre_serialization_funcs = params["de_pre_serialization_funcs"]
 
-        if (skip_cls_tests == False):
-            try:
-                serializable_rep = self.pre_serialize()
-            except:
-                raise ValueError(_pre_serializable_err_msg_1)
+        if (skip_cls_tests == False):
+            try:
+                serializable_rep = self.pre_serialize()
+            except:
+                raise ValueError(_pre_serializable_err_msg_1)
+        
+            try:
+                method_alias = self._construct_core_attrs_candidate
+                kwargs = {"serializable_rep": \
+                          serializable_rep,
+                          "de_pre_serialization_funcs": \
+                          self._de_pre_serialization_funcs}
+                core_attrs_candidate = method_alias(**kwargs)
+
+                params = {"core_attrs_candidate": \
+                          core_attrs_candidate,
+                          "name_of_obj_alias_of_core_attrs_candidate": \
+                          "core_attrs_candidate",
+                          "validation_and_conversion_funcs": \
+                          self._validation_and_conversion_funcs}
+                _ =_check_and_convert_core_attrs_candidate(params)
+            except:
+                raise ValueError(_pre_serializable_err_msg_2)
+        
+        return None
+
+
+
+    @classmethod
+    def get_pre_serialization_funcs(cls):
+        r"""Return the pre-serialization functions.
+
+        Returns
+        -------
+        pre_serialization_funcs : `dict`
+            The attribute 
+            :attr:`~fancytypes.PreSerializable.pre_serialization_funcs`.
+
+        """
+        raise NotImplementedError(_pre_serializable_err_msg_3)
+
+
+
+    @property
+    def pre_serialization_funcs(self):
+        r"""`dict`: The pre-serialization functions.
+
+        ``pre_serialization_funcs`` has the same keys as the attribute
+        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, which is
+        also a `dict` object.
+
+        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
+        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+        and :attr:`~fancytypes.Checkable.core_attrs` respectively, the last of
+        which being a `dict` object as well.
+
+        For each `dict` key ``key`` in ``core_attrs``,
+        ``pre_serialization_funcs[key](core_attrs[key])`` is expected to yield a
+        serializable object, i.e. it should yield an object that can be passed
+        into the function ``json.dumps`` without raising an exception.
+
+        Note that ``pre_serialization_funcs`` should be considered
+        **read-only**.
+
+        """
+        result = self._pre_serialization_funcs.copy()
+        
+        return result
+
+
+
+    @classmethod
+    def get_de_pre_serialization_funcs(cls):
+        r"""Return the de-pre-serialization functions.
+
+        Returns
+        -------
+        de_pre_serialization_funcs : `dict`
+            The attribute 
+            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`.
+
+        """
+        raise NotImplementedError(_pre_serializable_err_msg_4)
+
+
+
+    @property
+    def de_pre_serialization_funcs(self):
+        r"""`dict`: The de-pre-serialization functions.
+
+        ``de_pre_serialization_funcs`` has the same keys as the attribute
+        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, which is
+        also a `dict` object.
+
+        Let ``validation_and_conversion_funcs`` and ``pre_serialization_funcs``
+        denote the attributes
+        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+        :attr:`~fancytypes.PreSerializable.pre_serialization_funcs`
+        respectively, the last of which being a `dict` object as well.
+
+        Let ``core_attrs_candidate_1`` be any `dict` object that has the same
+        keys as ``validation_and_conversion_funcs``, where for each `dict` key
+        ``key`` in ``core_attrs_candidate_1``,
+        ``validation_and_conversion_funcs[key](core_attrs_candidate_1)`` does
+        not raise an exception.
+
+        Let ``serializable_rep`` be a `dict` object that has the same keys as
+        ``core_attrs_candidate_1``, where for each `dict` key ``key`` in
+        ``core_attrs_candidate_1``, ``serializable_rep[key]`` is set to
+        ``pre_serialization_funcs[key](core_attrs_candidate_1[key])``.
+
+        The items of ``de_pre_serialization_funcs`` are expected to be set to
+        callable objects that would lead to
+        ``de_pre_serialization_funcs[key](serializable_rep[key])`` not raising
+        an exception for each `dict` key ``key`` in ``serializable_rep``.
+
+        Let ``core_attrs_candidate_2`` be a `dict` object that has the same keys
+        as ``serializable_rep``, where for each `dict` key ``key`` in
+        ``validation_and_conversion_funcs``, ``core_attrs_candidate_2[key]`` is
+        set to ``de_pre_serialization_funcs[key](serializable_rep[key])``.
+
+        The items of ``de_pre_serialization_funcs`` are also expected to be set
+        to callable objects that would lead to
+        ``validation_and_conversion_funcs[key](core_attrs_candidate_2)`` not
+        raising an exception for each `dict` key ``key`` in
+        ``core_attrs_candidate_2``.
+
+        Note that ``de_pre_serialization_funcs`` should be considered
+        **read-only**.
+
+        """
+        result = self._de_pre_serialization_funcs.copy()
+        
+        return result
+
+
+
+    @classmethod
+    def _construct_core_attrs_candidate(cls,
+                                        serializable_rep,
+                                        de_pre_serialization_funcs):
+        kwargs = {"obj": serializable_rep, "obj_name": "serializable_rep"}
+        serializable_rep = czekitout.convert.to_dict(**kwargs)
+        serializable_rep, shared_reps_resolver = \
+            _split_off_shared_reps(serializable_rep)
+
+        for key in serializable_rep:
+            if key not in de_pre_serialization_funcs:
+                obj_name = "serializable_rep"
+                unformatted_err_msg_1 = _pre_serializable_err_msg_5
+                err_msg = unformatted_err_msg_1.format(obj_name, obj_name, key)
+                raise KeyError(err_msg)
+            
+        try:
+            core_attrs_candidate = dict()
+            
+            with _activate_shared_reps_resolver(shared_reps_resolver):
+                for key in serializable_rep:
+                    kwargs = {"elem_of_serializable_rep": \
+                              serializable_rep[key],
+                              "de_pre_serialization_func": \
+                              de_pre_serialization_funcs[key]}
+                    core_attr_candidate = _de_pre_serialize_elem(**kwargs)
+                    core_attrs_candidate[key] = core_attr_candidate
+        except Exception:
+            err_msg = _pre_serializable_err_msg_6
+            raise ValueError(err_msg)
+
+        return core_attrs_candidate
+
+
+
+    @classmethod
+    def de_pre_serialize(cls,
+                         serializable_rep=\
+                         _default_serializable_rep,
+                         skip_validation_and_conversion=\
+                         _default_skip_validation_and_conversion):
+        r"""Construct an instance from a serializable representation.
+
+        Parameters
+        ----------
+        serializable_rep : `dict`, optional
+            A `dict` object that has the same keys as the attribute
+            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, which
+            is also a `dict` object.
+
+            Let ``validation_and_conversion_funcs`` and
+            ``de_pre_serialization_funcs`` denote the attributes
+            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`
+            respectively, the last of which being a `dict` object as well.
+
+            The items of ``serializable_rep`` are expected to be objects that
+            would lead to
+            ``de_pre_serialization_funcs[key](serializable_rep[key])`` not
+            raising an exception for each `dict` key ``key`` in
+            ``serializable_rep``.
+
+            Let ``core_attrs_candidate`` be a `dict` object that has the same
+            keys as ``serializable_rep``, where for each `dict` key ``key`` in
+            ``serializable_rep``, ``core_attrs_candidate[key]`` is set to
+            de_pre_serialization_funcs[key](serializable_rep[key])``.
+
+            The items of ``serializable_rep`` are also expected to be set to
+            objects that would lead to
+            ``validation_and_conversion_funcs[key](core_attrs_candidate)`` not
+            raising an exception for each `dict` key ``key`` in
+            ``serializable_rep``.
+        skip_validation_and_conversion : `bool`, optional
+            Let ``core_attrs`` denote the attribute
+            :attr:`~fancytypes.Checkable.core_attrs`, which is a `dict` object.
+
+            If ``skip_validation_and_conversion`` is set to ``False``, then for
+            each key ``key`` in ``serializable_rep``, ``core_attrs[key]`` is set
+            to ``validation_and_conversion_funcs[key] (core_attrs_candidate)``,
+            with ``validation_and_conversion_funcs`` and
+            ``core_attrs_candidate_1`` being introduced in the above description
+            of ``serializable_rep``.
+
+            Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
+            then ``core_attrs`` is set to ``core_attrs_candidate.copy()``. This
+            option is desired primarily when the user wants to avoid potentially
+            expensive deep copies and/or conversions of the `dict` values of
+            ``core_attrs_candidate``, as it is guaranteed that no copies or
+            conversions are made in this case.
+
+        Returns
+        -------
+        instance_of_current_cls : Current class
+            An instance constructed from the serializable representation
+            ``serializable_rep``.
+
+        """
+        params = {"validation_and_conversion_funcs": \
+                  cls.get_validation_and_conversion_funcs(),
+                  "pre_serialization_funcs": \
+                  cls.get_pre_serialization_funcs(),
+                  "de_pre_serialization_funcs": \
+                  cls.get_de_pre_serialization_funcs()}
+        kwargs = {"serializable_rep": \
+                  serializable_rep,
+                  "array_attrs": \
+                  dict(),
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "mmap": \
+                  False}
+        instance_of_current_cls = cls._de_pre_serialize(**kwargs)
+                
+        return instance_of_current_cls
+
+
+
+    @classmethod
+    def _de_pre_serialize(cls,
+                          serializable_rep,
+                          array_attrs,
+                          skip_validation_and_conversion,
+                          mmap):
+        params = {"validation_and_conversion_funcs": \
+                  cls.get_validation_and_conversion_funcs(),
+                  "pre_serialization_funcs": \
+                  cls.get_pre_serialization_funcs(),
+                  "de_pre_serialization_funcs": \
+                  cls.get_de_pre_serialization_funcs()}
+        _preliminary_check_of_de_pre_serialization_funcs(params)
+        de_pre_serialization_funcs = params["de_pre_serialization_funcs"]
+
+        try:
+            kwargs = \
+                {"serializable_rep": serializable_rep,
+                 "de_pre_serialization_funcs": de_pre_serialization_funcs}
+            core_attrs_candidate = \
+                cls._construct_core_attrs_candidate(**kwargs)
+            core_attrs_candidate.update(array_attrs)
+
+            kwargs = core_attrs_candidate
+            key = "skip_validation_and_conversion"
+            if key in cls.__init__.__code__.co_varnames:
+                kwargs[key] = True
+            key = "skip_cls_tests"
+            if mmap and (key in cls.__init__.__code__.co_varnames):
+                kwargs[key] = True
+            instance_of_current_cls = cls(**kwargs)
+
+            if (skip_validation_and_conversion == False):
+                core_attrs = instance_of_current_cls._core_attrs
+
+                # Pre-serializing memory-mapped arrays would read them into
+                # memory in full.
+                names_of_core_attrs_to_pre_serialize = \
+                    tuple(core_attr_name
+                          for core_attr_name in core_attrs
+                          if ((not mmap)
+                              or (core_attr_name not in array_attrs)))
+
+                try:
+                    method_alias = \
+                        instance_of_current_cls._pre_serialize_core_attr_subset
+                    kwargs = {"core_attr_names": \
+                              names_of_core_attrs_to_pre_serialize}
+                    _ = method_alias(**kwargs)
+                except Exception:
+                    raise ValueError(_pre_serializable_err_msg_1)
+
+                validation_and_conversion_funcs = \
+                    instance_of_current_cls._validation_and_conversion_funcs
+
+                params = {"core_attrs_candidate": \
+                          core_attrs,
+                          "validation_and_conversion_funcs": \
+                          validation_and_conversion_funcs,
+                          "names_of_core_attrs_to_check_and_convert": \
+                          tuple(core_attrs)}
+                func_alias = _check_and_convert_subset_of_core_attrs_candidate
+                validated_core_attrs = func_alias(params)
+
+                # Memory-mapped arrays are kept in place of their validated and
+                # converted counterparts whenever the conversion preserves their
+                # shapes and dtypes, so that they remain memory-mapped.
+                for core_attr_name in (array_attrs if mmap else tuple()):
+                    kwargs = {"converted_core_attr": \
+                              validated_core_attrs[core_attr_name],
+                              "mapped_core_attr": \
+                              core_attrs[core_attr_name]}
+                    if _is_equivalent_to_mapped_core_attr(**kwargs):
+                        validated_core_attrs[core_attr_name] = \
+                            core_attrs[core_attr_name]
+                
+                instance_of_current_cls._core_attrs = validated_core_attrs
+        except Exception:
+            raise ValueError(_pre_serializable_err_msg_7)
+                
+        return instance_of_current_cls
+
+
+
+    @classmethod
+    def _de_pre_serialize_projection(cls,
+                                     serializable_rep,
+                                     array_attrs,
+                                     skip_validation_and_conversion,
+                                     fields):
+        params = {"validation_and_conversion_funcs": \
+                  cls.get_validation_and_conversion_funcs(),
+                  "pre_serialization_funcs": \
+                  cls.get_pre_serialization_funcs(),
+                  "de_pre_serialization_funcs": \
+                  cls.get_de_pre_serialization_funcs()}
+        _preliminary_check_of_de_pre_serialization_funcs(params)
+
+        try:
+            kwargs = {"obj": serializable_rep, "obj_name": "serializable_rep"}
+            serializable_rep = czekitout.convert.to_dict(**kwargs)
+            serializable_rep, shared_reps_resolver = \
+                _split_off_shared_reps(serializable_rep)
+            
+            kwargs = {"serializable_rep": \
+                      serializable_rep,
+                      "array_attrs": \
+                      array_attrs,
+                      "de_pre_serialization_funcs": \
+                      params["de_pre_serialization_funcs"],
+                      "validation_and_conversion_funcs": \
+                      params["validation_and_conversion_funcs"],
+                      "skip_validation_and_conversion": \
+                      skip_validation_and_conversion}
+            core_attrs_candidate = _ProjectedCoreAttrsCandidate(**kwargs)
+            
+            with _activate_shared_reps_resolver(shared_reps_resolver):
+                core_attrs = {field: core_attrs_candidate[field]
+                              for field in fields}
+        except Exception:
+            raise ValueError(_pre_serializable_err_msg_18)
+
+        projected_core_attrs = types.MappingProxyType(core_attrs)
+                
+        return projected_core_attrs
+
+
+
+    def pre_serialize(self, deduplicate=_default_deduplicate):
+        r"""Pre-serialize instance.
+
+        Parameters
+        ----------
+        deduplicate : `bool`, optional
+            If ``deduplicate`` is set to ``True``, then objects that occur more
+            than once in the core attributes of the current instance, or in
+            those of nested fancytypes, are pre-serialized only once. A nested
+            fancytype, i.e. a core attribute that is an instance of the class
+            :class:`fancytypes.PreSerializable`, occurs more than once if it is
+            the same object as another core attribute pre-serialized by the same
+            pre-serialization function. Any other core attribute occurs more
+            than once if it is the same object as, or if it has the same
+            serializable representation as, another such core attribute, and if
+            its serializable representation is large, i.e. at least 1024
+            characters long when serialized. The serializable representation of
+            each object that occurs more than once is stored once, in the item
+            ``"__fancytypes_shared_reps__"`` of ``serializable_rep``, and every
+            occurrence is replaced by a reference to it. Pre-serialization
+            functions of nested fancytypes are expected to call the method
+            :meth:`~fancytypes.PreSerializable.pre_serialize` of the nested
+            fancytypes, and to embed the result as is.
+
+            The sharing of objects is restored upon de-pre-serializing
+            ``serializable_rep``, e.g. via the method
+            :meth:`~fancytypes.PreSerializable.de_pre_serialize`, in that
+            references to the same object are de-pre-serialized into the same
+            object. Note however that validation and conversion functions may
+            copy the objects that they are given, in which case the sharing is
+            preserved in the core attributes of the resulting instance only if
+            ``skip_validation_and_conversion`` is set to ``True`` upon
+            de-pre-serialization.
+
+            Otherwise, if ``deduplicate`` is set to ``False``, then each
+            occurrence of an object is pre-serialized separately.
+
+        Returns
+        -------
+        serializable_rep : `dict`
+            A serializable representation of an instance.
+
+        """
+        params = {"deduplicate": deduplicate}
+        deduplicate = _check_and_convert_deduplicate(params)
+
+        kwargs = {"core_attr_names": self._core_attrs.keys()}
+        serializable_rep = \
+            (self._pre_serialize_and_deduplicate_core_attr_subset(**kwargs)
+             if deduplicate
+             else self._pre_serialize_core_attr_subset(**kwargs))
+
+        return serializable_rep
+
+
+
+    def _pre_serialize_and_deduplicate_core_attr_subset(self,
+                                                        core_attr_names):
+        # Nested fancytypes pre-serialized while a registry is active share the
+        # registry of the outermost instance.
+        prev_shared_reps_registry = \
+            getattr(_shared_reps_state, "registry", None)
+        is_outermost_instance = (prev_shared_reps_registry is None)
+        
+        shared_reps_registry = (_SharedRepsRegistry()
+                                if is_outermost_instance
+                                else prev_shared_reps_registry)
+        _shared_reps_state.registry = shared_reps_registry
+        try:
+            kwargs = {"core_attr_names": core_attr_names}
+            serializable_rep = self._pre_serialize_core_attr_subset(**kwargs)
+        finally:
+            _shared_reps_state.registry = prev_shared_reps_registry
+
+        # The table of shared serializable representations is stored first, so
+        # that it precedes the references to it when read sequentially.
+        if is_outermost_instance and shared_reps_registry.shared_reps:
+            serializable_rep = {_name_of_shared_reps: \
+                                shared_reps_registry.shared_reps,
+                                **serializable_rep}
+
+        return serializable_rep
+
+
+
+    def _pre_serialize_core_attr_subset(self, core_attr_names):
+        serializable_rep = dict()
+        shared_reps_registry = getattr(_shared_reps_state, "registry", None)
+        
+        for core_attr_name in core_attr_names:
+            core_attr = \
+                self._core_attrs[core_attr_name]
+            pre_serialization_func = \
+                self._pre_serialization_funcs[core_attr_name]
+
+            if shared_reps_registry is None:
+                elem_of_serializable_rep = \
+                    pre_serialization_func(core_attr)
+                serializable_rep[core_attr_name] = \
+                    elem_of_serializable_rep
+            else:
+                kwargs = {"obj": core_attr,
+                          "pre_serialization_func": pre_serialization_func,
+                          "serializable_rep": serializable_rep,
+                          "key": core_attr_name}
+                shared_reps_registry.pre_serialize(**kwargs)
+
+        return serializable_rep
+
+
+
+    def dumps(self, deduplicate=_default_deduplicate):
+        r"""Serialize instance.
+
+        Parameters
+        ----------
+        deduplicate : `bool`, optional
+            If ``deduplicate`` is set to ``True``, then objects that occur more
+            than once are serialized only once, as described in the
+            documentation for the method
+            :meth:`~fancytypes.PreSerializable.pre_serialize`. Otherwise, each
+            occurrence of an object is serialized separately.
+        
+        Returns
+        -------
+        serialized_rep : `dict`
+            A serialized representation of an instance.
+
+        """
+        serializable_rep = self.pre_serialize(deduplicate)
+        serialized_rep = json.dumps(serializable_rep)
+
+        return serialized_rep
+
+
+
+    @classmethod
+    def pre_serialize_many(cls,
+                           fancytype_instances=_default_fancytype_instances):
+        r"""Pre-serialize a sequence of instances in bulk.
+
+        The result is the same as that of calling the method
+        :meth:`~fancytypes.PreSerializable.pre_serialize` of each instance,
+        however the pre-serialization functions are looked up once per class
+        rather than once per instance, and each pre-serialization function is
+        applied to the corresponding core attribute of every instance of a
+        given class in a single loop.
+
+        Parameters
+        ----------
+        fancytype_instances : `array_like` (`cls`, ndim=1), optional
+            The instances to pre-serialize, where ``cls`` is the current class.
+            Instances of subclasses of the current class are also accepted.
+
+        Returns
+        -------
+        serializable_reps : `list` (`dict`, ndim=1)
+            The serializable representations of the instances, in the same
+            order as ``fancytype_instances``.
+
+        """
+        kwargs = {"obj": fancytype_instances,
+                  "obj_name": "fancytype_instances",
+                  "accepted_types": (list, tuple)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+
+        instance_indices_by_cls = dict()
+        for instance_idx, fancytype_instance in enumerate(fancytype_instances):
+            instance_indices = \
+                instance_indices_by_cls.setdefault(type(fancytype_instance), [])
+            instance_indices.append(instance_idx)
+
+        serializable_reps = [None]*len(fancytype_instances)
+        
+        for fancytype_cls, instance_indices in instance_indices_by_cls.items():
+            # The type of the instances is checked once per class.
+            kwargs = {"obj": fancytype_instances[instance_indices[0]],
+                      "obj_name": "fancytype_instance",
+                      "accepted_types": (cls,)}
+            czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+            
+            core_attr_sets = tuple(fancytype_instances[instance_idx]._core_attrs
+                                   for instance_idx in instance_indices)
+            pre_serialization_funcs = \
+                fancytype_cls.get_pre_serialization_funcs()
+            
+            columns = dict()
+            for key, pre_serialization_func in pre_serialization_funcs.items():
+                columns[key] = [pre_serialization_func(core_attrs[key])
+                                for core_attrs in core_attr_sets]
+
+            for row_idx, instance_idx in enumerate(instance_indices):
+                core_attrs = core_attr_sets[row_idx]
+                serializable_reps[instance_idx] = {key: columns[key][row_idx]
+                                                   for key in core_attrs}
+
+        return serializable_reps
+
+
+
+    @classmethod
+    def dumps_many(cls,
+                   fancytype_instances=_default_fancytype_instances,
+                   document_format=_default_document_format):
+        r"""Serialize a sequence of instances in bulk, into a single document.
+
+        The instances are pre-serialized via the method
+        :meth:`~fancytypes.PreSerializable.pre_serialize_many`, and the
+        serializable representations are then encoded by a single JSON encoder.
+
+        Parameters
+        ----------
+        fancytype_instances : `array_like` (`cls`, ndim=1), optional
+            The instances to serialize, where ``cls`` is the current class.
+            Instances of subclasses of the current class are also accepted.
+        document_format : ``"json"`` | ``"jsonl"``, optional
+            If ``document_format`` is set to ``"json"``, then the serialized
+            representations are stored in a single JSON array.
+
+            Otherwise, if ``document_format`` is set to ``"jsonl"``, then the
+            serialized representations are stored in a JSON Lines document,
+            i.e. one serialized representation per line, each line being the
+            output of the method :meth:`~fancytypes.PreSerializable.dumps` of
+            the corresponding instance, followed by a newline character.
+
+        Returns
+        -------
+        serialized_rep : `str`
+            The serialized representation of the sequence of instances.
+
+        """
+        params = {"document_format": document_format}
+        document_format = _check_and_convert_document_format(params)
+
+        kwargs = {"fancytype_instances": fancytype_instances}
+        serializable_reps = cls.pre_serialize_many(**kwargs)
+
+        json_encoder = json.JSONEncoder()
+        if document_format == "json":
+            serialized_rep = json_encoder.encode(serializable_reps)
+        else:
+            serialized_rep = "".join(json_encoder.encode(serializable_rep)+"\n"
+                                     for serializable_rep in serializable_reps)
+
+        return serialized_rep
+
+
+
+    def compute_digest(self, deduplicate=_default_deduplicate):
+        r"""Compute the digest of the instance.
+
+        The digest is the SHA-256 hash, in hexadecimal form, of the identity of
+        the class of the instance, i.e. the fully qualified name of the class,
+        followed by a canonical JSON encoding of the output of
+        :meth:`~fancytypes.PreSerializable.pre_serialize`, wherein the keys are
+        sorted and no whitespace is inserted. The digest is the one embedded in
+        files written by the method :meth:`~fancytypes.PreSerializable.dump`
+        with ``embed_digest`` set to ``True``, and with the same value of
+        ``deduplicate``. Hence, the digests of trusted instances can be
+        collected into a registry of trusted digests, to be passed to the method
+        :meth:`~fancytypes.PreSerializable.load`.
+
+        Parameters
+        ----------
+        deduplicate : `bool`, optional
+            The object ``deduplicate`` is passed to the method
+            :meth:`~fancytypes.PreSerializable.pre_serialize`.
+
+        Returns
+        -------
+        digest : `str`
+            The digest of the instance.
+
+        """
+        params = {"deduplicate": deduplicate}
+        deduplicate = _check_and_convert_deduplicate(params)
+
+        item_digests = _compute_item_digests(self.pre_serialize(deduplicate))
+        digest = _compute_digest(cls=type(self), item_digests=item_digests)
+
+        return digest
+
+
+
+    def dump(self,
+             filename=_default_filename,
+             overwrite=_default_overwrite,
+             file_format=_default_file_format,
+             fsync_policy=_default_fsync_policy,
+             compression=_default_compression,
+             embed_digest=_default_embed_digest,
+             deduplicate=_default_deduplicate):
+        r"""Serialize instance and save the result in a JSON file.
+
+        The serialized representation is first written to a temporary file in
+        the same directory as the target file, which is then renamed to the
+        target file via :func:`os.replace`. Hence, the target file is never left
+        partially written: if an error occurs, then any pre-existing file at
+        the target path is left untouched.
+
+        Parameters
+        ----------
+        filename : `str` | file object, optional
+            The relative or absolute path to the JSON file in which to store the
+            serialized representation of an instance.
+
+            Alternatively, ``filename`` can be an open file object, i.e. any
+            object with a ``write`` method, e.g. a binary or text file, a socket
+            wrapped via :meth:`socket.socket.makefile`, a pipe, or an in-memory
+            buffer such as :class:`io.BytesIO`. In this case, the serialized
+            representation is encoded and written directly to the stream, in
+            chunks, without first being built as a full string in memory. The
+            file object is neither flushed nor closed afterwards, and the
+            objects ``overwrite`` and ``fsync_policy`` are ignored. If
+            ``filename`` is a text stream, i.e. an instance of
+            :class:`io.TextIOBase`, then ``file_format`` must be set to
+            ``"json"`` and ``compression`` must be set to either ``"infer"`` or
+            ``"none"``. Otherwise, the stream is treated as a binary stream, to
+            which UTF-8 encoded text is written in the case of a JSON document.
+        overwrite : `bool`, optional
+            If ``overwrite`` is set to ``False`` and a file exists at the path
+            ``filename``, then the serialized instance is not written to that
+            file and an exception is raised. Otherwise, the serialized instance
+            will be written to that file barring no other issues occur.
+        file_format : ``"json"`` | ``"archive"``, optional
+            If ``file_format`` is set to ``"json"``, then the serialized
+            representation is stored as a plain JSON document.
+
+            Otherwise, if ``file_format`` is set to ``"archive"``, then the
+            instance is stored in an archive file, which consists of a small
+            JSON manifest followed by raw array data. Every core attribute that
+            is a :class:`numpy.ndarray` without object or structured dtype is
+            stored as raw array data, without being pre-serialized, whereas
+            every other core attribute is pre-serialized and stored in the
+            manifest. Archive files can be loaded using the method
+            :meth:`~fancytypes.PreSerializable.load`, optionally with the array
+            data being memory-mapped rather than read into memory.
+        fsync_policy : ``"none"`` | ``"file"`` | ``"file_and_dir"``, optional
+            If ``fsync_policy`` is set to ``"none"``, then no data is explicitly
+            flushed to disk, in which case the target file is protected against
+            crashes of the current process, but not against operating system
+            crashes or power failures.
+
+            If ``fsync_policy`` is set to ``"file"``, then the temporary file is
+            flushed to disk via :func:`os.fsync` before being renamed, which
+            guarantees that the target file is never left with incomplete
+            content after a power failure.
+
+            If ``fsync_policy`` is set to ``"file_and_dir"``, then additionally
+            the directory containing the target file is flushed to disk after
+            the rename, which guarantees that the rename itself is durable. On
+            Windows, directories cannot be flushed, hence this option is
+            equivalent to ``"file"`` there.
+        compression : `str`, optional
+            The compression applied to the file, which can be set to
+            ``"infer"``, ``"none"``, ``"gzip"``, ``"bz2"``, or ``"lzma"``. The
+            last three options correspond to the compression formats supported
+            by the standard library modules :mod:`gzip`, :mod:`bz2`, and
+            :mod:`lzma` respectively. If ``compression`` is set to
+            ``"infer"``, then the compression is inferred from the suffix of
+            ``filename``: ``".gz"`` implies ``"gzip"``; ``".bz2"`` implies
+            ``"bz2"``; ``".xz"`` and ``".lzma"`` imply ``"lzma"``; and any other
+            suffix implies ``"none"``, as does a file object. The serialized
+            representation is encoded and compressed incrementally, i.e. the
+            full uncompressed text is never held in memory.
+        embed_digest : `bool`, optional
+            If ``embed_digest`` is set to ``True``, then ``file_format`` must be
+            set to ``"json"``, and the JSON document additionally stores, under
+            the reserved key ``"__fancytypes_digest__"``, the identity of the
+            class of the instance, along with the digest of the instance, i.e.
+            the output of :meth:`~fancytypes.PreSerializable.compute_digest`.
+            Since the instance has already been validated, the method
+            :meth:`~fancytypes.PreSerializable.load` can then skip validation
+            upon verifying the embedded digest. See the documentation for said
+            method for details.
+
+            Otherwise, if ``embed_digest`` is set to ``False``, then no digest
+            is embedded.
+        deduplicate : `bool`, optional
+            If ``deduplicate`` is set to ``True``, then objects that occur more
+            than once are serialized only once, as described in the
+            documentation for the method
+            :meth:`~fancytypes.PreSerializable.pre_serialize`, in which case the
+            table of shared serializable representations is stored as the first
+            item of the JSON document or manifest, or as the second item if a
+            digest is embedded, since the latter always comes first. Any
+            embedded digest is then that of the deduplicated serializable
+            representation, i.e. the output of
+            :meth:`~fancytypes.PreSerializable.compute_digest` with
+            ``deduplicate`` set to ``True``. Otherwise, each occurrence of an
+            object is serialized separately.
+
+        Returns
+        -------
+
+        """
+        params = {key: val
+                  for key, val in locals().items()
+                  if (key not in ("self", "__class__"))}
+        params["name_of_required_method"] = "write"
+        filename = _check_and_convert_filename_or_file_obj(params)
+        overwrite = _check_and_convert_overwrite(params)
+        file_format = _check_and_convert_file_format(params)
+        fsync_policy = _check_and_convert_fsync_policy(params)
+        compression = _check_and_convert_compression(params)
+        embed_digest = _check_and_convert_embed_digest(params)
+        deduplicate = _check_and_convert_deduplicate(params)
+
+        if isinstance(filename, str):
+            if pathlib.Path(filename).is_file():
+                if not overwrite:
+                    raise IOError(_pre_serializable_err_msg_8.format(filename))
+        elif isinstance(filename, io.TextIOBase):
+            if ((file_format != "json")
+                or (compression not in ("infer", "none"))):
+                raise ValueError(_pre_serializable_err_msg_14)
+
+        kwargs = {"file_format": file_format, "deduplicate": deduplicate}
+        serializable_rep, array_attrs = self._pre_serialize_for_dump(**kwargs)
+
+        if embed_digest:
+            # The embedded digest is written as the first item of the JSON
+            # object, so that it can be verified while the remaining items are
+            # streamed upon loading.
+            key = _name_of_embedded_digest_metadata
+            item_digests = _compute_item_digests(serializable_rep)
+            embedded_digest_metadata = \
+                {"cls": _return_cls_identity(type(self)),
+                 "sha256": _compute_digest(type(self), item_digests)}
+            serializable_rep = {key: embedded_digest_metadata,
+                                **serializable_rep}
+
+        if isinstance(filename, str):
+            try:
+                kwargs = {"filenames": (filename,),
+                          "serializable_reps": (serializable_rep,),
+                          "array_attr_sets": (array_attrs,),
+                          "file_format": file_format,
+                          "fsync_policy": fsync_policy,
+                          "compression": compression}
+                _dump_atomically(**kwargs)
+            except:
+                raise IOError(_pre_serializable_err_msg_9.format(filename))
+        else:
+            try:
+                kwargs = {"file_obj": \
+                          filename,
+                          "serializable_rep": \
+                          serializable_rep,
+                          "array_attrs": \
+                          array_attrs,
+                          "file_format": \
+                          file_format,
+                          "compression": \
+                          "none" if (compression == "infer") else compression}
+                _write_to_file_obj(**kwargs)
+            except:
+                raise IOError(_pre_serializable_err_msg_15)
+            
+        return None
+
+
+
+    def _pre_serialize_for_dump(self, file_format, deduplicate):
+        if file_format == "json":
+            serializable_rep = self.pre_serialize(deduplicate)
+            array_attrs = dict()
+        else:
+            array_attrs = {core_attr_name: core_attr
+                           for core_attr_name, core_attr
+                           in self._core_attrs.items()
+                           if _is_raw_array_attr(core_attr)}
+            core_attr_names = tuple(core_attr_name
+                                    for core_attr_name in self._core_attrs
+                                    if core_attr_name not in array_attrs)
+            method_alias = \
+                (self._pre_serialize_and_deduplicate_core_attr_subset
+                 if deduplicate
+                 else self._pre_serialize_core_attr_subset)
+            kwargs = {"core_attr_names": core_attr_names}
+            serializable_rep = method_alias(**kwargs)
+
+        return serializable_rep, array_attrs
+
+
+
+    @classmethod
+    def loads(cls,
+              serialized_rep=\
+              _default_serialized_rep,
+              skip_validation_and_conversion=\
+              _default_skip_validation_and_conversion,
+              fields=\
+              _default_fields):
+        r"""Construct an instance from a serialized representation.
+
+        Users can generate serialized representations using the method
+        :meth:`~fancytypes.PreSerializable.dumps`.
+
+        Parameters
+        ----------
+        serialized_rep : `str` | `bytes` | `bytearray` | `memoryview`, optional
+            The serialized representation.
+
+            ``serialized_rep`` is expected to be such that
+            ``json.loads(serialized_rep)`` does not raise an exception.
+
+            If ``serialized_rep`` is a bytes-like object, i.e. a `bytes`,
+            `bytearray`, or `memoryview` object, then it is decoded
+            incrementally, directly from its underlying buffer, i.e. no decoded
+            copy of the full serialized representation is ever made. In this
+            case, the encoding is detected in the same way as in the function
+            :func:`json.loads`.
+
+            If ``serialized_rep`` stores an embedded digest, e.g. if it is the
+            content of a file saved via the method
+            :meth:`~fancytypes.PreSerializable.dump` with ``embed_digest`` set
+            to ``True``, then the digest is verified and then discarded, as
+            described in the documentation for the method
+            :meth:`~fancytypes.PreSerializable.load`, except that validation is
+            never skipped.
+
+            Let ``serializable_rep=json.loads(serialized_rep)``. 
+
+            Let ``validation_and_conversion_funcs`` and
+            ``de_pre_serialization_funcs`` denote the attributes
+            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`
+            respectively, both of which being `dict` objects as well.
+
+            ``serialized_rep`` is also expected to be such that
+            ``de_pre_serialization_funcs[key](serializable_rep[key])`` does not
+            raise an exception for each `dict` key ``key`` in
+            ``de_pre_serialization_funcs``.
+
+            Let ``core_attrs_candidate`` be a `dict` object that has the same
+            keys as ``serializable_rep``, where for each `dict` key ``key`` in
+            ``de_pre_serialization_funcs``, ``core_attrs_candidate[key]`` is set
+            to de_pre_serialization_funcs[key](serializable_rep[key])``.
+
+            ``serialized_rep`` is also expected to be such that
+            ``validation_and_conversion_funcs[key](core_attrs_candidate)`` does
+            not raise an exception for each `dict` key ``key`` in
+            ``serializable_rep``.
+        skip_validation_and_conversion : `bool`, optional
+            Let ``core_attrs`` denote the attribute
+            :attr:`~fancytypes.Checkable.core_attrs`, which is a `dict` object.
+
+            If ``skip_validation_and_conversion`` is set to ``False``, then for
+            each key ``key`` in ``core_attrs_candidate``, ``core_attrs[key]`` is
+            set to ``validation_and_conversion_funcs[key]
+            (core_attrs_candidate)``, with ``validation_and_conversion_funcs``
+            and ``core_attrs_candidate_1`` being introduced in the above
+            description of ``serialized_rep``.
+
+            Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
+            then ``core_attrs`` is set to ``core_attrs_candidate.copy()``. This
+            option is desired primarily when the user wants to avoid potentially
+            expensive deep copies and/or conversions of the `dict` values of
+            ``core_attrs_candidate``, as it is guaranteed that no copies or
+            conversions are made in this case.
+        fields : `array_like` (`str`, ndim=1) | `None`, optional
+            If ``fields`` is set to ``None``, then an instance of the current
+            class is constructed from the serialized representation.
+
+            Otherwise, ``fields`` specifies the names of the core attributes to
+            be loaded, and a partial, read-only view of the core attributes is
+            returned instead of an instance, namely a
+            :class:`types.MappingProxyType` object whose keys are the strings
+            in ``fields``. In this case, only the requested core attributes,
+            along with the core attributes that their validation and conversion
+            functions depend on, are de-pre-serialized and, unless
+            ``skip_validation_and_conversion`` is set to ``True``, validated
+            and converted. The dependencies are detected as the validation and
+            conversion functions access the values of other core attributes,
+            e.g. via ``params[key]``, ``params.get(key)``, or
+            ``params.items()``, whereas membership tests, e.g. ``key in
+            params``, and key views, e.g. ``params.keys()``, report every core
+            attribute stored in the serialized representation without decoding
+            any of them. If a requested core attribute, or one that its
+            validation and conversion function depends on, is not stored in the
+            serialized representation, then an exception is raised.
+
+        Returns
+        -------
+        instance_of_current_cls : Current class | `types.MappingProxyType`
+            An instance constructed from the serialized representation, or the
+            partial read-only view of its core attributes if ``fields`` is not
+            set to ``None``.
+
+        """
+        kwargs = {"obj": serialized_rep,
+                  "obj_name": "serialized_rep",
+                  "accepted_types": (str, bytes, bytearray, memoryview)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+        
+        try:
+            serializable_rep = _deserialize(serialized_rep)
+        except Exception:
+            raise ValueError(_pre_serializable_err_msg_10)
+
+        # An embedded digest is verified and stripped, but never used to skip
+        # validation, since no registry of trusted digests is given.
+        kwargs = {"cls": cls,
+                  "serializable_rep": serializable_rep,
+                  "item_digests": None,
+                  "trusted_digests": None}
+        serializable_rep, _ = _verify_and_strip_embedded_digest(**kwargs)
+
+        params = {"fields": \
+                  fields,
+                  "validation_and_conversion_funcs": \
+                  cls.get_validation_and_conversion_funcs()}
+        fields = _check_and_convert_fields(params)
+
+        kwargs = {"serializable_rep": \
+                  serializable_rep,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion}
+        if fields is None:
+            instance_of_current_cls = cls.de_pre_serialize(**kwargs)
+        else:
+            kwargs["array_attrs"] = dict()
+            kwargs["fields"] = fields
+            instance_of_current_cls = cls._de_pre_serialize_projection(**kwargs)
+                
+        return instance_of_current_cls
+
+
+
+    @classmethod
+    def load(cls,
+             filename=\
+             _default_filename,
+             skip_validation_and_conversion=\
+             _default_skip_validation_and_conversion,
+             mmap=\
+             _default_mmap,
+             compression=\
+             _default_compression,
+             trusted_digests=\
+             _default_trusted_digests,
+             fields=\
+             _default_fields):
+        r"""Construct an instance from a serialized representation that is 
+        stored in a JSON file.
+
+        Users can save serialized representations to JSON files using the method
+        :meth:`fancytypes.PreSerializable.dump`.
+
+        The file at the path ``filename`` may also be an archive file, written
+        by calling :meth:`fancytypes.PreSerializable.dump` with ``file_format``
+        set to ``"archive"``. The file format is detected automatically. In the
+        case of an archive file, the core attributes that were stored as raw
+        array data are read back directly, i.e. without being passed to their
+        de-pre-serialization functions.
+
+        If load caching has been enabled for the current class via the method
+        :meth:`~fancytypes.PreSerializable.enable_load_caching`, then loading
+        the same unmodified file repeatedly does not re-read, re-parse, or
+        re-validate the file.
+
+        Parameters
+        ----------
+        filename : `str` | file object, optional
+            The relative or absolute path to the JSON file that is storing the
+            serialized representation of an instance.
+
+            Alternatively, ``filename`` can be an open file object, i.e. any
+            object with a ``read`` method, e.g. a binary or text file, a socket
+            wrapped via :meth:`socket.socket.makefile`, a pipe, or an in-memory
+            buffer such as :class:`io.BytesIO`. In this case, the serialized
+            representation is read and decoded directly from the stream, which
+            need not be seekable, until the end of the stream is reached. The
+            file object is not closed afterwards. If ``filename`` is a text
+            stream, i.e. an instance of :class:`io.TextIOBase`, then it must
+            store an uncompressed JSON document. Otherwise, the stream is
+            treated as a binary stream, whose compression and file format are
+            detected from its leading bytes, as for files.
+
+            ``filename`` is expected to be such that ``json.load(open(filename,
+            "r"))`` does not raise an exception.
+
+            Let ``serializable_rep=json.load(open(filename, "r"))``.
+
+            Let ``validation_and_conversion_funcs`` and
+            ``de_pre_serialization_funcs`` denote the attributes
+            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`
+            respectively, both of which being `dict` objects as well.
+
+            ``filename`` is also expected to be such that
+            ``de_pre_serialization_funcs[key](serializable_rep[key])`` does not
+            raise an exception for each `dict` key ``key`` in
+            ``de_pre_serialization_funcs``.
+
+            Let ``core_attrs_candidate`` be a `dict` object that has the same
+            keys as ``de_pre_serialization_funcs``, where for each `dict` key
+            ``key`` in ``serializable_rep``, ``core_attrs_candidate[key]`` is
+            set to de_pre_serialization_funcs[key](serializable_rep[key])``.
+
+            ``filename`` is also expected to be such that
+            ``validation_and_conversion_funcs[key](core_attrs_candidate)`` does
+            not raise an exception for each `dict` key ``key`` in
+            ``serializable_rep``.
+        skip_validation_and_conversion : `bool`, optional
+            Let ``core_attrs`` denote the attribute
+            :attr:`~fancytypes.Checkable.core_attrs`, which is a `dict` object.
+
+            Let ``core_attrs_candidate`` be as defined in the above description
+            of ``filename``.
+
+            If ``skip_validation_and_conversion`` is set to ``False``, then for
+            each key ``key`` in ``core_attrs_candidate``, ``core_attrs[key]`` is
+            set to ``validation_and_conversion_funcs[key]
+            (core_attrs_candidate)``, , with ``validation_and_conversion_funcs``
+            and ``core_attrs_candidate`` being introduced in the above
+            description of ``filename``.
+
+            Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
+            then ``core_attrs`` is set to ``core_attrs_candidate.copy()``. This
+            option is desired primarily when the user wants to avoid potentially
+            expensive deep copies and/or conversions of the `dict` values of
+            ``core_attrs_candidate``, as it is guaranteed that no copies or
+            conversions are made in this case.
+        mmap : `bool`, optional
+            If ``mmap`` is set to ``True``, then the file at the path
+            ``filename`` must be an archive file, and the core attributes that
+            are stored therein as raw array data are loaded as read-only
+            :class:`numpy.memmap` objects. In this case, their dtypes and shapes
+            are checked against the manifest of the archive, and the file is
+            checked to be large enough to store them. Moreover, if
+            ``skip_validation_and_conversion`` is set to ``False``, then said
+            core attributes are passed to their validation and conversion
+            functions as memory-mapped arrays, like any other core attribute.
+            Whenever the result of such a function is a NumPy array with the
+            same shape and dtype as the memory-mapped array that it was given,
+            the memory-mapped array is stored instead of the result, so that the
+            core attribute remains memory-mapped. Note that pages of
+            memory-mapped arrays are read from the file only once their data is
+            accessed, hence validation and conversion functions that only
+            inspect the shapes and dtypes of arrays do not read the array data.
+            This allows many processes to share a single copy of large array
+            data via the operating system's page cache.
+
+            Otherwise, if ``mmap`` is set to ``False``, then all core attributes
+            are read into memory.
+
+            Compressed files and file objects cannot be memory-mapped.
+        compression : `str`, optional
+            The compression of the file, which can be set to ``"infer"``,
+            ``"none"``, ``"gzip"``, ``"bz2"``, or ``"lzma"``. If
+            ``compression`` is set to ``"infer"``, then the compression is
+            inferred from the leading bytes of the file, or if that fails, from
+            the suffix of ``filename`` if it is a path, as described in the
+            documentation for the method
+            :meth:`~fancytypes.PreSerializable.dump`. The file is decompressed
+            and decoded incrementally, i.e. the full uncompressed text is never
+            held in memory: only the text of one top-level item of the JSON
+            document is buffered at a time.
+        trusted_digests : `None` | `set`, optional
+            The registry of trusted digests, i.e. ``None`` or any container of
+            digests supporting the ``in`` operator, e.g. a `set` of strings
+            generated by the method
+            :meth:`~fancytypes.PreSerializable.compute_digest`.
+
+            If the serialized representation stores an embedded digest, i.e. if
+            it was saved via the method :meth:`~fancytypes.PreSerializable.dump`
+            with ``embed_digest`` set to ``True``, then the digest is first
+            recomputed from the content of the file and the current class, and
+            compared to the embedded digest and class identity. If they do not
+            match, then the file has been corrupted or tampered with, and an
+            exception is raised. Otherwise, if the digest is in
+            ``trusted_digests``, then the instance is constructed as if
+            ``skip_validation_and_conversion`` were set to ``True``, since the
+            content is identical to that of an instance that was already
+            validated. Otherwise, including when ``trusted_digests`` is set to
+            ``None``, the instance is validated according to
+            ``skip_validation_and_conversion``.
+
+            Note that an embedded digest on its own only protects against
+            corruption and accidental modifications, since a malicious party
+            can recompute the digest of tampered content. Hence, validation is
+            only skipped for digests in the registry of trusted digests passed
+            by the caller. If ``trusted_digests`` is not set to ``None``, then
+            load caching is bypassed.
+        fields : `array_like` (`str`, ndim=1) | `None`, optional
+            If ``fields`` is set to ``None``, then an instance of the current
+            class is constructed from the serialized representation.
+
+            Otherwise, ``fields`` specifies the names of the core attributes to
+            be loaded, and a partial, read-only view of the core attributes is
+            returned instead of an instance. See the documentation for the
+            method :meth:`~fancytypes.PreSerializable.loads` for details. In
+            this case, load caching is bypassed.
+
+        Returns
+        -------
+        instance_of_current_cls : Current class | `types.MappingProxyType`
+            An instance constructed from the serialized representation stored
+            in the JSON file, or the partial read-only view of its core
+            attributes if ``fields`` is not set to ``None``.
+
+        """
+        params = {"filename": \
+                  filename,
+                  "name_of_required_method": \
+                  "read",
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "mmap": \
+                  mmap,
+                  "compression": \
+                  compression,
+                  "trusted_digests": \
+                  trusted_digests,
+                  "fields": \
+                  fields,
+                  "validation_and_conversion_funcs": \
+                  cls.get_validation_and_conversion_funcs()}
+        filename = _check_and_convert_filename_or_file_obj(params)
+        skip_validation_and_conversion = \
+            _check_and_convert_skip_validation_and_conversion(params)
+        mmap = _check_and_convert_mmap(params)
+        compression = _check_and_convert_compression(params)
+        trusted_digests = _check_and_convert_trusted_digests(params)
+        fields = _check_and_convert_fields(params)
+
+        kwargs = {"filename": \
+                  filename,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "mmap": \
+                  mmap,
+                  "compression": \
+                  compression}
+        load_cache = cls.__dict__.get("_load_cache_")
+        if (isinstance(filename, str)
+            and (load_cache is not None)
+            and (not mmap)
+            and (trusted_digests is None)
+            and (fields is None)):
+            instance_of_current_cls = cls._load_via_cache(load_cache, **kwargs)
+        else:
+            kwargs["trusted_digests"] = trusted_digests
+            kwargs["fields"] = fields
+            instance_of_current_cls = cls._load(**kwargs)
+                
+        return instance_of_current_cls
+
+
+
+    @classmethod
+    def _load(cls,
+              filename,
+              skip_validation_and_conversion,
+              mmap,
+              compression,
+              trusted_digests,
+              fields):
+        # Projections require the serializable representation in full, since
+        # the core attributes are de-pre-serialized lazily in that case.
+        kwargs = {"mmap": \
+                  mmap,
+                  "compression": \
+                  compression,
+                  "de_pre_serialization_funcs": \
+                  (cls.get_de_pre_serialization_funcs()
+                   if (fields is None)
+                   else None)}
+        
+        if isinstance(filename, str):
+            try:
+                file_obj = open(filename, "rb")
+            except Exception:
+                raise IOError(_pre_serializable_err_msg_11.format(filename))
+            with file_obj:
+                kwargs["file_obj"] = file_obj
+                kwargs["filename"] = filename
+                serializable_rep, array_attrs, item_digests = \
+                    cls._read_file_obj(**kwargs)
+        else:
+            if mmap:
+                raise ValueError(_pre_serializable_err_msg_16)
+            kwargs["file_obj"] = filename
+            kwargs["filename"] = None
+            serializable_rep, array_attrs, item_digests = \
+                cls._read_file_obj(**kwargs)
+
+        kwargs = {"cls": cls,
+                  "serializable_rep": serializable_rep,
+                  "item_digests": item_digests,
+                  "trusted_digests": trusted_digests}
+        serializable_rep, is_trusted = \
+            _verify_and_strip_embedded_digest(**kwargs)
+
+        kwargs = {"serializable_rep": \
+                  serializable_rep,
+                  "array_attrs": \
+                  array_attrs,
+                  "skip_validation_and_conversion": \
+                  (True if is_trusted else skip_validation_and_conversion)}
+        if fields is None:
+            kwargs["mmap"] = mmap
+            instance_of_current_cls = cls._de_pre_serialize(**kwargs)
+        else:
+            kwargs["fields"] = fields
+            instance_of_current_cls = cls._de_pre_serialize_projection(**kwargs)
+                
+        return instance_of_current_cls
+
+
+
+    @classmethod
+    def _load_via_cache(cls,
+                        load_cache,
+                        filename,
+                        skip_validation_and_conversion,
+                        mmap,
+                        compression):
+        kwargs = {"filename": \
+                  filename,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "compression": \
+                  compression}
+        load_cache_key = _generate_load_cache_key(**kwargs)
+        
+        core_attrs = (load_cache.get(load_cache_key)
+                      if (load_cache_key is not None)
+                      else None)
+
+        if core_attrs is None:
+            instance_of_current_cls = cls._load(**kwargs,
+                                                mmap=mmap,
+                                                trusted_digests=None,
+                                                fields=None)
+
+            # The file is only cached if it did not change while being loaded.
+            if ((load_cache_key is not None)
+                and (_generate_load_cache_key(**kwargs) == load_cache_key)):
+                core_attrs = copy.deepcopy(instance_of_current_cls._core_attrs)
+                load_cache.put(load_cache_key, core_attrs)
+        else:
+            kwargs = copy.deepcopy(core_attrs)
+            ctor_param_names = cls.__init__.__code__.co_varnames
+            for key in ("skip_validation_and_conversion", "skip_cls_tests"):
+                if key in ctor_param_names:
+                    kwargs[key] = True
+            instance_of_current_cls = cls(**kwargs)
+
+        return instance_of_current_cls
+
+
+
+    @classmethod
+    def enable_load_caching(cls, capacity=_default_capacity):
+        r"""Enable caching of the instances loaded from files via the method
+        :meth:`~fancytypes.PreSerializable.load`.
+
+        Once load caching is enabled for the current class, each call to the
+        method :meth:`~fancytypes.PreSerializable.load`, with ``filename`` set
+        to a path and ``mmap`` set to ``False``, first looks up the core
+        attributes of the instance in a least-recently-used cache. The cache is
+        keyed on the resolved path of the file, the modification time and size
+        of the file, as well as the parameters
+        ``skip_validation_and_conversion`` and ``compression``. Hence, modifying
+        the file invalidates the corresponding cache entry. Upon a cache hit,
+        the file is neither read, parsed, nor validated: instead, a new instance
+        is constructed from a deep copy of the cached core attributes, without
+        validation or conversion. Upon a cache miss, the instance is loaded as
+        usual, and a deep copy of its core attributes is cached. As such,
+        callers cannot corrupt the cached core attributes via the instances
+        returned by :meth:`~fancytypes.PreSerializable.load`. Note however that
+        a cache hit still costs a deep copy of the cached core attributes,
+        which, for large core attributes, can be a significant fraction of the
+        cost of loading the file.
+
+        Load caching is enabled per class, i.e. the cache of the current class
+        is not shared with its subclasses. Calling this method when load caching
+        is already enabled replaces the existing cache with an empty one.
+
+        Parameters
+        ----------
+        capacity : `int`, optional
+            The maximum number of entries in the cache. Once the number of
+            entries exceeds ``capacity``, the least recently used entry is
+            evicted.
+
+        """
+        params = {"capacity": capacity}
+        capacity = _check_and_convert_capacity(params)
+        
+        cls._load_cache_ = _LRUCache(capacity=capacity)
+
+        return None
+
+
+
+    @classmethod
+    def disable_load_caching(cls):
+        r"""Disable caching of the instances loaded from files, and discard
+        the cache.
+
+        See the documentation for the method
+        :meth:`~fancytypes.PreSerializable.enable_load_caching` for details on
+        load caching.
+
+        """
+        cls._load_cache_ = None
+
+        return None
+
+
+
+    @classmethod
+    def get_load_cache_stats(cls):
+        r"""Return the statistics of the load cache of the current class.
+
+        See the documentation for the method
+        :meth:`~fancytypes.PreSerializable.enable_load_caching` for details on
+        load caching.
+
+        Returns
+        -------
+        load_cache_stats : `dict` | `None`
+            If load caching is disabled for the current class, then
+            ``load_cache_stats`` is set to ``None``. Otherwise,
+            ``load_cache_stats`` is a `dict` object with the keys
+            ``"capacity"``, ``"num_entries"``, ``"num_hits"``, and
+            ``"num_misses"``, which store the capacity of the cache, the
+            current number of entries in the cache, and the number of cache hits
+            and misses since load caching was last enabled, respectively.
+
+        """
+        load_cache = cls.__dict__.get("_load_cache_")
+        load_cache_stats = (load_cache.get_stats()
+                            if (load_cache is not None)
+                            else None)
+
+        return load_cache_stats
+
+
+
+    @classmethod
+    def _read_file_obj(cls,
+                       file_obj,
+                       filename,
+                       mmap,
+                       compression,
+                       de_pre_serialization_funcs):
+        # ``filename`` is ``None`` if ``file_obj`` was passed in by the user.
+        # If ``de_pre_serialization_funcs`` is not ``None``, then the items of
+        # JSON documents are de-pre-serialized while being read, and returned
+        # along with the core attributes stored as raw array data in archives,
+        # since neither need to be de-pre-serialized afterwards.
+        err_msg = (_pre_serializable_err_msg_17
+                   if (filename is None)
+                   else _pre_serializable_err_msg_11.format(filename))
+
+        if isinstance(file_obj, io.TextIOBase):
+            if compression not in ("infer", "none"):
+                raise ValueError(_pre_serializable_err_msg_14)
+            read_text = file_obj.read
+            file_format = "json"
+        else:
+            try:
+                kwargs = {"file_obj": file_obj,
+                          "filename": filename,
+                          "compression": compression}
+                file_obj, compression, file_format = \
+                    _open_binary_stream_for_reading(**kwargs)
+            except Exception:
+                raise IOError(err_msg)
+
+            if mmap and (file_format != "archive"):
+                raise ValueError(_pre_serializable_err_msg_12.format(filename))
+            if mmap and (compression != "none"):
+                raise ValueError(_pre_serializable_err_msg_13.format(filename))
+
+            kwargs = {"read_bytes": file_obj.read, "encoding": "utf-8"}
+            read_text = _generate_read_text_func(**kwargs)
+
+        item_digests = None
+        de_pre_serialization_err = None
+
+        try:
+            if (file_format == "json") and (de_pre_serialization_funcs is None):
+                serializable_rep = _read_json_obj(read_text)
+                array_attrs = dict()
+            elif file_format == "json":
+                kwargs = {"read_text": read_text,
+                          "de_pre_serialization_funcs": \
+                          de_pre_serialization_funcs}
+                results = _read_and_de_pre_serialize_json_obj(**kwargs)
+                serializable_rep, array_attrs, item_digests = results[:3]
+                de_pre_serialization_err = results[3]
+            elif file_format == "journal":
+                serializable_rep = _read_journal(file_obj)
+                array_attrs = dict()
+            else:
+                serializable_rep, array_attrs = _read_archive(filename,
+                                                              file_obj,
+                                                              mmap)
+        except Exception:
+            raise IOError(err_msg)
+
+        if de_pre_serialization_err is not None:
+            raise ValueError(_pre_serializable_err_msg_7) \
+                from de_pre_serialization_err
+
+        return serializable_rep, array_attrs, item_digests
+
+
+
+def _check_and_convert_compaction_threshold(params):
+    obj_name = "compaction_threshold"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    compaction_threshold = czekitout.convert.to_nonnegative_int(**kwargs)
+
+    return compaction_threshold
+
+
+
+_default_patch = _default_new_core_attr_subset_candidate
+_default_journal_filename = "journal_of_fancytype.jsonl"
+_default_compaction_threshold = 2**20
+_default_serialized_patch = str(_default_patch)
+
+
+
+class PreSerializableAndUpdatable(PreSerializable, Updatable):
+    r"""A type that is pre-serializable, that can be constructed from a 
+    serializable representation, that can perform user-defined validations 
+    and conversions of a set of parameters upon construction, and that has an
+    updatable subset of attributes.
+
+    We define pre-serialization as the process of converting an object into a
+    form that can be subsequently serialized into a JSON format. We refer to
+    objects resulting from pre-serialization as serializable objects.
+
+    We define de-pre-serialization as the process of converting a serializable
+    object into an instance of the current class, i.e. de-pre-serialization is
+    the reverse process of pre-serialization.
+
+    One cannot construct an instance of the class
+    :class:`fancytypes.PreSerializableAndUpdatable` without raising an
+    exception. In order to make use of this class, one must create a subclass
+    that inherits from :class:`fancytypes.PreSerializableAndUpdatable` and then
+    override the class methods
+    :class:`~fancytypes.Checkable.get_validation_and_conversion_funcs`,
+    :class:`~fancytypes.PreSerializable.pre_serialization_funcs`, and
+    :class:`~fancytypes.PreSerializable.de_pre_serialization_funcs` in ways that
+    are consistent with the respective descriptions of the methods.
+
+    Parameters
+    ----------
+    skip_validation_and_conversion : `bool`, optional
+        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
+        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
+        and :attr:`~fancytypes.Checkable.core_attrs` respectively, both of which
+        being `dict` objects.
+
+        Let ``params_to_be_mapped_to_core_attrs`` denote the `dict`
+        representation of the constructor parameters excluding the parameters
+        ``skip_validation_and_conversion`` and ``skip_cls_tests``, where each
+        `dict` key ``key`` is a different constructor parameter name, excluding
+        the names ``"skip_validation_and_conversion"`` and ``"skip_cls_tests"``,
+        and ``params_to_be_mapped_to_core_attrs[key]`` would yield the value of
+        the constructor parameter with the name given by ``key``.
+
+        If ``skip_validation_and_conversion`` is set to ``False``, then for each
+        key ``key`` in ``params_to_be_mapped_to_core_attrs``,
+        ``core_attrs[key]`` is set to ``validation_and_conversion_funcs[key]
+        (params_to_be_mapped_to_core_attrs)``.
+
+        Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
+        then ``core_attrs`` is set to
+        ``params_to_be_mapped_to_core_attrs.copy()``. This option is desired
+        primarily when the user wants to avoid potentially expensive deep copies
+        and/or conversions of the `dict` values of
+        ``params_to_be_mapped_to_core_attrs``, as it is guaranteed that no
+        copies or conversions are made in this case.  
+    skip_cls_test : `bool`, optional
+        If ``skip_cls_test`` is set to ``False``, then upon construction, tests
+        will be performed to check whether the class was properly
+        defined. If any of the tests fail, an exception will be raised.
+
+        Otherwise, if ``skip_cls_test`` is set to ``True``, these tests will be
+        skipped. 
+
+        One should only skip the tests if they are sure that the class is
+        properly defined. Skipping the tests will yield some improvement in
+        performance.
+    **kwargs 
+        The remaining constructor parameters.
+
+    """
+    def __init__(self,
+                 skip_validation_and_conversion=\
+                 _default_skip_validation_and_conversion,
+                 skip_cls_tests=\
+                 _default_skip_cls_tests,
+                 **kwargs):
+        self._journal = None
+        
+        PreSerializable.__init__(self,
+                                 skip_validation_and_conversion,
+                                 skip_cls_tests,
+                                 **kwargs)
+        
+        return None
+
+
+
+    def __getstate__(self):
+        # Copies of the current instance, e.g. those made via
+        # :func:`copy.deepcopy` or :mod:`pickle`, do not write to the journal
+        # of the current instance.
+        state = super().__getstate__()
+        state["_journal"] = None
+
+        return state
+
+
+
+    def enable_journaling(self,
+                          filename=\
+                          _default_journal_filename,
+                          overwrite=\
+                          _default_overwrite,
+                          compaction_threshold=\
+                          _default_compaction_threshold,
+                          fsync_policy=\
+                          _default_fsync_policy):
+        r"""Persist the current instance in an append-only journal file.
+
+        Upon enabling journaling, a snapshot of the serializable representation
+        of the current instance is written atomically to the journal file at
+        the path ``filename``, in the same way as in the method
+        :meth:`~fancytypes.PreSerializable.dump`. Afterwards, every call to the
+        method :meth:`~fancytypes.Updatable.update` appends a record to the
+        journal file that stores only the updated core attributes, in
+        pre-serialized form. Hence, the cost of persisting an update is
+        proportional to the size of the update, rather than to the size of the
+        current instance.
+
+        Once the total size of the appended records exceeds
+        ``compaction_threshold``, the journal is compacted, i.e. a new snapshot
+        of the current instance is written atomically, replacing the previous
+        snapshot and records.
+
+        Journal files can be loaded using the method
+        :meth:`~fancytypes.PreSerializable.load`, which detects journal files
+        automatically, and replays the records on top of the snapshot, such that
+        the core attributes are validated and converted only once. If the last
+        record is incomplete, e.g. due to a crash while it was being appended,
+        then it is discarded.
+
+        Parameters
+        ----------
+        filename : `str`, optional
+            The relative or absolute path to the journal file.
+        overwrite : `bool`, optional
+            If ``overwrite`` is set to ``False`` and a file exists at the path
+            ``filename``, then journaling is not enabled and an exception is
+            raised. Otherwise, the file is overwritten.
+        compaction_threshold : `int`, optional
+            The size in bytes that the appended records must exceed in total
+            in order for the journal to be compacted. Must be nonnegative. For
+            the amortized cost of compaction per update to remain proportional
+            to the size of the update, ``compaction_threshold`` should be at
+            least as large as a snapshot.
+        fsync_policy : ``"none"`` | ``"file"`` | ``"file_and_dir"``, optional
+            The policy for flushing the journal file to disk, which applies to
+            both snapshots and appended records. See the documentation for the
+            method :meth:`~fancytypes.PreSerializable.dump` for details.
+
+        Returns
+        -------
+
+        """
+        params = {key: val
+                  for key, val in locals().items()
+                  if (key not in ("self", "__class__"))}
+        filename = _check_and_convert_filename(params)
+        overwrite = _check_and_convert_overwrite(params)
+        compaction_threshold = _check_and_convert_compaction_threshold(params)
+        fsync_policy = _check_and_convert_fsync_policy(params)
+
+        if pathlib.Path(filename).is_file():
+            if not overwrite:
+                err_msg = _pre_serializable_and_updatable_err_msg_4
+                raise IOError(err_msg.format(filename))
+
+        self.disable_journaling()
+
+        journal = _Journal(filename, compaction_threshold, fsync_policy)
+        try:
+            journal.write_snapshot(serializable_rep=self.pre_serialize())
+        except:
+            err_msg = _pre_serializable_and_updatable_err_msg_5
+            raise IOError(err_msg.format(filename))
+        self._journal = journal
+
+        return None
+
+
+
+    def disable_journaling(self):
+        r"""Stop persisting the current instance in its journal file.
+
+        The journal file is left as is. If journaling is not enabled, then
+        calling this method has no effect.
+
+        Returns
+        -------
+
+        """
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+        return None
+
+
+
+    def _handle_core_attr_subset_update(self, names_of_updated_core_attrs):
+        # The journal is written before the subscribers are notified, so that
+        # it reflects the current instance even if a callback raises an
+        # exception. Conversely, the undo/redo history is recorded and the
+        # subscribers are notified even if the journal cannot be written to.
+        journal_write_failed = False
+        
+        if (self._journal is not None) and names_of_updated_core_attrs:
+            try:
+                if self._journal.requires_compaction():
+                    serializable_rep = self.pre_serialize()
+                    self._journal.write_snapshot(serializable_rep)
+                else:
+                    kwargs = {"core_attr_names": names_of_updated_core_attrs}
+                    serializable_rep_subset = \
+                        self._pre_serialize_core_attr_subset(**kwargs)
+                    self._journal.append_update_record(serializable_rep_subset)
+            except:
+                # The journal no longer reflects the current instance, hence
+                # it cannot be written to any further.
+                self.disable_journaling()
+                journal_write_failed = True
+
+        super()._handle_core_attr_subset_update(names_of_updated_core_attrs)
+
+        if journal_write_failed:
+            raise IOError(_pre_serializable_and_updatable_err_msg_6)
+
+        return None
+
+
+
+    def diff(self, other):
+        r"""Return a patch that transforms the current instance into another.
+
+        The patch stores only the core attributes that differ between the two
+        instances, in pre-serialized form. Core attributes that are the same
+        object in both instances are assumed to be equal, and are hence not
+        pre-serialized. The patch can be applied to the current instance, or to
+        any instance that is equivalent to it, e.g. a copy living in another
+        process, via the method
+        :meth:`~fancytypes.PreSerializableAndUpdatable.apply_patch`.
+
+        Parameters
+        ----------
+        other : Current class
+            The instance into which the patch transforms the current instance.
+
+        Returns
+        -------
+        patch : `dict`
+            The patch, which is a serializable `dict` object. For each `dict`
+            key ``key`` in ``patch``, ``patch[key]`` is the pre-serialized value
+            of the core attribute of ``other`` named ``key``.
+
+        """
+        kwargs = {"obj": other,
+                  "obj_name": "other",
+                  "accepted_types": (type(self),)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+
+        core_attr_names = \
+            tuple(core_attr_name
+                  for core_attr_name, core_attr in self._core_attrs.items()
+                  if core_attr is not other._core_attrs[core_attr_name])
+
+        kwargs = {"core_attr_names": core_attr_names}
+        old_serializable_rep = self._pre_serialize_core_attr_subset(**kwargs)
+        new_serializable_rep = other._pre_serialize_core_attr_subset(**kwargs)
+
+        patch = {core_attr_name: new_serializable_rep[core_attr_name]
+                 for core_attr_name in core_attr_names
+                 if (new_serializable_rep[core_attr_name]
+                     != old_serializable_rep[core_attr_name])}
+
+        return patch
+
+
+
+    def dumps_diff(self, other):
+        r"""Return a serialized patch that transforms the current instance into 
+        another.
+
+        See the documentation for the method
+        :meth:`~fancytypes.PreSerializableAndUpdatable.diff` for details.
+
+        Parameters
+        ----------
+        other : Current class
+            The instance into which the patch transforms the current instance.
+
+        Returns
+        -------
+        serialized_patch : `str`
+            The serialized patch, which can be applied via the method
+            :meth:`~fancytypes.PreSerializableAndUpdatable.apply_serialized_patch`.
+
+        """
+        patch = self.diff(other)
+        serialized_patch = json.dumps(patch)
+
+        return serialized_patch
+
+
+
+    def apply_patch(self,
+                    patch=\
+                    _default_patch,
+                    skip_validation_and_conversion=\
+                    _default_skip_validation_and_conversion):
+        r"""Apply a patch to the current instance.
+
+        Users can generate patches using the method
+        :meth:`~fancytypes.PreSerializableAndUpdatable.diff`.
+
+        The patch is applied by de-pre-serializing the core attributes that it
+        stores, and then passing the result to the method
+        :meth:`~fancytypes.Updatable.update`. Hence, only the core attributes
+        touched by the patch are validated and converted. If an exception is
+        raised, then the current instance is left unchanged.
+
+        Parameters
+        ----------
+        patch : `dict`, optional
+            The patch. Every `dict` key of ``patch`` must be the name of a core
+            attribute of the current instance.
+        skip_validation_and_conversion : `bool`, optional
+            Let ``de_pre_serialization_funcs`` denote the attribute
+            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`, and
+            let ``new_core_attr_subset_candidate`` be a `dict` object that has
+            the same keys as ``patch``, where for each `dict` key ``key`` in
+            ``patch``, ``new_core_attr_subset_candidate[key]`` is set to
+            ``de_pre_serialization_funcs[key](patch[key])``. 
+
+            The current instance is updated by calling
+            ``self.update(new_core_attr_subset_candidate,
+            skip_validation_and_conversion)``.
+
+        """
+        kwargs = {"obj": patch, "obj_name": "patch"}
+        czekitout.check.if_dict_like(**kwargs)
+
+        for core_attr_name in patch:
+            if core_attr_name not in self._core_attrs:
+                err_msg = _pre_serializable_and_updatable_err_msg_1
+                raise ValueError(err_msg.format(core_attr_name))
+
+        try:
+            new_core_attr_subset_candidate = dict()
+            for core_attr_name, elem_of_patch in patch.items():
+                de_pre_serialization_func = \
+                    self._de_pre_serialization_funcs[core_attr_name]
+                new_core_attr_subset_candidate[core_attr_name] = \
+                    de_pre_serialization_func(elem_of_patch)
+
+            kwargs = {"new_core_attr_subset_candidate": \
+                      new_core_attr_subset_candidate,
+                      "skip_validation_and_conversion": \
+                      skip_validation_and_conversion}
+            self.update(**kwargs)
+        except:
+            raise ValueError(_pre_serializable_and_updatable_err_msg_2)
+
+        return None
+
+
+
+    def apply_serialized_patch(self,
+                               serialized_patch=\
+                               _default_serialized_patch,
+                               skip_validation_and_conversion=\
+                               _default_skip_validation_and_conversion):
+        r"""Apply a serialized patch to the current instance.
+
+        Users can generate serialized patches using the method
+        :meth:`~fancytypes.PreSerializableAndUpdatable.dumps_diff`.
+
+        Parameters
+        ----------
+        serialized_patch : `str` | `bytes` | `bytearray` | `memoryview`, optional
+            The serialized patch, which is deserialized in the same way as the
+            object ``serialized_rep`` in the method
+            :meth:`~fancytypes.PreSerializable.loads`.
+        skip_validation_and_conversion : `bool`, optional
+            See the documentation for the method
+            :meth:`~fancytypes.PreSerializableAndUpdatable.apply_patch`.
+
+        """
+        kwargs = {"obj": serialized_patch,
+                  "obj_name": "serialized_patch",
+                  "accepted_types": (str, bytes, bytearray, memoryview)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+
+        try:
+            patch = _deserialize(serialized_patch)
+        except:
+            raise ValueError(_pre_serializable_and_updatable_err_msg_3)
+
+        kwargs = {"patch": \
+                  patch,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion}
+        self.apply_patch(**kwargs)
+
+        return None
+
+
+
+def _check_and_convert_fancytype_instances(params):
+    obj_name = "fancytype_instances"
+    kwargs = {"obj": params[obj_name],
+              "obj_name": obj_name,
+              "accepted_types": (list, tuple)}
+    czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+    fancytype_instances = tuple(params[obj_name])
+
+    for fancytype_instance in fancytype_instances:
+        kwargs = {"obj": fancytype_instance,
+                  "obj_name": "fancytype_instance",
+                  "accepted_types": (PreSerializable,)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+
+    return fancytype_instances
+
+
+
+def _check_and_convert_filenames(params):
+    obj_name = "filenames"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    filenames = czekitout.convert.to_tuple_of_strs(**kwargs)
+
+    num_fancytype_instances = len(params["fancytype_instances"])
+
+    current_func_name = "_check_and_convert_filenames"
+
+    if len(filenames) != num_fancytype_instances:
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise ValueError(err_msg)
+
+    resolved_filenames = {str(pathlib.Path(filename).resolve())
+                          for filename in filenames}
+    if len(resolved_filenames) != len(filenames):
+        err_msg = globals()[current_func_name+"_err_msg_2"]
+        raise ValueError(err_msg)
+
+    return filenames
+
+
+
+_default_filenames = tuple()
+
+
+
+def batch_dump(fancytype_instances=_default_fancytype_instances,
+               filenames=_default_filenames,
+               overwrite=_default_overwrite,
+               file_format=_default_file_format,
+               fsync_policy=_default_fsync_policy,
+               compression=_default_compression,
+               deduplicate=_default_deduplicate):
+    r"""Serialize multiple instances and save the results in separate files,
+    committing all files together.
+
+    This function is equivalent to calling the method
+    :meth:`~fancytypes.PreSerializable.dump` once per instance, except that
+    every serialized representation is first written to a temporary file, and
+    only after all temporary files have been written successfully are they
+    renamed to their target files. Moreover, if ``fsync_policy`` is set to
+    ``"file_and_dir"``, then each distinct directory containing target files is
+    flushed to disk only once, after all renames, rather than once per file.
+
+    If an error occurs while writing the temporary files, then all temporary
+    files are removed, and no target file is modified.
+
+    Parameters
+    ----------
+    fancytype_instances : `list` | `tuple`, optional
+        The instances to serialize, each of which being an instance of the class
+        :class:`fancytypes.PreSerializable`.
+    filenames : `array_like` (`str`, ndim=1), optional
+        The relative or absolute paths to the files in which to store the
+        serialized representations, where ``filenames[i]`` is the path for
+        ``fancytype_instances[i]``. The paths must be distinct, and the number
+        of paths must be equal to the number of instances.
+    overwrite : `bool`, optional
+        If ``overwrite`` is set to ``False`` and a file exists at any of the
+        paths in ``filenames``, then no serialized instance is written and an
+        exception is raised. Otherwise, the serialized instances will be
+        written barring no other issues occur.
+    file_format : ``"json"`` | ``"archive"``, optional
+        The file format, as described in the documentation for the method
+        :meth:`~fancytypes.PreSerializable.dump`.
+    fsync_policy : ``"none"`` | ``"file"`` | ``"file_and_dir"``, optional
+        The fsync policy, as described in the documentation for the method
+        :meth:`~fancytypes.PreSerializable.dump`.
+    compression : `str`, optional
+        The compression, as described in the documentation for the method
+        :meth:`~fancytypes.PreSerializable.dump`. If ``compression`` is set to
+        ``"infer"``, then the compression is inferred separately for each file.
+    deduplicate : `bool`, optional
+        If ``deduplicate`` is set to ``True``, then objects that occur more than
+        once in any given instance are serialized only once in the file
+        storing said instance, as described in the documentation for the method
+        :meth:`~fancytypes.PreSerializable.dump`. Otherwise, each occurrence of
+        an object is serialized separately.
+
+    Returns
+    -------
+
+    """
+    params = locals()
+    fancytype_instances = _check_and_convert_fancytype_instances(params)
+    filenames = _check_and_convert_filenames(params)
+    overwrite = _check_and_convert_overwrite(params)
+    file_format = _check_and_convert_file_format(params)
+    fsync_policy = _check_and_convert_fsync_policy(params)
+    compression = _check_and_convert_compression(params)
+    deduplicate = _check_and_convert_deduplicate(params)
+
+    for filename in filenames:
+        if pathlib.Path(filename).is_file():
+            if not overwrite:
+                raise IOError(_batch_dump_err_msg_1.format(filename))
+
+    serializable_reps = tuple()
+    array_attr_sets = tuple()
+    for fancytype_instance in fancytype_instances:
+        kwargs = {"file_format": file_format, "deduplicate": deduplicate}
+        method_alias = fancytype_instance._pre_serialize_for_dump
+        serializable_rep, array_attrs = method_alias(**kwargs)
+        serializable_reps += (serializable_rep,)
+        array_attr_sets += (array_attrs,)
+
+    try:
+        kwargs = {"filenames": filenames,
+                  "serializable_reps": serializable_reps,
+                  "array_attr_sets": array_attr_sets,
+                  "file_format": file_format,
+                  "fsync_policy": fsync_policy,
+                  "compression": compression}
+        _dump_atomically(**kwargs)
+    except:
+        raise IOError(_batch_dump_err_msg_2)
+
+    return None
+
+
+
+def _check_and_convert_base(params):
+    obj_name = "base"
+    obj = params[obj_name]
+
+    current_func_name = "_check_and_convert_base"
+
+    if not isinstance(obj, Checkable):
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise TypeError(err_msg)
+
+    base = obj
+
+    return base
+
+
+
+def _check_and_convert_axes(params):
+    obj_name = "axes"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    axes = czekitout.convert.to_dict(**kwargs).copy()
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = "_check_and_convert_axes"
+
+    for key in axes:
+        if key not in validation_and_conversion_funcs:
+            unformatted_err_msg = globals()[current_func_name+"_err_msg_1"]
+            err_msg = unformatted_err_msg.format(key)
+            raise KeyError(err_msg)
+        axes[key] = tuple(axes[key])
+
+    return axes
+
+
+
+_default_axes = dict()
+
+
+
+def sweep(base, axes=_default_axes):
+    r"""Generate the variants of an instance over a grid of core attribute
+    values.
+
+    The variants are generated lazily, in the order of the Cartesian product
+    of the axes, where the last axis varies the fastest. Each variant is an
+    instance of the same class as ``base``, whose core attributes are those of
+    ``base``, except for the swept core attributes, which are set to the values
+    of the corresponding grid point.
+
+    The variants are copied from ``base`` rather than constructed, hence the
+    tests of the class are never run. The copies inherit neither the
+    subscribers, the undo/redo history, nor the journal of ``base``, if any.
+    Moreover, core attributes are not validated and converted more than
+    needed. A core attribute is said to vary if it is swept, or if it is
+    validated and converted once per variant. Let ``name`` be the name of a
+    core attribute. If the validation and conversion function of ``name``
+    depends on other varying core attributes, then the core attribute ``name``
+    is validated and converted once per variant, in the same order as upon
+    construction. Otherwise, if ``name`` is swept, each value of its axis is
+    validated and converted only once, rather than once per variant; and if
+    ``name`` is not swept, its value is taken from ``base``, without being
+    validated and converted again. A validation and conversion function is
+    assumed to depend on every core attribute, unless it has been marked as
+    memoizable via the function :func:`fancytypes.mark_as_memoizable`, in
+    which case it depends only on the relevant core attributes given upon
+    marking it.
+
+    The core attributes of each variant that are not validated and converted
+    again are shared with ``base``, rather than copied, hence they should be
+    considered **read-only**.
+
+    Parameters
+    ----------
+    base : :class:`fancytypes.Checkable`
+        The base instance.
+    axes : `dict`, optional
+        The axes of the grid. Each key of ``axes`` must be the name of a core
+        attribute of ``base``, and each value of ``axes`` is an iterable of the
+        values of the corresponding core attribute to sweep over. If ``axes``
+        is empty, then a single variant is generated, with the same core
+        attributes as ``base``.
+
+    Returns
+    -------
+    variants : `iterator`
+        An iterator over the variants.
+
+    """
+    params = locals()
+    base = _check_and_convert_base(params)
+    params["validation_and_conversion_funcs"] = \
+        base._validation_and_conversion_funcs
+    axes = _check_and_convert_axes(params)
+
+    variants = _generate_variants(base, axes)
+
+    return variants
+
+
+
+def _generate_variants(base, axes):
+    base_core_attrs = base._core_attrs
+    validation_and_conversion_funcs = base._validation_and_conversion_funcs
+    validator_cache = type(base).__dict__.get("_validator_cache_")
+
+    kwargs = {"names_of_swept_core_attrs": tuple(axes),
+              "validation_and_conversion_funcs": \
+              validation_and_conversion_funcs}
+    names_of_core_attrs_to_check_and_convert_per_variant = \
+        _return_names_of_core_attrs_to_check_and_convert_per_variant(**kwargs)
+
+    for key in axes:
+        if key not in names_of_core_attrs_to_check_and_convert_per_variant:
+            kwargs = {"key": key,
+                      "axis": axes[key],
+                      "base_core_attrs": base_core_attrs,
+                      "validation_and_conversion_func": \
+                      validation_and_conversion_funcs[key],
+                      "validator_cache": validator_cache}
+            axes[key] = _validate_and_convert_axis(**kwargs)
+
+    for grid_point in itertools.product(*axes.values()):
+        core_attrs_candidate = base_core_attrs.copy()
+        core_attrs_candidate.update(zip(axes, grid_point))
+
+        params = {"core_attrs_candidate": \
+                  core_attrs_candidate,
+                  "validation_and_conversion_funcs": \
+                  validation_and_conversion_funcs,
+                  "names_of_core_attrs_to_check_and_convert": \
+                  names_of_core_attrs_to_check_and_convert_per_variant,
+                  "validator_cache": \
+                  validator_cache}
+        core_attrs = _check_and_convert_subset_of_core_attrs_candidate(params)
+
+        # The variants are copied from ``base`` rather than constructed, so
+        # that the tests of the class are never run, regardless of whether the
+        # constructor of the class exposes the parameter ``skip_cls_tests``.
+        # Copying resets the subscribers and the undo/redo history, as well as
+        # the journal, if any.
+        variant = copy.copy(base)
+        variant._core_attrs = core_attrs
+
+        yield variant
+
+
+
+def _return_names_of_core_attrs_to_check_and_convert_per_variant(
+        names_of_swept_core_attrs, validation_and_conversion_funcs):
+    names_of_varying_core_attrs = set(names_of_swept_core_attrs)
+    names_of_core_attrs_found = tuple()
+    
+    # A core attribute is validated and converted once per variant if its
+    # validation and conversion function depends on another swept core
+    # attribute, or on another core attribute that is itself validated and
+    # converted once per variant, since the value of the latter may then differ
+    # from that of ``base``.
+    num_names_found_during_last_pass = None
+    
+    while num_names_found_during_last_pass != 0:
+        num_names_found_during_last_pass = 0
+        
+        for key in validation_and_conversion_funcs:
+            validation_and_conversion_func = \
+                validation_and_conversion_funcs[key]
+            relevant_attr_names = \
+                getattr(validation_and_conversion_func,
+                        _name_of_attr_storing_relevant_attr_names,
+                        validation_and_conversion_funcs.keys())
+            depends_on_other_varying_core_attrs = \
+                bool((set(relevant_attr_names) - {key})
+                     & names_of_varying_core_attrs)
+            
+            if ((key not in names_of_core_attrs_found)
+                and depends_on_other_varying_core_attrs):
+                names_of_core_attrs_found += (key,)
+                names_of_varying_core_attrs.add(key)
+                num_names_found_during_last_pass += 1
+
+    # The core attributes are validated and converted in the same order as upon
+    # construction.
+    names_of_core_attrs_to_check_and_convert_per_variant = \
+        tuple(key
+              for key in validation_and_conversion_funcs
+              if key in names_of_core_attrs_found)
+
+    return names_of_core_attrs_to_check_and_convert_per_variant
+
+
+
+def _validate_and_convert_axis(key,
+                               axis,
+                               base_core_attrs,
+                               validation_and_conversion_func,
+                               validator_cache):
+    validated_and_converted_axis = tuple()
+    
+    for core_attr_candidate in axis:
+        kwargs = {"validation_and_conversion_func": \
+                  validation_and_conversion_func,
+                  "core_attrs_candidate": \
+                  {**base_core_attrs, key: core_attr_candidate},
+                  "validator_cache": \
+                  validator_cache}
+        core_attr = _call_validation_and_conversion_func(**kwargs)
+        validated_and_converted_axis += (core_attr,)
+
+    return validated_and_converted_axis
+
+
+
+def _check_and_convert_fancytype_cls(params):
+    obj_name = "fancytype_cls"
+    obj = params[obj_name]
+
+    current_func_name = "_check_and_convert_fancytype_cls"
+
+    if not (isinstance(obj, type) and issubclass(obj, Checkable)):
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise TypeError(err_msg)
+
+    fancytype_cls = obj
+
+    return fancytype_cls
+
+
+
+def _check_and_convert_columns(params):
+    obj_name = "columns"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    columns = czekitout.convert.to_dict(**kwargs).copy()
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = "_check_and_convert_columns"
+
+    if len(columns) == 0:
+        columns = {core_attr_name: tuple()
+                   for core_attr_name in validation_and_conversion_funcs}
+
+    if set(columns) != set(validation_and_conversion_funcs):
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise KeyError(err_msg)
+
+    if len(set(len(column) for column in columns.values())) > 1:
+        err_msg = globals()[current_func_name+"_err_msg_2"]
+        raise ValueError(err_msg)
+
+    return columns
+
+
+
+def _check_and_convert_column_validation_and_conversion_funcs(params):
+    obj_name = "column_validation_and_conversion_funcs"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    column_validation_and_conversion_funcs = \
+        czekitout.convert.to_dict(**kwargs).copy()
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = \
+        "_check_and_convert_column_validation_and_conversion_funcs"
+
+    for key in column_validation_and_conversion_funcs:
+        if key not in validation_and_conversion_funcs:
+            unformatted_err_msg = globals()[current_func_name+"_err_msg_1"]
+            err_msg = unformatted_err_msg.format(key)
+            raise KeyError(err_msg)
         
-            try:
-                method_alias = self._construct_core_attrs_candidate
-                kwargs = {"serializable_rep": \
-                          serializable_rep,
-                          "de_pre_serialization_funcs": \
-                          self._de_pre_serialization_funcs}
-                core_attrs_candidate = method_alias(**kwargs)
+        kwargs = {"obj": column_validation_and_conversion_funcs[key],
+                  "obj_name": obj_name+"['"+key+"']"}
+        czekitout.check.if_callable(**kwargs)
 
-                params = {"core_attrs_candidate": \
-                          core_attrs_candidate,
-                          "name_of_obj_alias_of_core_attrs_candidate": \
-                          "core_attrs_candidate",
-                          "validation_and_conversion_funcs": \
-                          self._validation_and_conversion_funcs}
-                _ =_check_and_convert_core_attrs_candidate(params)
-            except:
-                raise ValueError(_pre_serializable_err_msg_2)
+    return column_validation_and_conversion_funcs
+
+
+
+def _validate_and_convert_columns(columns,
+                                  num_rows,
+                                  validation_and_conversion_funcs,
+                                  column_validation_and_conversion_funcs,
+                                  skip_failed_rows=False):
+    # If ``skip_failed_rows`` is set to ``True``, then the rows that fail
+    # validation and conversion are removed from the columns instead of an
+    # exception being raised, and the positions of said rows are returned
+    # alongside the columns. A row that fails a row-level validation and
+    # conversion is removed on its own, whereas a failing column-level
+    # validation and conversion cannot be attributed to any particular row,
+    # and thus all remaining rows are removed.
+    columns = columns.copy()
+    row_positions = tuple(range(num_rows))
+    failed_row_positions = tuple()
+
+    # The core attributes are validated and converted in the same order as in
+    # the construction of a single instance. Consecutive core attributes
+    # without column-level validation and conversion functions are validated
+    # and converted together, in a single pass over the rows.
+    key_func = column_validation_and_conversion_funcs.__contains__
+    groupby_obj = itertools.groupby(validation_and_conversion_funcs, key_func)
+    
+    for has_column_validation_and_conversion_funcs, keys in groupby_obj:
+        keys = tuple(keys)
         
-        return None
+        if has_column_validation_and_conversion_funcs:
+            for key in keys:
+                kwargs = {"column_validation_and_conversion_func": \
+                          column_validation_and_conversion_funcs[key],
+                          "columns": columns,
+                          "num_rows": len(row_positions),
+                          "key": key}
+                if skip_failed_rows:
+                    try:
+                        column = _validate_and_convert_column(**kwargs)
+                    except Exception:
+                        column = None
+                else:
+                    column = _validate_and_convert_column(**kwargs)
+
+                if column is None:
+                    failed_row_positions += row_positions
+                    row_positions = tuple()
+                    columns = _select_rows_of_columns(columns, tuple())
+                else:
+                    columns[key] = column
+        else:
+            new_columns = {key: [] for key in keys}
+            positions_of_rows_to_keep = tuple()
+            
+            for position_in_columns, row_position in enumerate(row_positions):
+                kwargs = {"columns": columns,
+                          "row_idx": position_in_columns,
+                          "keys": keys,
+                          "validation_and_conversion_funcs": \
+                          validation_and_conversion_funcs}
+                if skip_failed_rows:
+                    try:
+                        row = _validate_and_convert_row_of_columns(**kwargs)
+                    except Exception:
+                        row = None
+                else:
+                    row = _validate_and_convert_row_of_columns(**kwargs)
+
+                if row is None:
+                    failed_row_positions += (row_position,)
+                else:
+                    positions_of_rows_to_keep += (position_in_columns,)
+                    for key in keys:
+                        new_columns[key].append(row[key])
+
+            if len(positions_of_rows_to_keep) < len(row_positions):
+                row_positions = tuple(row_positions[position_in_columns]
+                                      for position_in_columns
+                                      in positions_of_rows_to_keep)
+                columns = _select_rows_of_columns(columns,
+                                                  positions_of_rows_to_keep)
+            columns.update(new_columns)
+
+    failed_row_positions = tuple(sorted(failed_row_positions))
+
+    return columns, failed_row_positions
+
+
+
+def _validate_and_convert_column(column_validation_and_conversion_func,
+                                 columns,
+                                 num_rows,
+                                 key):
+    current_func_name = "_validate_and_convert_column"
+
+    kwargs = {"params": columns}
+    column = column_validation_and_conversion_func(**kwargs)
+    if len(column) != num_rows:
+        unformatted_err_msg = globals()[current_func_name+"_err_msg_1"]
+        err_msg = unformatted_err_msg.format(key)
+        raise ValueError(err_msg)
+
+    return column
+
+
+
+def _validate_and_convert_row_of_columns(columns,
+                                         row_idx,
+                                         keys,
+                                         validation_and_conversion_funcs):
+    core_attrs_candidate = {core_attr_name: column[row_idx]
+                            for core_attr_name, column
+                            in columns.items()}
+    for key in keys:
+        validation_and_conversion_func = validation_and_conversion_funcs[key]
+        kwargs = {"params": core_attrs_candidate}
+        core_attrs_candidate[key] = validation_and_conversion_func(**kwargs)
 
+    row = {key: core_attrs_candidate[key] for key in keys}
 
+    return row
 
-    @classmethod
-    def get_pre_serialization_funcs(cls):
-        r"""Return the pre-serialization functions.
 
-        Returns
-        -------
-        pre_serialization_funcs : `dict`
-            The attribute 
-            :attr:`~fancytypes.PreSerializable.pre_serialization_funcs`.
 
-        """
-        raise NotImplementedError(_pre_serializable_err_msg_3)
+def _select_rows_of_columns(columns, row_indices):
+    selected_columns = dict()
+    
+    for key, column in columns.items():
+        if isinstance(column, np.ndarray):
+            selected_columns[key] = column[np.array(row_indices, dtype=int)]
+        else:
+            selected_columns[key] = [column[row_idx]
+                                     for row_idx in row_indices]
 
+    return selected_columns
 
 
-    @property
-    def pre_serialization_funcs(self):
-        r"""`dict`: The pre-serialization functions.
 
-        ``pre_serialization_funcs`` has the same keys as the attribute
-        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, which is
-        also a `dict` object.
+_numeric_scalar_types = (bool, int, float, complex)
 
-        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
-        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-        and :attr:`~fancytypes.Checkable.core_attrs` respectively, the last of
-        which being a `dict` object as well.
 
-        For each `dict` key ``key`` in ``core_attrs``,
-        ``pre_serialization_funcs[key](core_attrs[key])`` is expected to yield a
-        serializable object, i.e. it should yield an object that can be passed
-        into the function ``json.dumps`` without raising an exception.
 
-        Note that ``pre_serialization_funcs`` should be considered
-        **read-only**.
+def _convert_to_stored_column(column_candidate):
+    # Columns of numeric scalars of a single type are stored as NumPy arrays,
+    # as are columns that are already NumPy arrays of a non-object dtype. All
+    # other columns are stored as lists.
+    if (isinstance(column_candidate, np.ndarray)
+        and (column_candidate.ndim > 0)
+        and (not column_candidate.dtype.hasobject)):
+        column = column_candidate
+    else:
+        column = list(column_candidate)
+        elem_types = set(type(elem) for elem in column)
+        if ((len(elem_types) == 1)
+            and (elem_types.pop() in _numeric_scalar_types)):
+            column_as_array = np.array(column)
+            if not column_as_array.dtype.hasobject:
+                column = column_as_array
 
-        """
-        result = self._pre_serialization_funcs.copy()
+    return column
+
+
+
+_npz_magic_bytes = b"PK\x03\x04"
+
+
+
+def _write_npz(serializable_rep, array_attrs, file_obj):
+    # The keys are prefixed, so that they never clash with the parameters of
+    # the function ``numpy.savez``.
+    kwargs = {"manifest": np.array(json.dumps(serializable_rep))}
+    for core_attr_name, array_attr in array_attrs.items():
+        kwargs["column_"+core_attr_name] = array_attr
+    np.savez(file_obj, **kwargs)
+
+    return None
+
+
+
+def _read_npz(file_obj):
+    with np.load(file_obj, allow_pickle=False) as npz_file:
+        serializable_rep = json.loads(str(npz_file["manifest"]))
+        array_attrs = {key[len("column_"):]: npz_file[key]
+                       for key in npz_file.files
+                       if key.startswith("column_")}
+
+    return serializable_rep, array_attrs
+
+
+
+def _check_and_convert_columnar_file_format(params):
+    obj_name = "file_format"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    file_format = czekitout.convert.to_str_from_str_like(**kwargs)
+
+    kwargs["obj"] = file_format
+    kwargs["accepted_strings"] = ("json", "npz")
+    czekitout.check.if_one_of_any_accepted_strings(**kwargs)
+
+    return file_format
+
+
+
+_default_columns = dict()
+_default_column_validation_and_conversion_funcs = dict()
+_default_columnar_filename = "serialized_rep_of_columnar_collection.json"
+
+
+
+class ColumnarCollection():
+    r"""A collection of instances of a given fancytype class, stored column by
+    column.
+
+    Rather than storing one `dict` of core attributes per instance, a columnar
+    collection stores each core attribute as a single column, i.e. a sequence
+    holding the values of said core attribute for every instance in the
+    collection. Columns of numeric scalars of a single type, e.g. `float`
+    objects, and columns that are given as NumPy arrays of a non-object dtype
+    are stored as NumPy arrays, whereas all other columns are stored as `list`
+    objects. The validation and conversion functions, as well as any
+    pre-serialization and de-pre-serialization functions, are stored once for
+    the whole collection.
+
+    Indexing a columnar collection with an integer yields an instance of the
+    fancytype class, constructed from the corresponding row without
+    validation or conversion, since the columns have already been validated
+    and converted. Indexing with a slice yields a new columnar collection.
+
+    Parameters
+    ----------
+    fancytype_cls : `type`
+        The fancytype class, i.e. a subclass of :class:`fancytypes.Checkable`.
+        Let ``validation_and_conversion_funcs`` denote
+        ``fancytype_cls.get_validation_and_conversion_funcs()``.
+    columns : `dict`, optional
+        The columns. The keys of ``columns`` must be the same as those of
+        ``validation_and_conversion_funcs``, and the values of ``columns`` must
+        be sequences of the same length, e.g. `list` objects or NumPy arrays,
+        where the ``i`` th element of each sequence is the value of the
+        corresponding core attribute of the ``i`` th instance in the
+        collection. If ``columns`` is empty, then the collection is empty.
+    skip_validation_and_conversion : `bool`, optional
+        If ``skip_validation_and_conversion`` is set to ``False``, then the
+        columns are validated and converted, row by row, in the same way as
+        the core attributes of a single instance upon its construction, except
+        for the columns that have a column-level validation and conversion
+        function, as described below.
+
+        Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
+        then no validations or conversions are performed.
+    column_validation_and_conversion_funcs : `dict`, optional
+        The column-level validation and conversion functions. Every key of
+        ``column_validation_and_conversion_funcs`` must also be a key of
+        ``validation_and_conversion_funcs``. For each key ``key`` of
+        ``column_validation_and_conversion_funcs``, the column ``columns[key]``
+        is validated and converted in a single call, by setting it to
+        ``column_validation_and_conversion_funcs[key](columns)``, rather than
+        by calling ``validation_and_conversion_funcs[key]`` once per row. This
+        allows for vectorized validations and conversions, e.g. range checks of
+        numeric columns via NumPy. The validations and conversions are
+        performed in the same order as the keys of
+        ``validation_and_conversion_funcs``.
+
+        The column-level validation and conversion functions registered by the
+        fancytype class, i.e. those returned by the class method
+        :meth:`~fancytypes.Checkable.get_column_validation_and_conversion_funcs`
+        of ``fancytype_cls``, are used as well, unless they are overridden by
+        those given in ``column_validation_and_conversion_funcs``.
+
+    """
+    def __init__(self,
+                 fancytype_cls,
+                 columns=\
+                 _default_columns,
+                 skip_validation_and_conversion=\
+                 _default_skip_validation_and_conversion,
+                 column_validation_and_conversion_funcs=\
+                 _default_column_validation_and_conversion_funcs):
+        params = {key: val
+                  for key, val in locals().items()
+                  if (key not in ("self", "__class__"))}
+        self._fancytype_cls = _check_and_convert_fancytype_cls(params)
         
-        return result
+        params["validation_and_conversion_funcs"] = \
+            self._fancytype_cls.get_validation_and_conversion_funcs()
+        self._validation_and_conversion_funcs = \
+            _check_and_convert_validation_and_conversion_funcs(params)
+        params["validation_and_conversion_funcs"] = \
+            self._validation_and_conversion_funcs
+
+        # The column-level validation and conversion functions registered by
+        # the fancytype class are overridden by those given explicitly.
+        func_alias = _check_and_convert_column_validation_and_conversion_funcs
+        params["column_validation_and_conversion_funcs"] = \
+            {**self._fancytype_cls.get_column_validation_and_conversion_funcs(),
+             **func_alias(params)}
+        self._column_validation_and_conversion_funcs = func_alias(params)
+
+        columns = _check_and_convert_columns(params)
+        skip_validation_and_conversion = \
+            _check_and_convert_skip_validation_and_conversion(params)
+
+        self._num_rows = len(next(iter(columns.values()), tuple()))
+
+        if (skip_validation_and_conversion == False):
+            kwargs = {"columns": \
+                      columns,
+                      "num_rows": \
+                      self._num_rows,
+                      "validation_and_conversion_funcs": \
+                      self._validation_and_conversion_funcs,
+                      "column_validation_and_conversion_funcs": \
+                      self._column_validation_and_conversion_funcs}
+            columns, _ = _validate_and_convert_columns(**kwargs)
+
+        self._columns = {key: _convert_to_stored_column(columns[key])
+                         for key in self._validation_and_conversion_funcs}
+
+        return None
 
 
 
     @classmethod
-    def get_de_pre_serialization_funcs(cls):
-        r"""Return the de-pre-serialization functions.
+    def from_instances(cls,
+                       fancytype_cls,
+                       fancytype_instances=_default_fancytype_instances):
+        r"""Construct a columnar collection from a sequence of instances.
+
+        Since the core attributes of the instances have already been validated
+        and converted, no validations or conversions are performed.
+
+        Parameters
+        ----------
+        fancytype_cls : `type`
+            The fancytype class, i.e. a subclass of
+            :class:`fancytypes.Checkable`.
+        fancytype_instances : `array_like` (`fancytype_cls`, ndim=1), optional
+            The instances.
 
         Returns
         -------
-        de_pre_serialization_funcs : `dict`
-            The attribute 
-            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`.
+        columnar_collection : :class:`fancytypes.ColumnarCollection`
+            The columnar collection.
 
         """
-        raise NotImplementedError(_pre_serializable_err_msg_4)
+        params = {"fancytype_cls": fancytype_cls}
+        fancytype_cls = _check_and_convert_fancytype_cls(params)
+
+        kwargs = {"obj": fancytype_instances,
+                  "obj_name": "fancytype_instances",
+                  "accepted_types": (list, tuple)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+
+        for fancytype_instance in fancytype_instances:
+            kwargs = {"obj": fancytype_instance,
+                      "obj_name": "fancytype_instance",
+                      "accepted_types": (fancytype_cls,)}
+            czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+
+        validation_and_conversion_funcs = \
+            fancytype_cls.get_validation_and_conversion_funcs()
+        columns = {key: [fancytype_instance._core_attrs[key]
+                         for fancytype_instance in fancytype_instances]
+                   for key in validation_and_conversion_funcs}
+        
+        kwargs = {"fancytype_cls": fancytype_cls,
+                  "columns": columns,
+                  "skip_validation_and_conversion": True}
+        columnar_collection = cls(**kwargs)
+
+        return columnar_collection
 
 
 
     @property
-    def de_pre_serialization_funcs(self):
-        r"""`dict`: The de-pre-serialization functions.
+    def fancytype_cls(self):
+        r"""`type`: The fancytype class of the instances in the collection.
 
-        ``de_pre_serialization_funcs`` has the same keys as the attribute
-        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, which is
-        also a `dict` object.
+        """
+        result = self._fancytype_cls
 
-        Let ``validation_and_conversion_funcs`` and ``pre_serialization_funcs``
-        denote the attributes
-        :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-        :attr:`~fancytypes.PreSerializable.pre_serialization_funcs`
-        respectively, the last of which being a `dict` object as well.
+        return result
 
-        Let ``core_attrs_candidate_1`` be any `dict` object that has the same
-        keys as ``validation_and_conversion_funcs``, where for each `dict` key
-        ``key`` in ``core_attrs_candidate_1``,
-        ``validation_and_conversion_funcs[key](core_attrs_candidate_1)`` does
-        not raise an exception.
 
-        Let ``serializable_rep`` be a `dict` object that has the same keys as
-        ``core_attrs_candidate_1``, where for each `dict` key ``key`` in
-        ``core_attrs_candidate_1``, ``serializable_rep[key]`` is set to
-        ``pre_serialization_funcs[key](core_attrs_candidate_1[key])``.
 
-        The items of ``de_pre_serialization_funcs`` are expected to be set to
-        callable objects that would lead to
-        ``de_pre_serialization_funcs[key](serializable_rep[key])`` not raising
-        an exception for each `dict` key ``key`` in ``serializable_rep``.
+    def __len__(self):
+        return self._num_rows
 
-        Let ``core_attrs_candidate_2`` be a `dict` object that has the same keys
-        as ``serializable_rep``, where for each `dict` key ``key`` in
-        ``validation_and_conversion_funcs``, ``core_attrs_candidate_2[key]`` is
-        set to ``de_pre_serialization_funcs[key](serializable_rep[key])``.
 
-        The items of ``de_pre_serialization_funcs`` are also expected to be set
-        to callable objects that would lead to
-        ``validation_and_conversion_funcs[key](core_attrs_candidate_2)`` not
-        raising an exception for each `dict` key ``key`` in
-        ``core_attrs_candidate_2``.
 
-        Note that ``de_pre_serialization_funcs`` should be considered
-        **read-only**.
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            columns = {core_attr_name: column[key]
+                       for core_attr_name, column in self._columns.items()}
+            kwargs = {"fancytype_cls": \
+                      self._fancytype_cls,
+                      "columns": \
+                      columns,
+                      "skip_validation_and_conversion": \
+                      True,
+                      "column_validation_and_conversion_funcs": \
+                      self._column_validation_and_conversion_funcs}
+            result = type(self)(**kwargs)
+        else:
+            row_idx = range(self._num_rows)[key]
+            result = self._construct_fancytype_instance(row_idx)
 
-        """
-        result = self._de_pre_serialization_funcs.copy()
-        
         return result
 
 
 
-    @classmethod
-    def _construct_core_attrs_candidate(cls,
-                                        serializable_rep,
-                                        de_pre_serialization_funcs):
-        kwargs = {"obj": serializable_rep, "obj_name": "serializable_rep"}
-        serializable_rep = czekitout.convert.to_dict(**kwargs)
+    def __iter__(self):
+        for row_idx in range(self._num_rows):
+            yield self._construct_fancytype_instance(row_idx)
 
-        for key in serializable_rep:
-            if key not in de_pre_serialization_funcs:
-                obj_name = "serializable_rep"
-                unformatted_err_msg_1 = _pre_serializable_err_msg_5
-                err_msg = unformatted_err_msg_1.format(obj_name, obj_name, key)
-                raise KeyError(err_msg)
-            
-        try:
-            core_attrs_candidate = dict()
-            
-            for key in serializable_rep:
-                core_attr_name = \
-                    key
-                elem_of_serializable_rep = \
-                    serializable_rep[key]
-                de_pre_serialization_func = \
-                    de_pre_serialization_funcs[key]
-                core_attr_candidate = \
-                    de_pre_serialization_func(elem_of_serializable_rep)
-                core_attrs_candidate[core_attr_name] = \
-                    core_attr_candidate
-        except:
-            err_msg = _pre_serializable_err_msg_6
-            raise ValueError(err_msg)
 
-        return core_attrs_candidate
 
+    def _get_row(self, row_idx):
+        row = dict()
+        for core_attr_name, column in self._columns.items():
+            elem = column[row_idx]
+            if isinstance(column, np.ndarray) and (column.ndim == 1):
+                elem = elem.item()
+            row[core_attr_name] = elem
 
+        return row
 
-    @classmethod
-    def de_pre_serialize(cls,
-                         serializable_rep=\
-                         _default_serializable_rep,
-                         skip_validation_and_conversion=\
-                         _default_skip_validation_and_conversion):
-        r"""Construct an instance from a serializable representation.
 
-        Parameters
-        ----------
-        serializable_rep : `dict`, optional
-            A `dict` object that has the same keys as the attribute
-            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`, which
-            is also a `dict` object.
 
-            Let ``validation_and_conversion_funcs`` and
-            ``de_pre_serialization_funcs`` denote the attributes
-            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`
-            respectively, the last of which being a `dict` object as well.
+    def _construct_fancytype_instance(self, row_idx):
+        kwargs = self._get_row(row_idx)
+        
+        ctor_param_names = self._fancytype_cls.__init__.__code__.co_varnames
+        for key in ("skip_validation_and_conversion", "skip_cls_tests"):
+            if key in ctor_param_names:
+                kwargs[key] = True
+                
+        fancytype_instance = self._fancytype_cls(**kwargs)
 
-            The items of ``serializable_rep`` are expected to be objects that
-            would lead to
-            ``de_pre_serialization_funcs[key](serializable_rep[key])`` not
-            raising an exception for each `dict` key ``key`` in
-            ``serializable_rep``.
+        return fancytype_instance
 
-            Let ``core_attrs_candidate`` be a `dict` object that has the same
-            keys as ``serializable_rep``, where for each `dict` key ``key`` in
-            ``serializable_rep``, ``core_attrs_candidate[key]`` is set to
-            de_pre_serialization_funcs[key](serializable_rep[key])``.
 
-            The items of ``serializable_rep`` are also expected to be set to
-            objects that would lead to
-            ``validation_and_conversion_funcs[key](core_attrs_candidate)`` not
-            raising an exception for each `dict` key ``key`` in
-            ``serializable_rep``.
-        skip_validation_and_conversion : `bool`, optional
-            Let ``core_attrs`` denote the attribute
-            :attr:`~fancytypes.Checkable.core_attrs`, which is a `dict` object.
 
-            If ``skip_validation_and_conversion`` is set to ``False``, then for
-            each key ``key`` in ``serializable_rep``, ``core_attrs[key]`` is set
-            to ``validation_and_conversion_funcs[key] (core_attrs_candidate)``,
-            with ``validation_and_conversion_funcs`` and
-            ``core_attrs_candidate_1`` being introduced in the above description
-            of ``serializable_rep``.
+    def get_columns(self, deep_copy=_default_deep_copy):
+        r"""Return the columns.
 
-            Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
-            then ``core_attrs`` is set to ``core_attrs_candidate.copy()``. This
-            option is desired primarily when the user wants to avoid potentially
-            expensive deep copies and/or conversions of the `dict` values of
-            ``core_attrs_candidate``, as it is guaranteed that no copies or
-            conversions are made in this case.
+        Parameters
+        ----------
+        deep_copy : `bool`, optional
+            Let ``columns`` denote the attribute
+            :attr:`~fancytypes.ColumnarCollection.columns`, which is a `dict`
+            object.
+
+            If ``deep_copy`` is set to ``True``, then a deep copy of ``columns``
+            is returned.  Otherwise, a shallow copy of ``columns`` is returned.
 
         Returns
         -------
-        instance_of_current_cls : Current class
-            An instance constructed from the serializable representation
-            ``serializable_rep``.
+        columns : `dict`
+            The attribute :attr:`~fancytypes.ColumnarCollection.columns`.
 
         """
-        params = {"validation_and_conversion_funcs": \
-                  cls.get_validation_and_conversion_funcs(),
-                  "pre_serialization_funcs": \
-                  cls.get_pre_serialization_funcs(),
-                  "de_pre_serialization_funcs": \
-                  cls.get_de_pre_serialization_funcs()}
-        _preliminary_check_of_de_pre_serialization_funcs(params)
-        de_pre_serialization_funcs = params["de_pre_serialization_funcs"]
+        params = {"deep_copy": deep_copy}
+        deep_copy = _check_and_convert_deep_copy(params)
+        
+        columns = (self.columns
+                   if (deep_copy == True)
+                   else self._columns.copy())
 
-        try:
-            kwargs = \
-                {"serializable_rep": serializable_rep,
-                 "de_pre_serialization_funcs": de_pre_serialization_funcs}
-            core_attrs_candidate = \
-                cls._construct_core_attrs_candidate(**kwargs)
+        return columns
 
-            kwargs = core_attrs_candidate
-            key = "skip_validation_and_conversion"
-            if key in cls.__init__.__code__.co_varnames:
-                kwargs[key] = True
-            instance_of_current_cls = cls(**kwargs)
 
-            if (skip_validation_and_conversion == False):
-                try:
-                    _ = instance_of_current_cls.pre_serialize()
-                except:
-                    raise ValueError(_pre_serializable_err_msg_1)
 
-                validation_and_conversion_funcs = \
-                    instance_of_current_cls._validation_and_conversion_funcs
+    @property
+    def columns(self):
+        r"""`dict`: The columns.
 
-                params = {"core_attrs_candidate": \
-                          instance_of_current_cls._core_attrs,
-                          "name_of_obj_alias_of_core_attrs_candidate": \
-                          "instance_of_current_cls._core_attrs",
-                          "validation_and_conversion_funcs": \
-                          validation_and_conversion_funcs}
-                core_attrs = _check_and_convert_core_attrs_candidate(params)
-                instance_of_current_cls._core_attrs = core_attrs
-        except:
-            raise ValueError(_pre_serializable_err_msg_7)
-                
-        return instance_of_current_cls
+        The keys of ``columns`` are the names of the core attributes of the
+        fancytype class. Each value of ``columns`` is either a NumPy array or a
+        `list` object, as described in the documentation for the class
+        :class:`fancytypes.ColumnarCollection`.
+
+        Note that ``columns`` should be considered **read-only**.
+
+        """
+        result = copy.deepcopy(self._columns)
+        
+        return result
 
 
 
     def pre_serialize(self):
-        r"""Pre-serialize instance.
+        r"""Pre-serialize the columnar collection.
+
+        The fancytype class must be a subclass of
+        :class:`fancytypes.PreSerializable`. Each column is pre-serialized by
+        applying the corresponding pre-serialization function to each of its
+        elements.
 
         Returns
         -------
         serializable_rep : `dict`
-            A serializable representation of an instance.
+            A serializable representation of the columnar collection, which has
+            the same keys as :attr:`~fancytypes.ColumnarCollection.columns`,
+            and whose values are `list` objects storing the pre-serialized
+            elements of the corresponding columns.
 
         """
+        kwargs = {"core_attr_names": tuple(self._columns)}
+        serializable_rep = self._pre_serialize_column_subset(**kwargs)
+
+        return serializable_rep
+
+
+
+    def _pre_serialize_column_subset(self, core_attr_names):
+        if not issubclass(self._fancytype_cls, PreSerializable):
+            err_msg = _columnar_collection_err_msg_1
+            raise TypeError(err_msg)
+
+        pre_serialization_funcs = \
+            self._fancytype_cls.get_pre_serialization_funcs()
+
         serializable_rep = dict()
-        
-        for core_attr_name, core_attr in self._core_attrs.items():
-            pre_serialization_func = \
-                self._pre_serialization_funcs[core_attr_name]
-            elem_of_serializable_rep = \
-                pre_serialization_func(core_attr)
-            serializable_rep[core_attr_name] = \
-                elem_of_serializable_rep
+        for core_attr_name in core_attr_names:
+            column = self._columns[core_attr_name]
+            pre_serialization_func = pre_serialization_funcs[core_attr_name]
+            
+            if isinstance(column, np.ndarray) and (column.ndim == 1):
+                column = column.tolist()
+            serializable_rep[core_attr_name] = [pre_serialization_func(elem)
+                                                for elem in column]
 
         return serializable_rep
 
 
 
     def dumps(self):
-        r"""Serialize instance.
-        
+        r"""Serialize the columnar collection.
+
         Returns
         -------
-        serialized_rep : `dict`
-            A serialized representation of an instance.
+        serialized_rep : `str`
+            A serialized representation of the columnar collection, i.e. the
+            output of :meth:`~fancytypes.ColumnarCollection.pre_serialize`
+            encoded as a JSON document.
 
         """
         serializable_rep = self.pre_serialize()
@@ -983,19 +6669,42 @@ class PreSerializable(Checkable):
 
 
 
-    def dump(self, filename=_default_filename, overwrite=_default_overwrite):
-        r"""Serialize instance and save the result in a JSON file.
+    def dump(self,
+             filename=_default_columnar_filename,
+             overwrite=_default_overwrite,
+             file_format=_default_file_format,
+             fsync_policy=_default_fsync_policy):
+        r"""Serialize the columnar collection and save the result to a file.
+
+        The file is written atomically, in the same way as in the method
+        :meth:`fancytypes.PreSerializable.dump`.
 
         Parameters
         ----------
         filename : `str`, optional
-            The relative or absolute path to the JSON file in which to store the
-            serialized representation of an instance.
+            The relative or absolute path to the file in which to store the
+            serialized representation of the columnar collection.
         overwrite : `bool`, optional
             If ``overwrite`` is set to ``False`` and a file exists at the path
-            ``filename``, then the serialized instance is not written to that
-            file and an exception is raised. Otherwise, the serialized instance
+            ``filename``, then the columnar collection is not written to that
+            file and an exception is raised. Otherwise, the columnar collection
             will be written to that file barring no other issues occur.
+        file_format : ``"json"`` | ``"npz"``, optional
+            If ``file_format`` is set to ``"json"``, then the output of
+            :meth:`~fancytypes.ColumnarCollection.pre_serialize` is stored as a
+            plain JSON document, which is compressed if the suffix of
+            ``filename`` implies so, as described in the documentation for the
+            method :meth:`fancytypes.PreSerializable.dump`.
+
+            Otherwise, if ``file_format`` is set to ``"npz"``, then the
+            columnar collection is stored in a NumPy ``.npz`` file, in which
+            every column that is stored as a NumPy array is stored as raw array
+            data, without being pre-serialized, and every other column is
+            pre-serialized and stored in a JSON manifest. Upon loading, the
+            former columns are likewise not de-pre-serialized.
+        fsync_policy : ``"none"`` | ``"file"`` | ``"file_and_dir"``, optional
+            The policy for flushing the file to disk. See the documentation for
+            the method :meth:`fancytypes.PreSerializable.dump` for details.
 
         Returns
         -------
@@ -1006,280 +6715,704 @@ class PreSerializable(Checkable):
                   if (key not in ("self", "__class__"))}
         filename = _check_and_convert_filename(params)
         overwrite = _check_and_convert_overwrite(params)
+        file_format = _check_and_convert_columnar_file_format(params)
+        fsync_policy = _check_and_convert_fsync_policy(params)
         
         if pathlib.Path(filename).is_file():
             if not overwrite:
-                raise IOError(_pre_serializable_err_msg_8.format(filename))
+                raise IOError(_columnar_collection_err_msg_2.format(filename))
 
-        serializable_rep = self.pre_serialize()
+        if file_format == "json":
+            serializable_rep = self.pre_serialize()
+            array_attrs = dict()
+        else:
+            array_attrs = {core_attr_name: column
+                           for core_attr_name, column in self._columns.items()
+                           if isinstance(column, np.ndarray)}
+            core_attr_names = tuple(core_attr_name
+                                    for core_attr_name in self._columns
+                                    if core_attr_name not in array_attrs)
+            kwargs = {"core_attr_names": core_attr_names}
+            serializable_rep = self._pre_serialize_column_subset(**kwargs)
 
         try:
-            with open(filename, "w", encoding="utf-8") as file_obj:
-                json.dump(serializable_rep,
-                          file_obj,
-                          ensure_ascii=False,
-                          indent=4)
+            kwargs = {"filenames": (filename,),
+                      "serializable_reps": (serializable_rep,),
+                      "array_attr_sets": (array_attrs,),
+                      "file_format": file_format,
+                      "fsync_policy": fsync_policy,
+                      "compression": \
+                      "infer" if (file_format == "json") else "none"}
+            _dump_atomically(**kwargs)
         except:
-            pathlib.Path(filename).unlink(missing_ok=True)
-            raise IOError(_pre_serializable_err_msg_9.format(filename))
+            raise IOError(_columnar_collection_err_msg_3.format(filename))
             
         return None
 
 
 
+    @classmethod
+    def de_pre_serialize(cls,
+                         fancytype_cls,
+                         serializable_rep=\
+                         _default_serializable_rep,
+                         skip_validation_and_conversion=\
+                         _default_skip_validation_and_conversion,
+                         column_validation_and_conversion_funcs=\
+                         _default_column_validation_and_conversion_funcs):
+        r"""Construct a columnar collection from a serializable representation.
+
+        Users can generate serializable representations using the method
+        :meth:`~fancytypes.ColumnarCollection.pre_serialize`.
+
+        Parameters
+        ----------
+        fancytype_cls : `type`
+            The fancytype class, i.e. a subclass of
+            :class:`fancytypes.PreSerializable`.
+        serializable_rep : `dict`, optional
+            The serializable representation. The keys of ``serializable_rep``
+            must be the names of the core attributes of ``fancytype_cls``, and
+            the values of ``serializable_rep`` must be sequences of
+            pre-serialized elements, all of the same length. Each element is
+            de-pre-serialized via the corresponding de-pre-serialization
+            function of ``fancytype_cls``.
+        skip_validation_and_conversion : `bool`, optional
+            See the documentation for the class
+            :class:`fancytypes.ColumnarCollection`.
+        column_validation_and_conversion_funcs : `dict`, optional
+            See the documentation for the class
+            :class:`fancytypes.ColumnarCollection`.
+
+        Returns
+        -------
+        columnar_collection : :class:`fancytypes.ColumnarCollection`
+            The columnar collection.
+
+        """
+        kwargs = {"fancytype_cls": \
+                  fancytype_cls,
+                  "serializable_rep": \
+                  serializable_rep,
+                  "array_attrs": \
+                  dict(),
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "column_validation_and_conversion_funcs": \
+                  column_validation_and_conversion_funcs}
+        columnar_collection = cls._de_pre_serialize(**kwargs)
+
+        return columnar_collection
+
+
+
+    @classmethod
+    def _de_pre_serialize(cls,
+                          fancytype_cls,
+                          serializable_rep,
+                          array_attrs,
+                          skip_validation_and_conversion,
+                          column_validation_and_conversion_funcs):
+        params = {"fancytype_cls": fancytype_cls}
+        fancytype_cls = _check_and_convert_fancytype_cls(params)
+
+        if not issubclass(fancytype_cls, PreSerializable):
+            err_msg = _columnar_collection_err_msg_1
+            raise TypeError(err_msg)
+
+        kwargs = {"obj": serializable_rep, "obj_name": "serializable_rep"}
+        czekitout.check.if_dict_like(**kwargs)
+        
+        de_pre_serialization_funcs = \
+            fancytype_cls.get_de_pre_serialization_funcs()
+
+        try:
+            columns = dict()
+            for key, serializable_column in serializable_rep.items():
+                de_pre_serialization_func = de_pre_serialization_funcs[key]
+                columns[key] = [de_pre_serialization_func(elem)
+                                for elem in serializable_column]
+        except Exception:
+            raise ValueError(_columnar_collection_err_msg_4)
+        columns.update(array_attrs)
+
+        kwargs = {"fancytype_cls": \
+                  fancytype_cls,
+                  "columns": \
+                  columns,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "column_validation_and_conversion_funcs": \
+                  column_validation_and_conversion_funcs}
+        columnar_collection = cls(**kwargs)
+
+        return columnar_collection
+
+
+
     @classmethod
     def loads(cls,
+              fancytype_cls,
               serialized_rep=\
               _default_serialized_rep,
               skip_validation_and_conversion=\
-              _default_skip_validation_and_conversion):
-        r"""Construct an instance from a serialized representation.
+              _default_skip_validation_and_conversion,
+              column_validation_and_conversion_funcs=\
+              _default_column_validation_and_conversion_funcs):
+        r"""Construct a columnar collection from a serialized representation.
 
         Users can generate serialized representations using the method
-        :meth:`~fancytypes.PreSerializable.dumps`.
+        :meth:`~fancytypes.ColumnarCollection.dumps`.
 
         Parameters
         ----------
-        serialized_rep : `str` | `bytes` | `bytearray`, optional
-            The serialized representation.
+        fancytype_cls : `type`
+            The fancytype class, i.e. a subclass of
+            :class:`fancytypes.PreSerializable`.
+        serialized_rep : `str` | `bytes` | `bytearray` | `memoryview`, optional
+            The serialized representation, which is deserialized in the same
+            way as in the method :meth:`fancytypes.PreSerializable.loads`, and
+            then de-pre-serialized via the method
+            :meth:`~fancytypes.ColumnarCollection.de_pre_serialize`.
+        skip_validation_and_conversion : `bool`, optional
+            See the documentation for the class
+            :class:`fancytypes.ColumnarCollection`.
+        column_validation_and_conversion_funcs : `dict`, optional
+            See the documentation for the class
+            :class:`fancytypes.ColumnarCollection`.
 
-            ``serialized_rep`` is expected to be such that
-            ``json.loads(serialized_rep)`` does not raise an exception.
+        Returns
+        -------
+        columnar_collection : :class:`fancytypes.ColumnarCollection`
+            The columnar collection.
 
-            Let ``serializable_rep=json.loads(serialized_rep)``. 
+        """
+        kwargs = {"obj": serialized_rep,
+                  "obj_name": "serialized_rep",
+                  "accepted_types": (str, bytes, bytearray, memoryview)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
 
-            Let ``validation_and_conversion_funcs`` and
-            ``de_pre_serialization_funcs`` denote the attributes
-            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`
-            respectively, both of which being `dict` objects as well.
+        try:
+            serializable_rep = _deserialize(serialized_rep)
+        except Exception:
+            raise ValueError(_columnar_collection_err_msg_5)
 
-            ``serialized_rep`` is also expected to be such that
-            ``de_pre_serialization_funcs[key](serializable_rep[key])`` does not
-            raise an exception for each `dict` key ``key`` in
-            ``de_pre_serialization_funcs``.
+        kwargs = {"fancytype_cls": \
+                  fancytype_cls,
+                  "serializable_rep": \
+                  serializable_rep,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "column_validation_and_conversion_funcs": \
+                  column_validation_and_conversion_funcs}
+        columnar_collection = cls.de_pre_serialize(**kwargs)
+
+        return columnar_collection
+
+
+
+    @classmethod
+    def load(cls,
+             fancytype_cls,
+             filename=\
+             _default_columnar_filename,
+             skip_validation_and_conversion=\
+             _default_skip_validation_and_conversion,
+             column_validation_and_conversion_funcs=\
+             _default_column_validation_and_conversion_funcs):
+        r"""Construct a columnar collection from a serialized representation
+        that is stored in a file.
+
+        Users can save serialized representations to files using the method
+        :meth:`~fancytypes.ColumnarCollection.dump`. The file format and
+        compression are detected automatically.
+
+        Parameters
+        ----------
+        fancytype_cls : `type`
+            The fancytype class, i.e. a subclass of
+            :class:`fancytypes.PreSerializable`.
+        filename : `str`, optional
+            The relative or absolute path to the file that is storing the
+            serialized representation of the columnar collection.
+        skip_validation_and_conversion : `bool`, optional
+            See the documentation for the class
+            :class:`fancytypes.ColumnarCollection`.
+        column_validation_and_conversion_funcs : `dict`, optional
+            See the documentation for the class
+            :class:`fancytypes.ColumnarCollection`.
+
+        Returns
+        -------
+        columnar_collection : :class:`fancytypes.ColumnarCollection`
+            The columnar collection.
+
+        """
+        params = {"filename": filename}
+        filename = _check_and_convert_filename(params)
+
+        try:
+            with open(filename, "rb") as file_obj:
+                is_npz_file = (file_obj.read(len(_npz_magic_bytes))
+                               == _npz_magic_bytes)
+                file_obj.seek(0)
+                
+                if is_npz_file:
+                    serializable_rep, array_attrs = _read_npz(file_obj)
+                else:
+                    kwargs = {"file_obj": file_obj,
+                              "filename": filename,
+                              "compression": "infer"}
+                    file_obj, _, _ = _open_binary_stream_for_reading(**kwargs)
+                    kwargs = {"read_bytes": file_obj.read, "encoding": "utf-8"}
+                    read_text = _generate_read_text_func(**kwargs)
+                    serializable_rep = _read_json_obj(read_text)
+                    array_attrs = dict()
+        except Exception:
+            raise IOError(_columnar_collection_err_msg_6.format(filename))
+
+        kwargs = {"fancytype_cls": \
+                  fancytype_cls,
+                  "serializable_rep": \
+                  serializable_rep,
+                  "array_attrs": \
+                  array_attrs,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "column_validation_and_conversion_funcs": \
+                  column_validation_and_conversion_funcs}
+        columnar_collection = cls._de_pre_serialize(**kwargs)
+
+        return columnar_collection
+
+
+
+def _check_and_convert_pre_serializable_cls(params):
+    fancytype_cls = _check_and_convert_fancytype_cls(params)
+
+    current_func_name = "_check_and_convert_pre_serializable_cls"
+
+    if not issubclass(fancytype_cls, PreSerializable):
+        err_msg = globals()[current_func_name+"_err_msg_1"]
+        raise TypeError(err_msg)
+
+    return fancytype_cls
+
+
+
+def _check_and_convert_indexed_attr_names(params):
+    obj_name = "indexed_attr_names"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    indexed_attr_names = czekitout.convert.to_tuple_of_strs(**kwargs)
+    indexed_attr_names = tuple(dict.fromkeys(indexed_attr_names))
+
+    validation_and_conversion_funcs = params["validation_and_conversion_funcs"]
+
+    current_func_name = "_check_and_convert_indexed_attr_names"
+
+    for indexed_attr_name in indexed_attr_names:
+        if indexed_attr_name not in validation_and_conversion_funcs:
+            unformatted_err_msg = globals()[current_func_name+"_err_msg_1"]
+            err_msg = unformatted_err_msg.format(indexed_attr_name)
+            raise KeyError(err_msg)
+
+    return indexed_attr_names
+
+
+
+def _check_and_convert_conditions(params):
+    obj_name = "conditions"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    conditions = czekitout.convert.to_dict(**kwargs).copy()
+
+    indexed_attr_names = params["indexed_attr_names"]
+
+    current_func_name = "_check_and_convert_conditions"
+
+    for key, condition in conditions.items():
+        if key not in indexed_attr_names:
+            unformatted_err_msg = globals()[current_func_name+"_err_msg_1"]
+            err_msg = unformatted_err_msg.format(key)
+            raise KeyError(err_msg)
+        
+        if isinstance(condition, (list, tuple)) and (len(condition) != 2):
+            unformatted_err_msg = globals()[current_func_name+"_err_msg_2"]
+            err_msg = unformatted_err_msg.format(key)
+            raise ValueError(err_msg)
+
+    return conditions
+
+
+
+def _quote_sql_identifier(identifier):
+    quoted_identifier = '"' + identifier.replace('"', '""') + '"'
+
+    return quoted_identifier
+
+
+
+def _return_indexed_column_name(indexed_attr_name):
+    indexed_column_name = "attr_" + indexed_attr_name
+
+    return indexed_column_name
+
+
+
+_sqlite_int_range = range(-2**63, 2**63)
+
+
+
+def _is_valid_indexed_value(indexed_value):
+    result = ((indexed_value is None)
+              or isinstance(indexed_value, (float, str))
+              or (isinstance(indexed_value, int)
+                  and (indexed_value in _sqlite_int_range)))
+
+    return result
+
+
+
+def _generate_sql_where_clause(conditions):
+    sql_exprs = []
+    sql_params = []
+    
+    for indexed_attr_name, condition in conditions.items():
+        indexed_column_name = _return_indexed_column_name(indexed_attr_name)
+        quoted_column_name = _quote_sql_identifier(indexed_column_name)
+        
+        if isinstance(condition, (list, tuple)):
+            for bound, sql_operator in zip(condition, (">=", "<=")):
+                if bound is not None:
+                    sql_exprs.append(quoted_column_name+" "+sql_operator+" ?")
+                    sql_params.append(bound)
+        else:
+            sql_exprs.append(quoted_column_name+" IS ?")
+            sql_params.append(condition)
+
+    sql_where_clause = (" WHERE " + " AND ".join(sql_exprs)
+                        if (len(sql_exprs) > 0)
+                        else "")
+
+    return sql_where_clause, sql_params
+
+
+
+_default_conditions = dict()
+_default_indexed_attr_names = tuple()
+_default_database_filename = "store_of_fancytype_instances.sqlite3"
+_sqlite_table_name = "fancytype_instances"
+
+
+
+class SQLiteStore():
+    r"""A store of instances of a given fancytype class, backed by an SQLite
+    database.
+
+    Each instance in the store is saved as its serialized representation, i.e.
+    the output of :meth:`fancytypes.PreSerializable.dumps`, along with the
+    pre-serialized values of a user-selected subset of its core attributes,
+    which are referred to as the indexed attributes. Each indexed attribute is
+    stored in a separate database column with an index, such that queries by
+    equality or range of the indexed attributes do not require scanning every
+    instance in the store. Instances are only de-pre-serialized upon iterating
+    over the results of a query.
+
+    Parameters
+    ----------
+    fancytype_cls : `type`
+        The fancytype class, i.e. a subclass of
+        :class:`fancytypes.PreSerializable`.
+    filename : `str`, optional
+        The relative or absolute path to the SQLite database file. If the file
+        does not exist, then it is created. If ``filename`` is set to
+        ``":memory:"``, then the database is stored in memory.
+    indexed_attr_names : `array_like` (`str`, ndim=1), optional
+        The names of the indexed attributes. Each name must be the name of a
+        core attribute of ``fancytype_cls``. The pre-serialized values of the
+        indexed attributes must be ``None``, `bool` objects, `int` objects
+        representable as 64-bit signed integers, `float` objects, or `str`
+        objects. If the database already stores instances, then
+        ``indexed_attr_names`` must specify the same set of indexed attributes
+        as when the database was created.
+
+    """
+    def __init__(self,
+                 fancytype_cls,
+                 filename=_default_database_filename,
+                 indexed_attr_names=_default_indexed_attr_names):
+        params = {key: val
+                  for key, val in locals().items()
+                  if (key not in ("self", "__class__"))}
+        self._fancytype_cls = _check_and_convert_pre_serializable_cls(params)
+        filename = _check_and_convert_filename(params)
+        
+        params["validation_and_conversion_funcs"] = \
+            self._fancytype_cls.get_validation_and_conversion_funcs()
+        self._indexed_attr_names = \
+            _check_and_convert_indexed_attr_names(params)
+
+        try:
+            self._connection = sqlite3.connect(filename)
+        except sqlite3.Error:
+            raise IOError(_sqlite_store_err_msg_1.format(filename))
+
+        try:
+            quoted_table_name = _quote_sql_identifier(_sqlite_table_name)
+            sql_statement = "PRAGMA table_info(" + quoted_table_name + ")"
+            column_names = tuple(row[1]
+                                 for row
+                                 in self._connection.execute(sql_statement))
+        except sqlite3.Error:
+            self._connection.close()
+            raise IOError(_sqlite_store_err_msg_1.format(filename))
+
+        indexed_column_names = \
+            tuple(_return_indexed_column_name(indexed_attr_name)
+                  for indexed_attr_name in self._indexed_attr_names)
+        expected_column_names = (("row_id", "serialized_rep")
+                                 + indexed_column_names)
+
+        if len(column_names) == 0:
+            self._create_table(indexed_column_names)
+        elif set(column_names) != set(expected_column_names):
+            self._connection.close()
+            err_msg = _sqlite_store_err_msg_2.format(filename)
+            raise ValueError(err_msg)
+
+        return None
+
+
+
+    def _create_table(self, indexed_column_names):
+        quoted_table_name = _quote_sql_identifier(_sqlite_table_name)
+        sql_column_defs = (("row_id INTEGER PRIMARY KEY",
+                            "serialized_rep TEXT NOT NULL")
+                           + tuple(map(_quote_sql_identifier,
+                                       indexed_column_names)))
+
+        with self._connection:
+            sql_statement = ("CREATE TABLE " + quoted_table_name
+                             + " (" + ", ".join(sql_column_defs) + ")")
+            self._connection.execute(sql_statement)
+            
+            for indexed_column_name in indexed_column_names:
+                index_name = "index_of_" + indexed_column_name
+                quoted_index_name = _quote_sql_identifier(index_name)
+                quoted_column_name = _quote_sql_identifier(indexed_column_name)
+                sql_statement = ("CREATE INDEX " + quoted_index_name
+                                 + " ON " + quoted_table_name
+                                 + " (" + quoted_column_name + ")")
+                self._connection.execute(sql_statement)
+
+        return None
+
+
+
+    @property
+    def fancytype_cls(self):
+        r"""`type`: The fancytype class of the instances in the store.
+
+        """
+        result = self._fancytype_cls
+
+        return result
+
+
+
+    @property
+    def indexed_attr_names(self):
+        r"""`tuple`: The names of the indexed attributes.
+
+        """
+        result = self._indexed_attr_names
 
-            Let ``core_attrs_candidate`` be a `dict` object that has the same
-            keys as ``serializable_rep``, where for each `dict` key ``key`` in
-            ``de_pre_serialization_funcs``, ``core_attrs_candidate[key]`` is set
-            to de_pre_serialization_funcs[key](serializable_rep[key])``.
+        return result
 
-            ``serialized_rep`` is also expected to be such that
-            ``validation_and_conversion_funcs[key](core_attrs_candidate)`` does
-            not raise an exception for each `dict` key ``key`` in
-            ``serializable_rep``.
-        skip_validation_and_conversion : `bool`, optional
-            Let ``core_attrs`` denote the attribute
-            :attr:`~fancytypes.Checkable.core_attrs`, which is a `dict` object.
 
-            If ``skip_validation_and_conversion`` is set to ``False``, then for
-            each key ``key`` in ``core_attrs_candidate``, ``core_attrs[key]`` is
-            set to ``validation_and_conversion_funcs[key]
-            (core_attrs_candidate)``, with ``validation_and_conversion_funcs``
-            and ``core_attrs_candidate_1`` being introduced in the above
-            description of ``serialized_rep``.
 
-            Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
-            then ``core_attrs`` is set to ``core_attrs_candidate.copy()``. This
-            option is desired primarily when the user wants to avoid potentially
-            expensive deep copies and/or conversions of the `dict` values of
-            ``core_attrs_candidate``, as it is guaranteed that no copies or
-            conversions are made in this case.
+    def add(self, fancytype_instance):
+        r"""Add an instance to the store.
 
-        Returns
-        -------
-        instance_of_current_cls : Current class
-            An instance constructed from the serialized representation.
+        Parameters
+        ----------
+        fancytype_instance : `fancytype_cls`
+            The instance to add, where ``fancytype_cls`` is the attribute
+            :attr:`~fancytypes.SQLiteStore.fancytype_cls`.
 
         """
-        kwargs = {"obj": serialized_rep,
-                  "obj_name": "serialized_rep",
-                  "accepted_types": (str, bytes, bytearray)}
-        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
-        
-        try:
-            serializable_rep = json.loads(serialized_rep)
-        except:
-            raise ValueError(_pre_serializable_err_msg_10)
+        self.add_many(fancytype_instances=(fancytype_instance,))
 
-        kwargs = {"serializable_rep": \
-                  serializable_rep,
-                  "skip_validation_and_conversion": \
-                  skip_validation_and_conversion}
-        instance_of_current_cls = cls.de_pre_serialize(**kwargs)
-                
-        return instance_of_current_cls
+        return None
 
 
 
-    @classmethod
-    def load(cls,
-             filename=\
-             _default_filename,
-             skip_validation_and_conversion=\
-             _default_skip_validation_and_conversion):
-        r"""Construct an instance from a serialized representation that is 
-        stored in a JSON file.
+    def add_many(self, fancytype_instances=_default_fancytype_instances):
+        r"""Add a sequence of instances to the store, in a single transaction.
 
-        Users can save serialized representations to JSON files using the method
-        :meth:`fancytypes.PreSerializable.dump`.
+        If an exception is raised while adding the instances, then none of the
+        instances are added.
 
         Parameters
         ----------
-        filename : `str`, optional
-            The relative or absolute path to the JSON file that is storing the
-            serialized representation of an instance.
+        fancytype_instances : `array_like` (`fancytype_cls`, ndim=1), optional
+            The instances to add, where ``fancytype_cls`` is the attribute
+            :attr:`~fancytypes.SQLiteStore.fancytype_cls`.
 
-            ``filename`` is expected to be such that ``json.load(open(filename,
-            "r"))`` does not raise an exception.
-
-            Let ``serializable_rep=json.load(open(filename, "r"))``.
+        """
+        kwargs = {"obj": fancytype_instances,
+                  "obj_name": "fancytype_instances",
+                  "accepted_types": (list, tuple)}
+        czekitout.check.if_instance_of_any_accepted_types(**kwargs)
 
-            Let ``validation_and_conversion_funcs`` and
-            ``de_pre_serialization_funcs`` denote the attributes
-            :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-            :attr:`~fancytypes.PreSerializable.de_pre_serialization_funcs`
-            respectively, both of which being `dict` objects as well.
+        rows = []
+        for fancytype_instance in fancytype_instances:
+            kwargs = {"obj": fancytype_instance,
+                      "obj_name": "fancytype_instance",
+                      "accepted_types": (self._fancytype_cls,)}
+            czekitout.check.if_instance_of_any_accepted_types(**kwargs)
 
-            ``filename`` is also expected to be such that
-            ``de_pre_serialization_funcs[key](serializable_rep[key])`` does not
-            raise an exception for each `dict` key ``key`` in
-            ``de_pre_serialization_funcs``.
+            serializable_rep = fancytype_instance.pre_serialize()
+            row = (json.dumps(serializable_rep, ensure_ascii=False),)
+            
+            for indexed_attr_name in self._indexed_attr_names:
+                indexed_value = serializable_rep[indexed_attr_name]
+                if not _is_valid_indexed_value(indexed_value):
+                    unformatted_err_msg = _sqlite_store_err_msg_3
+                    err_msg = unformatted_err_msg.format(indexed_attr_name)
+                    raise ValueError(err_msg)
+                row += (indexed_value,)
+                
+            rows.append(row)
+
+        column_names = (("serialized_rep",)
+                        + tuple(_return_indexed_column_name(indexed_attr_name)
+                                for indexed_attr_name
+                                in self._indexed_attr_names))
+        sql_statement = ("INSERT INTO "
+                         + _quote_sql_identifier(_sqlite_table_name)
+                         + " (" + ", ".join(map(_quote_sql_identifier,
+                                                column_names))
+                         + ") VALUES (" + ", ".join("?"*len(column_names))
+                         + ")")
+
+        with self._connection:
+            self._connection.executemany(sql_statement, rows)
 
-            Let ``core_attrs_candidate`` be a `dict` object that has the same
-            keys as ``de_pre_serialization_funcs``, where for each `dict` key
-            ``key`` in ``serializable_rep``, ``core_attrs_candidate[key]`` is
-            set to de_pre_serialization_funcs[key](serializable_rep[key])``.
+        return None
 
-            ``filename`` is also expected to be such that
-            ``validation_and_conversion_funcs[key](core_attrs_candidate)`` does
-            not raise an exception for each `dict` key ``key`` in
-            ``serializable_rep``.
-        skip_validation_and_conversion : `bool`, optional
-            Let ``core_attrs`` denote the attribute
-            :attr:`~fancytypes.Checkable.core_attrs`, which is a `dict` object.
 
-            Let ``core_attrs_candidate`` be as defined in the above description
-            of ``filename``.
 
-            If ``skip_validation_and_conversion`` is set to ``False``, then for
-            each key ``key`` in ``core_attrs_candidate``, ``core_attrs[key]`` is
-            set to ``validation_and_conversion_funcs[key]
-            (core_attrs_candidate)``, , with ``validation_and_conversion_funcs``
-            and ``core_attrs_candidate`` being introduced in the above
-            description of ``filename``.
+    def query(self,
+              conditions=\
+              _default_conditions,
+              skip_validation_and_conversion=\
+              _default_skip_validation_and_conversion):
+        r"""Query the store for the instances that satisfy a set of conditions
+        on the indexed attributes.
 
-            Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
-            then ``core_attrs`` is set to ``core_attrs_candidate.copy()``. This
-            option is desired primarily when the user wants to avoid potentially
-            expensive deep copies and/or conversions of the `dict` values of
-            ``core_attrs_candidate``, as it is guaranteed that no copies or
-            conversions are made in this case.
+        Parameters
+        ----------
+        conditions : `dict`, optional
+            The conditions. Each key of ``conditions`` must be the name of an
+            indexed attribute. For each key ``key`` of ``conditions``, if
+            ``conditions[key]`` is a pair ``(lower_bound, upper_bound)``, then
+            only the instances for which the pre-serialized value of the core
+            attribute ``key`` lies in the closed interval ``[lower_bound,
+            upper_bound]`` satisfy the condition, where a bound set to ``None``
+            is ignored. Otherwise, only the instances for which the
+            pre-serialized value of the core attribute ``key`` is equal to
+            ``conditions[key]`` satisfy the condition. If ``conditions`` is
+            empty, then every instance in the store satisfies the conditions.
+        skip_validation_and_conversion : `bool`, optional
+            Same as the parameter of the same name in the method
+            :meth:`fancytypes.PreSerializable.loads`, which is used to
+            construct the instances that satisfy the conditions.
 
         Returns
         -------
-        instance_of_current_cls : Current class
-            An instance constructed from the serialized representation
-            stored in the JSON file.
+        fancytype_instances : `iterator`
+            An iterator over the instances that satisfy the conditions, in the
+            order in which they were added to the store. The instances are
+            de-pre-serialized one at a time, as the iterator is consumed.
 
         """
-        params = {"filename": filename}
-        filename = _check_and_convert_filename(params)
-        
-        try:
-            with open(filename, "r") as file_obj:
-                serializable_rep = json.load(file_obj)
-        except:
-            raise IOError(_pre_serializable_err_msg_11.format(filename))
+        params = {"conditions": conditions,
+                  "indexed_attr_names": self._indexed_attr_names,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion}
+        conditions = _check_and_convert_conditions(params)
+        skip_validation_and_conversion = \
+            _check_and_convert_skip_validation_and_conversion(params)
 
-        kwargs = {"serializable_rep": \
-                  serializable_rep,
+        sql_where_clause, sql_params = _generate_sql_where_clause(conditions)
+        sql_statement = ("SELECT serialized_rep FROM "
+                         + _quote_sql_identifier(_sqlite_table_name)
+                         + sql_where_clause + " ORDER BY row_id")
+        cursor = self._connection.execute(sql_statement, sql_params)
+
+        kwargs = {"cursor": cursor,
                   "skip_validation_and_conversion": \
                   skip_validation_and_conversion}
-        instance_of_current_cls = cls.de_pre_serialize(**kwargs)
-                
-        return instance_of_current_cls
+        fancytype_instances = self._generate_fancytype_instances(**kwargs)
 
+        return fancytype_instances
 
 
-class PreSerializableAndUpdatable(PreSerializable, Updatable):
-    r"""A type that is pre-serializable, that can be constructed from a 
-    serializable representation, that can perform user-defined validations 
-    and conversions of a set of parameters upon construction, and that has an
-    updatable subset of attributes.
 
-    We define pre-serialization as the process of converting an object into a
-    form that can be subsequently serialized into a JSON format. We refer to
-    objects resulting from pre-serialization as serializable objects.
+    def _generate_fancytype_instances(self,
+                                      cursor,
+                                      skip_validation_and_conversion):
+        for (serialized_rep,) in cursor:
+            kwargs = {"serialized_rep": \
+                      serialized_rep,
+                      "skip_validation_and_conversion": \
+                      skip_validation_and_conversion}
+            yield self._fancytype_cls.loads(**kwargs)
 
-    We define de-pre-serialization as the process of converting a serializable
-    object into an instance of the current class, i.e. de-pre-serialization is
-    the reverse process of pre-serialization.
 
-    One cannot construct an instance of the class
-    :class:`fancytypes.PreSerializableAndUpdatable` without raising an
-    exception. In order to make use of this class, one must create a subclass
-    that inherits from :class:`fancytypes.PreSerializableAndUpdatable` and then
-    override the class methods
-    :class:`~fancytypes.Checkable.get_validation_and_conversion_funcs`,
-    :class:`~fancytypes.PreSerializable.pre_serialization_funcs`, and
-    :class:`~fancytypes.PreSerializable.de_pre_serialization_funcs` in ways that
-    are consistent with the respective descriptions of the methods.
 
-    Parameters
-    ----------
-    skip_validation_and_conversion : `bool`, optional
-        Let ``validation_and_conversion_funcs`` and ``core_attrs`` denote the
-        attributes :attr:`~fancytypes.Checkable.validation_and_conversion_funcs`
-        and :attr:`~fancytypes.Checkable.core_attrs` respectively, both of which
-        being `dict` objects.
+    def count(self, conditions=_default_conditions):
+        r"""Count the instances that satisfy a set of conditions on the indexed
+        attributes.
 
-        Let ``params_to_be_mapped_to_core_attrs`` denote the `dict`
-        representation of the constructor parameters excluding the parameters
-        ``skip_validation_and_conversion`` and ``skip_cls_tests``, where each
-        `dict` key ``key`` is a different constructor parameter name, excluding
-        the names ``"skip_validation_and_conversion"`` and ``"skip_cls_tests"``,
-        and ``params_to_be_mapped_to_core_attrs[key]`` would yield the value of
-        the constructor parameter with the name given by ``key``.
+        Parameters
+        ----------
+        conditions : `dict`, optional
+            The conditions. See the documentation for the method
+            :meth:`~fancytypes.SQLiteStore.query` for details.
 
-        If ``skip_validation_and_conversion`` is set to ``False``, then for each
-        key ``key`` in ``params_to_be_mapped_to_core_attrs``,
-        ``core_attrs[key]`` is set to ``validation_and_conversion_funcs[key]
-        (params_to_be_mapped_to_core_attrs)``.
+        Returns
+        -------
+        num_instances : `int`
+            The number of instances that satisfy the conditions.
 
-        Otherwise, if ``skip_validation_and_conversion`` is set to ``True``,
-        then ``core_attrs`` is set to
-        ``params_to_be_mapped_to_core_attrs.copy()``. This option is desired
-        primarily when the user wants to avoid potentially expensive deep copies
-        and/or conversions of the `dict` values of
-        ``params_to_be_mapped_to_core_attrs``, as it is guaranteed that no
-        copies or conversions are made in this case.  
-    skip_cls_test : `bool`, optional
-        If ``skip_cls_test`` is set to ``False``, then upon construction, tests
-        will be performed to check whether the class was properly
-        defined. If any of the tests fail, an exception will be raised.
+        """
+        params = {"conditions": conditions,
+                  "indexed_attr_names": self._indexed_attr_names}
+        conditions = _check_and_convert_conditions(params)
 
-        Otherwise, if ``skip_cls_test`` is set to ``True``, these tests will be
-        skipped. 
+        sql_where_clause, sql_params = _generate_sql_where_clause(conditions)
+        sql_statement = ("SELECT COUNT(*) FROM "
+                         + _quote_sql_identifier(_sqlite_table_name)
+                         + sql_where_clause)
+        cursor = self._connection.execute(sql_statement, sql_params)
+        num_instances = cursor.fetchone()[0]
 
-        One should only skip the tests if they are sure that the class is
-        properly defined. Skipping the tests will yield some improvement in
-        performance.
-    **kwargs 
-        The remaining constructor parameters.
+        return num_instances
+
+
+
+    def __len__(self):
+        return self.count()
+
+
+
+    def close(self):
+        r"""Close the connection to the SQLite database.
+
+        """
+        self._connection.close()
 
-    """
-    def __init__(self,
-                 skip_validation_and_conversion=\
-                 _default_skip_validation_and_conversion,
-                 skip_cls_tests=\
-                 _default_skip_cls_tests,
-                 **kwargs):
-        PreSerializable.__init__(self,
-                                 skip_validation_and_conversion,
-                                 skip_cls_tests,
-                                 **kwargs)
-        
         return None
 
 
@@ -1449,6 +7582,126 @@ def return_de_pre_serialization_funcs(namespace_as_dict, ctor_param_names):
 
 
 
+def _check_and_convert_validation_and_conversion_func(params):
+    obj_name = "validation_and_conversion_func"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    czekitout.check.if_callable(**kwargs)
+    validation_and_conversion_func = params[obj_name]
+
+    return validation_and_conversion_func
+
+
+
+def _check_and_convert_relevant_attr_names(params):
+    obj_name = "relevant_attr_names"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    relevant_attr_names = czekitout.convert.to_tuple_of_strs(**kwargs)
+
+    return relevant_attr_names
+
+
+
+def mark_as_memoizable(validation_and_conversion_func,
+                       relevant_attr_names,
+                       deep_copy=_default_deep_copy):
+    r"""Mark a validation and conversion function as memoizable.
+
+    A validation and conversion function ``validation_and_conversion_func``
+    can be marked as memoizable if it is pure, i.e. if its result, given a
+    `dict` ``params``, depends only on the values ``params[name]``, where
+    ``name`` runs over ``relevant_attr_names``, and if it has no side effects.
+    See the documentation for the method
+    :meth:`fancytypes.Checkable.enable_validator_memoization` for details on
+    validator memoization.
+
+    Parameters
+    ----------
+    validation_and_conversion_func : `callable`
+        The validation and conversion function.
+    relevant_attr_names : `array_like` (`str`, ndim=1)
+        The names of the core attributes that the validation and conversion
+        function depends on.
+    deep_copy : `bool`, optional
+        If ``deep_copy`` is set to ``True``, then the results of
+        ``validation_and_conversion_func`` are deep-copied upon being cached
+        and upon each cache hit. Otherwise, the cached result itself is used
+        upon each cache hit, and is thus shared by every instance whose core
+        attribute is set from it. Setting ``deep_copy`` to ``False`` avoids the
+        cost of the copies, and is safe if the results are immutable, e.g.
+        `str` or `tuple` objects of immutable objects, or if they are never
+        mutated.
+
+    Returns
+    -------
+    memoizable_func : `callable`
+        A wrapper of ``validation_and_conversion_func`` that is marked as
+        memoizable. The original function is left unmodified.
+
+    """
+    params = locals()
+    validation_and_conversion_func = \
+        _check_and_convert_validation_and_conversion_func(params)
+    relevant_attr_names = _check_and_convert_relevant_attr_names(params)
+    deep_copy = _check_and_convert_deep_copy(params)
+
+    def memoizable_func(params):
+        return validation_and_conversion_func(params)
+
+    functools.update_wrapper(memoizable_func, validation_and_conversion_func)
+    setattr(memoizable_func,
+            _name_of_attr_storing_relevant_attr_names,
+            relevant_attr_names)
+    setattr(memoizable_func, _name_of_attr_storing_deep_copy, deep_copy)
+
+    return memoizable_func
+
+
+
+def get_validator_memoization_stats():
+    r"""Return the process-wide statistics of validator memoization.
+
+    See the documentation for the method
+    :meth:`fancytypes.Checkable.enable_validator_memoization` for details on
+    validator memoization.
+
+    Returns
+    -------
+    validator_memoization_stats : `dict`
+        A `dict` object with the keys ``"num_caches"``, ``"num_entries"``,
+        ``"num_hits"``, and ``"num_misses"``, which store the number of classes
+        for which validator memoization is currently enabled, and the total
+        number of entries, cache hits, and cache misses across their caches,
+        respectively.
+
+    """
+    stats_of_each_cache = tuple(validator_cache.get_stats()
+                                for validator_cache in tuple(_validator_caches))
+
+    validator_memoization_stats = {"num_caches": len(stats_of_each_cache)}
+    for key in ("num_entries", "num_hits", "num_misses"):
+        validator_memoization_stats[key] = sum(stats[key]
+                                               for stats in stats_of_each_cache)
+
+    return validator_memoization_stats
+
+
+
+def clear_validator_memoization_caches():
+    r"""Clear the caches, and reset the statistics, of every class for which
+    validator memoization is enabled.
+
+    See the documentation for the method
+    :meth:`fancytypes.Checkable.enable_validator_memoization` for details on
+    validator memoization.
+
+    """
+    for validator_cache in tuple(_validator_caches):
+        validator_cache.clear()
+
+    return None
+
+
+
 ###########################
 ## Define error messages ##
 ###########################
@@ -1466,6 +7719,31 @@ _check_and_convert_core_attrs_candidate_err_msg_1 = \
 _checkable_err_msg_1 = \
     ("The class method ``get_validation_and_conversion_funcs`` has not been "
      "implemented.")
+_checkable_err_msg_2 = \
+    ("The error budget of {} set(s) of construction parameters that failed to "
+     "validate was exceeded at the set with index {}.")
+_checkable_err_msg_3 = \
+    ("Each set of construction parameters must be a dictionary.")
+_checkable_err_msg_4 = \
+    ("The construction parameter ``{}`` has no default value and was not "
+     "given.")
+
+_updatable_err_msg_1 = \
+    ("There is no subscription with the ID ``{}``.")
+_updatable_err_msg_2 = \
+    ("The undo/redo history of the current instance is not enabled.")
+_updatable_err_msg_3 = \
+    ("Steps of the undo/redo history cannot be undone or redone within a "
+     "``batch_update`` block.")
+_updatable_err_msg_4 = \
+    ("There are no steps of the undo/redo history to {}.")
+_updatable_err_msg_5 = \
+    ("Core attributes of nested fancytypes cannot be updated via dotted paths "
+     "within a ``batch_update`` block.")
+_updatable_err_msg_6 = \
+    ("The core attribute ``'{}'`` must be an instance of the class "
+     "`fancytypes.Updatable` in order to update its core attributes via "
+     "dotted paths.")
 
 _preliminary_check_of_pre_serialization_funcs_err_msg_1 = \
     ("The objects ``pre_serialization_funcs`` and "
@@ -1481,6 +7759,35 @@ _preliminary_check_of_de_pre_serialization_funcs_err_msg_2 = \
     ("The objects ``de_pre_serialization_funcs`` must be a dictionary with "
      "values set to only callable objects.")
 
+_read_archive_err_msg_1 = \
+    ("The raw array data of the core attribute ``'{}'`` is inconsistent with "
+     "its dtype and shape as recorded in the manifest of the archive file.")
+
+_incremental_json_obj_reader_err_msg_1 = \
+    ("The JSON document must consist of a single JSON object.")
+_incremental_json_obj_reader_err_msg_2 = \
+    ("Extra data after the end of the JSON object.")
+
+_read_journal_err_msg_1 = \
+    ("The journal does not contain a complete snapshot.")
+
+_check_and_convert_embed_digest_err_msg_1 = \
+    ("A digest can only be embedded in a file if the object ``file_format`` is "
+     "set to ``'json'``.")
+
+_check_and_convert_trusted_digests_err_msg_1 = \
+    ("The object ``trusted_digests`` must be either ``None`` or a container of "
+     "strings, e.g. a set.")
+
+_verify_and_strip_embedded_digest_err_msg_1 = \
+    ("The digest embedded in the file does not match either its content or "
+     "the class used to load it: the file may have been corrupted or tampered "
+     "with.")
+
+_check_and_convert_fields_err_msg_1 = \
+    ("The object ``fields`` contains the string ``'{}'``, which is not the "
+     "name of a core attribute of the current class.")
+
 _pre_serializable_err_msg_1 = \
     ("An error occurred in testing the instance method ``pre_serialize``: see "
      "the remaining traceback for details.")
@@ -1512,6 +7819,136 @@ _pre_serializable_err_msg_10 = \
     ("The object ``serialized_rep`` must be a valid JSON document.")
 _pre_serializable_err_msg_11 = \
     ("The filename ``'{}'`` is invalid: see the traceback for details.")
+_pre_serializable_err_msg_12 = \
+    ("Cannot memory-map the file at the path ``'{}'`` because it is not an "
+     "archive file: the object ``mmap`` can only be set to ``True`` for files "
+     "that were saved with the object ``file_format`` set to ``'archive'``.")
+_pre_serializable_err_msg_13 = \
+    ("Cannot memory-map the file at the path ``'{}'`` because it is "
+     "compressed.")
+_pre_serializable_err_msg_14 = \
+    ("Text streams can only store uncompressed JSON documents: if the object "
+     "``filename`` is an instance of ``io.TextIOBase``, then the object "
+     "``file_format`` must be set to ``'json'``, and the object "
+     "``compression`` must be set to either ``'infer'`` or ``'none'``.")
+_pre_serializable_err_msg_15 = \
+    ("An error occurred in trying to write the serialized representation to "
+     "the file object ``filename``: see the traceback for details.")
+_pre_serializable_err_msg_16 = \
+    ("Cannot memory-map a file object: the object ``mmap`` can only be set to "
+     "``True`` if the object ``filename`` is a path.")
+_pre_serializable_err_msg_17 = \
+    ("An error occurred in trying to read a serialized representation from the "
+     "file object ``filename``: see the traceback for details.")
+_pre_serializable_err_msg_18 = \
+    ("Failed to construct the partial view of the core attributes specified by "
+     "the object ``fields``: either the serialized representation is invalid, "
+     "or the current class does not support partial construction, e.g. because "
+     "one of its validation and conversion functions accesses other core "
+     "attributes other than via subscription: see the traceback for details.")
+
+_pre_serializable_and_updatable_err_msg_1 = \
+    ("The object ``patch`` has the key ``'{}'``, which is not the name of a "
+     "core attribute of the current instance.")
+_pre_serializable_and_updatable_err_msg_2 = \
+    ("Failed to apply the patch: see the remaining traceback for details.")
+_pre_serializable_and_updatable_err_msg_3 = \
+    ("The object ``serialized_patch`` must be a valid JSON document.")
+_pre_serializable_and_updatable_err_msg_4 = \
+    ("Cannot enable journaling to a file at the path ``'{}'`` because a file "
+     "already exists there and the object ``overwrite`` was set to ``False``, "
+     "which prohibits overwriting the original file.")
+_pre_serializable_and_updatable_err_msg_5 = \
+    ("An error occurred in trying to write a snapshot to the journal file at "
+     "the path ``'{}'``: see the traceback for details.")
+_pre_serializable_and_updatable_err_msg_6 = \
+    ("The update was applied, but an error occurred in trying to record it in "
+     "the journal file, hence journaling has been disabled: see the traceback "
+     "for details.")
+
+_check_and_convert_filenames_err_msg_1 = \
+    ("The objects ``filenames`` and ``fancytype_instances`` must be of the "
+     "same length.")
+_check_and_convert_filenames_err_msg_2 = \
+    ("The object ``filenames`` must not contain multiple paths to the same "
+     "file.")
+
+_batch_dump_err_msg_1 = \
+    _pre_serializable_err_msg_8
+_batch_dump_err_msg_2 = \
+    ("An error occurred in trying to save the serialized representations to "
+     "the files at the paths stored in ``filenames``: see the traceback for "
+     "details.")
+
+_check_and_convert_base_err_msg_1 = \
+    ("The object ``base`` must be an instance of ``fancytypes.Checkable``.")
+
+_check_and_convert_axes_err_msg_1 = \
+    ("The object ``axes`` has the key ``'{}'``, which is not the name of a "
+     "core attribute of the object ``base``.")
+
+_check_and_convert_fancytype_cls_err_msg_1 = \
+    ("The object ``fancytype_cls`` must be a subclass of "
+     "``fancytypes.Checkable``.")
+
+_check_and_convert_columns_err_msg_1 = \
+    ("The keys of the object ``columns`` must be the same as the names of the "
+     "core attributes of the class ``fancytype_cls``.")
+_check_and_convert_columns_err_msg_2 = \
+    ("The columns stored in the object ``columns`` must all be of the same "
+     "length.")
+
+_check_and_convert_column_validation_and_conversion_funcs_err_msg_1 = \
+    ("The object ``column_validation_and_conversion_funcs`` has the key "
+     "``'{}'``, which is not the name of a core attribute of the class "
+     "``fancytype_cls``.")
+
+_validate_and_convert_column_err_msg_1 = \
+    ("The column-level validation and conversion function for the core "
+     "attribute ``'{}'`` returned a column of the wrong length.")
+
+_columnar_collection_err_msg_1 = \
+    ("The class ``fancytype_cls`` must be a subclass of "
+     "``fancytypes.PreSerializable`` in order for columnar collections of its "
+     "instances to be pre-serialized or de-pre-serialized.")
+_columnar_collection_err_msg_2 = \
+    _pre_serializable_err_msg_8
+_columnar_collection_err_msg_3 = \
+    _pre_serializable_err_msg_9
+_columnar_collection_err_msg_4 = \
+    ("Failed to perform de-pre-serialization: see the remaining traceback for "
+     "details.")
+_columnar_collection_err_msg_5 = \
+    _pre_serializable_err_msg_10
+_columnar_collection_err_msg_6 = \
+    _pre_serializable_err_msg_11
+
+_check_and_convert_pre_serializable_cls_err_msg_1 = \
+    ("The object ``fancytype_cls`` must be a subclass of "
+     "``fancytypes.PreSerializable``.")
+
+_check_and_convert_indexed_attr_names_err_msg_1 = \
+    ("The object ``indexed_attr_names`` contains the string ``'{}'``, which is "
+     "not the name of a core attribute of the class ``fancytype_cls``.")
+
+_check_and_convert_conditions_err_msg_1 = \
+    ("The object ``conditions`` has the key ``'{}'``, which is not the name "
+     "of an indexed attribute.")
+_check_and_convert_conditions_err_msg_2 = \
+    ("The condition ``conditions['{}']`` is a sequence, and therefore must be "
+     "a pair of the form ``(lower_bound, upper_bound)``.")
+
+_sqlite_store_err_msg_1 = \
+    ("Failed to open the SQLite database at the path ``'{}'``: see the "
+     "traceback for details.")
+_sqlite_store_err_msg_2 = \
+    ("The SQLite database at the path ``'{}'`` stores instances with a set of "
+     "indexed attributes that is different from the one specified by the "
+     "object ``indexed_attr_names``.")
+_sqlite_store_err_msg_3 = \
+    ("The pre-serialized value of the indexed attribute ``'{}'`` must be "
+     "``None``, a boolean, an integer representable as a 64-bit signed "
+     "integer, a real number, or a string.")
 
 _return_subset_of_funcs_from_given_namespace_err_msg_1 = \
     ("The object ``namespace_as_dict`` is missing the key ``'{}'``.")
@@ -30,7 +30,22 @@ import pytest
 # For removing files.
 import pathlib
 
+# For in-memory binary and text streams.
+import io
 
+# For serializing JSON objects.
+import json
+
+# For waiting on background threads.
+import time
+
+# For updating instances concurrently.
+import threading
+
+
+
+# For general array handling.
+import numpy as np
 
 # For validating and converting objects.
 import czekitout.check
@@ -80,6 +95,15 @@ def _check_and_convert_word(params):
 
 
 
+def _check_and_convert_real_array(params):
+    obj_name = "real_array"
+    kwargs = {"obj": params[obj_name], "obj_name": obj_name}
+    real_array = czekitout.convert.to_real_numpy_array(**kwargs)
+
+    return real_array
+
+
+
 def _pre_serialize_slice_obj(slice_obj):
     serializable_rep = {"start": slice_obj.start, 
                         "stop": slice_obj.stop, 
@@ -103,6 +127,13 @@ def _pre_serialize_word(word):
 
 
 
+def _pre_serialize_real_array(real_array):
+    serializable_rep = real_array.tolist()
+    
+    return serializable_rep
+
+
+
 def _de_pre_serialize_slice_obj(serializable_rep):
     slice_obj = slice(serializable_rep["start"], 
                       serializable_rep["stop"], 
@@ -126,6 +157,13 @@ def _de_pre_serialize_word(serializable_rep):
 
 
 
+def _de_pre_serialize_real_array(serializable_rep):
+    real_array = np.array(serializable_rep)
+    
+    return real_array
+
+
+
 class PreSerializableAndUpdatableCls1(fancytypes.PreSerializableAndUpdatable):
     ctor_param_names = ("slice_obj", "nonnegative_int")
     kwargs = {"namespace_as_dict": globals(),
@@ -441,222 +479,2415 @@ class PreSerializableAndUpdatableCls11(PreSerializableAndUpdatableCls1):
 
 
 
-def test_1_of_return_validation_and_conversion_funcs():
-    with pytest.raises(KeyError) as err_info:
-        kwargs = {"namespace_as_dict": globals(), "ctor_param_names": ("foo",)}
+class PreSerializableAndUpdatableCls12(PreSerializableAndUpdatableCls1):
+    ctor_param_names = ("real_array", "word")
+    kwargs = {"namespace_as_dict": globals(),
+              "ctor_param_names": ctor_param_names}
+    
+    _validation_and_conversion_funcs_ = \
         fancytypes.return_validation_and_conversion_funcs(**kwargs)
+    _pre_serialization_funcs_ = \
+        fancytypes.return_pre_serialization_funcs(**kwargs)
+    _de_pre_serialization_funcs_ = \
+        fancytypes.return_de_pre_serialization_funcs(**kwargs)
 
-    return None
+    del ctor_param_names, kwargs
 
+    
 
+    def __init__(self,
+                 real_array=((1.0, 2.0), (3.0, 4.0)),
+                 word="foo",
+                 skip_validation_and_conversion=False,
+                 skip_cls_tests=False):
+        ctor_params = {key: val
+                       for key, val in locals().items()
+                       if (key not in ("self", "__class__"))}
+        kwargs = ctor_params
+        fancytypes.PreSerializableAndUpdatable.__init__(self, **kwargs)
 
-def test_1_of_PreSerializableAndUpdatable():
-    slice_obj_1 = slice(None, 6, 1)
-    slice_obj_2 = slice(3, None, 1)
+        return None
 
-    kwargs = {"slice_obj": slice_obj_1,
-              "nonnegative_int": 5.0,
-              "skip_validation_and_conversion": False}
-    fancytype_instance = PreSerializableAndUpdatableCls1(**kwargs)
 
-    new_core_attr_subset_candidate = {"slice_obj": slice_obj_2,
-                                      "not_a_core_attr": None}
-    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
-              "skip_validation_and_conversion": False}
-    fancytype_instance.update(**kwargs)
-        
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
-    assert core_attrs["slice_obj"] == slice_obj_2
-    assert core_attrs["slice_obj"] is not slice_obj_2
 
-    new_core_attr_subset_candidate = {"slice_obj": slice_obj_1}
-    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
-              "skip_validation_and_conversion": True}
-    fancytype_instance.update(**kwargs)
+class PreSerializableAndUpdatableCls13(PreSerializableAndUpdatableCls1):
+    ctor_param_names = ("nonnegative_int", "word", "real_array")
+    kwargs = {"namespace_as_dict": globals(),
+              "ctor_param_names": ctor_param_names}
+    
+    _validation_and_conversion_funcs_ = \
+        fancytypes.return_validation_and_conversion_funcs(**kwargs)
+    _pre_serialization_funcs_ = \
+        fancytypes.return_pre_serialization_funcs(**kwargs)
+    _de_pre_serialization_funcs_ = \
+        fancytypes.return_de_pre_serialization_funcs(**kwargs)
 
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
-    assert core_attrs["slice_obj"] is slice_obj_1
+    del ctor_param_names, kwargs
 
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=True)
-    assert core_attrs["slice_obj"] is not slice_obj_1
+    
 
-    kwargs = {"slice_obj": slice_obj_1,
-              "nonnegative_int": 5.0,
-              "skip_validation_and_conversion": True}
-    fancytype_instance = PreSerializableAndUpdatableCls1(**kwargs)
+    def __init__(self,
+                 nonnegative_int=0,
+                 word="foo",
+                 real_array=((1.0, 2.0), (3.0, 4.0)),
+                 skip_validation_and_conversion=False,
+                 skip_cls_tests=False):
+        ctor_params = {key: val
+                       for key, val in locals().items()
+                       if (key not in ("self", "__class__"))}
+        kwargs = ctor_params
+        fancytypes.PreSerializableAndUpdatable.__init__(self, **kwargs)
 
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
-    assert core_attrs["slice_obj"] is slice_obj_1
+        return None
 
-    fancytype_instance.validation_and_conversion_funcs
-    fancytype_instance.pre_serialization_funcs
-    fancytype_instance.de_pre_serialization_funcs
 
-    for ctor_param_name in ("slice_obj", "nonnegative_int"):
-        kwargs = core_attrs
-        kwargs[ctor_param_name] = None
-        kwargs["skip_validation_and_conversion"] = False
-        with pytest.raises(TypeError) as err_info:
-            fancytype_instance = PreSerializableAndUpdatableCls1(**kwargs)
-        
-    return None
 
+class PreSerializableAndUpdatableCls14(PreSerializableAndUpdatableCls13):
+    @classmethod
+    def get_column_validation_and_conversion_funcs(cls):
+        column_validation_and_conversion_funcs = \
+            {"nonnegative_int": _check_and_convert_nonnegative_int_column}
 
+        return column_validation_and_conversion_funcs
 
-def test_2_of_PreSerializableAndUpdatable():
-    kwargs = {"slice_obj": slice(None, 6, 1),
-              "nonnegative_int": 5.0,
-              "skip_validation_and_conversion": True}
-    fancytype_instance_A = PreSerializableAndUpdatableCls1(**kwargs)
-    fancytype_instances = (fancytype_instance_A,)
 
-    filename = "fancytype.json"
-    fancytype_instance_A.dump(filename, overwrite=True)
-    fancytype_instance_A.dump(filename, overwrite=True)
-    with pytest.raises(IOError) as err_info:
-        fancytype_instance_A.dump(filename, overwrite=False)
 
-    serializable_rep = fancytype_instance_A.pre_serialize()
-    serialized_rep = fancytype_instance_A.dumps()
+def _check_and_convert_short_word(params):
+    word = _check_and_convert_word(params)
+    if len(word) > params["nonnegative_int"]:
+        raise ValueError("The word is too long.")
 
-    cls_alias = PreSerializableAndUpdatableCls1
-    cls_methods = (cls_alias.loads, cls_alias.load, cls_alias.de_pre_serialize)
-    param_name_subset = ("serialized_rep", "filename", "serializable_rep")
-    param_val_subset = (serialized_rep, filename, serializable_rep)
-    zip_obj = zip(cls_methods, param_name_subset, param_val_subset)
+    return word
 
-    for cls_method, param_name, param_val in zip_obj:
-        for skip_validation_and_conversion in (True, False):
-            kwargs = {"skip_validation_and_conversion": \
-                      skip_validation_and_conversion,
-                      param_name: \
-                      param_val}
-            fancytype_instance_B = cls_method(**kwargs)
 
-            core_attrs_A = fancytype_instance_A.core_attrs
-            core_attrs_B = fancytype_instance_B.core_attrs
-            assert (core_attrs_A == core_attrs_B)
 
-    with pytest.raises(ValueError) as err_info:
-        cls_alias.loads(serialized_rep="foo")
+class PreSerializableAndUpdatableCls15(PreSerializableAndUpdatableCls13):
+    @classmethod
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+        validation_and_conversion_funcs["word"] = _check_and_convert_short_word
 
-    pathlib.Path(filename).unlink()
+        return validation_and_conversion_funcs
 
-    with pytest.raises(IOError) as err_info:
-        kwargs = {"filename": filename, "skip_validation_and_conversion": False}
-        cls_alias.load(**kwargs)
 
-    with pytest.raises(ValueError) as err_info:
-        serializable_rep["foo"] = None
-        kwargs = {"serializable_rep": serializable_rep,
-                  "skip_validation_and_conversion": False}
-        cls_alias.de_pre_serialize(**kwargs)
 
-    return None
+def _check_and_convert_word_within_bound(params):
+    word = _check_and_convert_word(params)
+    if (("nonnegative_int" in params)
+        and (len(word) > params.get("nonnegative_int"))):
+        raise ValueError("The word is too long.")
 
+    return word
 
 
-def test_3_of_PreSerializableAndUpdatable():
-    slice_obj_1 = slice(None, 6, 1)
-    slice_obj_2 = slice(3, None, 1)
 
-    kwargs = {"slice_obj": slice_obj_1,
-              "nonnegative_int": 5.0,
-              "word": "foo"}
-    fancytype_instance = PreSerializableAndUpdatableCls2(**kwargs)
+class PreSerializableAndUpdatableCls20(PreSerializableAndUpdatableCls13):
+    @classmethod
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+        validation_and_conversion_funcs["word"] = \
+            _check_and_convert_word_within_bound
 
-    new_core_attr_subset_candidate = {"slice_obj": slice_obj_2,
-                                      "not_a_core_attr": None}
-    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
-              "skip_validation_and_conversion": False}
-    fancytype_instance.update(**kwargs)
-        
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
-    assert core_attrs["slice_obj"] == slice_obj_2
-    assert core_attrs["slice_obj"] is not slice_obj_2
+        return validation_and_conversion_funcs
 
-    new_core_attr_subset_candidate = {"slice_obj": slice_obj_1}
-    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
-              "skip_validation_and_conversion": True}
-    fancytype_instance.update(**kwargs)
 
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
-    assert core_attrs["slice_obj"] is slice_obj_1
 
-    core_attrs = fancytype_instance.get_core_attrs(deep_copy=True)
-    assert core_attrs["slice_obj"] is not slice_obj_1
+class PreSerializableAndUpdatableCls16(PreSerializableAndUpdatableCls14):
+    def __init__(self,
+                 nonnegative_int,
+                 word="foo",
+                 real_array=((1.0, 2.0), (3.0, 4.0)),
+                 skip_validation_and_conversion=False,
+                 skip_cls_tests=False):
+        ctor_params = {key: val
+                       for key, val in locals().items()
+                       if (key not in ("self", "__class__"))}
+        kwargs = ctor_params
+        fancytypes.PreSerializableAndUpdatable.__init__(self, **kwargs)
 
-    kwargs = {"serializable_rep": fancytype_instance.pre_serialize(),
-              "skip_validation_and_conversion": False}
-    PreSerializableAndUpdatableCls2.de_pre_serialize(**kwargs)
-        
-    return None
+        return None
 
 
 
-def test_4_of_PreSerializableAndUpdatable():
-    cls_set_1 = (fancytypes.Checkable,
-                 fancytypes.Updatable,
-                 fancytypes.PreSerializable,
-                 fancytypes.PreSerializableAndUpdatable)
-    for cls in cls_set_1:
-        with pytest.raises(NotImplementedError) as err_info:
-            cls()
+class PreSerializableAndUpdatableCls17(PreSerializableAndUpdatableCls13):
+    @classmethod
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+        for core_attr_name in ("word", "real_array"):
+            validation_and_conversion_func = \
+                validation_and_conversion_funcs[core_attr_name]
+            kwargs = {"validation_and_conversion_func": \
+                      validation_and_conversion_func,
+                      "relevant_attr_names": \
+                      (core_attr_name,)}
+            validation_and_conversion_funcs[core_attr_name] = \
+                fancytypes.mark_as_memoizable(**kwargs)
 
-    with pytest.raises(NotImplementedError) as err_info:
-        fancytypes.PreSerializable.get_pre_serialization_funcs()
-    with pytest.raises(NotImplementedError) as err_info:
-        fancytypes.PreSerializable.get_de_pre_serialization_funcs()
+        return validation_and_conversion_funcs
 
-    with pytest.raises(ValueError) as err_info:
-        kwargs = {"slice_obj": slice(None, 6, 1),
-                  "nonnegative_int": 5.0,
-                  "skip_validation_and_conversion": False,
-                  "skip_cls_tests": False}
-        PreSerializableAndUpdatableCls3(**kwargs)
 
-    with pytest.raises(ValueError) as err_info:
-        serializable_rep = {"slice_obj": {"start": 0, "stop": 1, "step": 1},
-                            "nonnegative_int": 5}
-        kwargs = {"serializable_rep": serializable_rep,
-                  "skip_validation_and_conversion": False}
-        PreSerializableAndUpdatableCls3.de_pre_serialize(**kwargs)
 
-    kwargs = {"slice_obj": slice(None, 6, 1),
-              "nonnegative_int": 5.0,
-              "skip_validation_and_conversion": False,
-              "skip_cls_tests": False}
-    with pytest.raises(ValueError) as err_info:
-        PreSerializableAndUpdatableCls4(**kwargs)
+def _check_and_convert_truncated_word(params):
+    word = _check_and_convert_word(params)[:params["nonnegative_int"]]
 
-    kwargs["skip_cls_tests"] = True
-    fancytype_instance = PreSerializableAndUpdatableCls4(**kwargs)
+    return word
 
-    with pytest.raises(IOError) as err_info:
-        kwargs = {"filename": "fancytype.json", "overwrite": True}
-        fancytype_instance.dump(**kwargs)
 
-    cls_set_2 = (PreSerializableAndUpdatableCls5,
-                 PreSerializableAndUpdatableCls6,
-                 PreSerializableAndUpdatableCls7)
-    for cls in cls_set_2:
-        with pytest.raises(TypeError) as err_info:
-            cls()
-        
-    return None
 
+def _check_and_convert_real_array_of_bounded_length(params):
+    real_array = _check_and_convert_real_array(params)
+    if len(real_array) > len(params["word"]):
+        raise ValueError("The real array is too long.")
 
+    return real_array
 
-def test_5_of_PreSerializableAndUpdatable():
-    cls_set = (PreSerializableAndUpdatableCls8,
-               PreSerializableAndUpdatableCls9,
-               PreSerializableAndUpdatableCls10)
-    for cls in cls_set:
-        with pytest.raises(KeyError) as err_info:
-            cls()
 
-    PreSerializableAndUpdatableCls11()
-        
+
+class PreSerializableAndUpdatableCls21(PreSerializableAndUpdatableCls13):
+    @classmethod
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+        validation_and_conversion_funcs["word"] = \
+            _check_and_convert_truncated_word
+        kwargs = {"validation_and_conversion_func": \
+                  _check_and_convert_real_array_of_bounded_length,
+                  "relevant_attr_names": \
+                  ("word", "real_array")}
+        validation_and_conversion_funcs["real_array"] = \
+            fancytypes.mark_as_memoizable(**kwargs)
+
+        return validation_and_conversion_funcs
+
+
+
+def _check_and_convert_nested(params):
+    obj_name = "nested"
+    kwargs = {"obj": params[obj_name],
+              "obj_name": obj_name,
+              "accepted_types": (PreSerializableAndUpdatableCls15,
+                                 PreSerializableAndUpdatableCls18,
+                                 type(None))}
+    czekitout.check.if_instance_of_any_accepted_types(**kwargs)
+    nested = (PreSerializableAndUpdatableCls15(nonnegative_int=5, word="abc")
+              if (params[obj_name] is None)
+              else copy.deepcopy(params[obj_name]))
+
+    return nested
+
+
+
+def _check_and_convert_upper_bound(params):
+    nonnegative_int = _check_and_convert_nonnegative_int(params)
+    nested_core_attrs = params["nested"].get_core_attrs(deep_copy=False)
+    if nonnegative_int < nested_core_attrs["nonnegative_int"]:
+        raise ValueError("The upper bound is too small.")
+
+    return nonnegative_int
+
+
+
+def _pre_serialize_nested(nested):
+    serializable_rep = {"cls": type(nested).__name__,
+                        "core_attrs": nested.pre_serialize()}
+    
+    return serializable_rep
+
+
+
+def _de_pre_serialize_nested(serializable_rep):
+    cls_alias = globals()[serializable_rep["cls"]]
+    nested = cls_alias.de_pre_serialize(serializable_rep["core_attrs"])
+    
+    return nested
+
+
+
+class PreSerializableAndUpdatableCls18(PreSerializableAndUpdatableCls1):
+    ctor_param_names = ("nested", "nonnegative_int")
+    kwargs = {"namespace_as_dict": globals(),
+              "ctor_param_names": ctor_param_names}
+    
+    _validation_and_conversion_funcs_ = \
+        fancytypes.return_validation_and_conversion_funcs(**kwargs)
+    _pre_serialization_funcs_ = \
+        fancytypes.return_pre_serialization_funcs(**kwargs)
+    _de_pre_serialization_funcs_ = \
+        fancytypes.return_de_pre_serialization_funcs(**kwargs)
+
+    del ctor_param_names, kwargs
+
+    
+
+    def __init__(self,
+                 nested=None,
+                 nonnegative_int=5,
+                 skip_validation_and_conversion=False,
+                 skip_cls_tests=False):
+        ctor_params = {key: val
+                       for key, val in locals().items()
+                       if (key not in ("self", "__class__"))}
+        kwargs = ctor_params
+        fancytypes.PreSerializableAndUpdatable.__init__(self, **kwargs)
+
+        return None
+
+
+    
+    @classmethod
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+        validation_and_conversion_funcs["nonnegative_int"] = \
+            _check_and_convert_upper_bound
+
+        return validation_and_conversion_funcs
+
+
+
+def _check_and_convert_other_nested(params):
+    kwargs = {"params": {"nested": params["other_nested"]}}
+    other_nested = _check_and_convert_nested(**kwargs)
+
+    return other_nested
+
+
+
+# Objects are only shared between core attributes that are pre-serialized, or
+# de-pre-serialized, by the same functions.
+_pre_serialize_other_nested = _pre_serialize_nested
+_de_pre_serialize_other_nested = _de_pre_serialize_nested
+
+
+
+class PreSerializableAndUpdatableCls19(PreSerializableAndUpdatableCls1):
+    ctor_param_names = ("nested", "real_array", "other_nested")
+    kwargs = {"namespace_as_dict": globals(),
+              "ctor_param_names": ctor_param_names}
+    
+    _validation_and_conversion_funcs_ = \
+        fancytypes.return_validation_and_conversion_funcs(**kwargs)
+    _pre_serialization_funcs_ = \
+        fancytypes.return_pre_serialization_funcs(**kwargs)
+    _de_pre_serialization_funcs_ = \
+        fancytypes.return_de_pre_serialization_funcs(**kwargs)
+
+    del ctor_param_names, kwargs
+
+    
+
+    def __init__(self,
+                 nested=None,
+                 real_array=((1.0, 2.0), (3.0, 4.0)),
+                 other_nested=None,
+                 skip_validation_and_conversion=False,
+                 skip_cls_tests=False):
+        ctor_params = {key: val
+                       for key, val in locals().items()
+                       if (key not in ("self", "__class__"))}
+        kwargs = ctor_params
+        fancytypes.PreSerializableAndUpdatable.__init__(self, **kwargs)
+
+        return None
+
+
+
+class UpdatableCls1(fancytypes.Updatable):
+    ctor_param_names = ("real_array", "word")
+    kwargs = {"namespace_as_dict": globals(),
+              "ctor_param_names": ctor_param_names}
+    
+    _validation_and_conversion_funcs_ = \
+        fancytypes.return_validation_and_conversion_funcs(**kwargs)
+
+    del ctor_param_names, kwargs
+
+    
+
+    def __init__(self,
+                 real_array=((1.0, 2.0), (3.0, 4.0)),
+                 word="foo",
+                 skip_validation_and_conversion=False,
+                 skip_cls_tests=False):
+        ctor_params = {key: val
+                       for key, val in locals().items()
+                       if (key not in ("self", "__class__"))}
+        kwargs = ctor_params
+        fancytypes.Updatable.__init__(self, **kwargs)
+
+        return None
+
+
+    
+    @classmethod
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+
+        return validation_and_conversion_funcs
+
+
+
+def test_1_of_return_validation_and_conversion_funcs():
+    with pytest.raises(KeyError) as err_info:
+        kwargs = {"namespace_as_dict": globals(), "ctor_param_names": ("foo",)}
+        fancytypes.return_validation_and_conversion_funcs(**kwargs)
+
+    return None
+
+
+
+def test_1_of_PreSerializableAndUpdatable():
+    slice_obj_1 = slice(None, 6, 1)
+    slice_obj_2 = slice(3, None, 1)
+
+    kwargs = {"slice_obj": slice_obj_1,
+              "nonnegative_int": 5.0,
+              "skip_validation_and_conversion": False}
+    fancytype_instance = PreSerializableAndUpdatableCls1(**kwargs)
+
+    new_core_attr_subset_candidate = {"slice_obj": slice_obj_2,
+                                      "not_a_core_attr": None}
+    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
+              "skip_validation_and_conversion": False}
+    fancytype_instance.update(**kwargs)
+        
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    assert core_attrs["slice_obj"] == slice_obj_2
+    assert core_attrs["slice_obj"] is not slice_obj_2
+
+    new_core_attr_subset_candidate = {"slice_obj": slice_obj_1}
+    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
+              "skip_validation_and_conversion": True}
+    fancytype_instance.update(**kwargs)
+
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    assert core_attrs["slice_obj"] is slice_obj_1
+
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=True)
+    assert core_attrs["slice_obj"] is not slice_obj_1
+
+    kwargs = {"slice_obj": slice_obj_1,
+              "nonnegative_int": 5.0,
+              "skip_validation_and_conversion": True}
+    fancytype_instance = PreSerializableAndUpdatableCls1(**kwargs)
+
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    assert core_attrs["slice_obj"] is slice_obj_1
+
+    fancytype_instance.validation_and_conversion_funcs
+    fancytype_instance.pre_serialization_funcs
+    fancytype_instance.de_pre_serialization_funcs
+
+    for ctor_param_name in ("slice_obj", "nonnegative_int"):
+        kwargs = core_attrs
+        kwargs[ctor_param_name] = None
+        kwargs["skip_validation_and_conversion"] = False
+        with pytest.raises(TypeError) as err_info:
+            fancytype_instance = PreSerializableAndUpdatableCls1(**kwargs)
+        
+    return None
+
+
+
+def test_2_of_PreSerializableAndUpdatable():
+    kwargs = {"slice_obj": slice(None, 6, 1),
+              "nonnegative_int": 5.0,
+              "skip_validation_and_conversion": True}
+    fancytype_instance_A = PreSerializableAndUpdatableCls1(**kwargs)
+    fancytype_instances = (fancytype_instance_A,)
+
+    filename = "fancytype.json"
+    fancytype_instance_A.dump(filename, overwrite=True)
+    fancytype_instance_A.dump(filename, overwrite=True)
+    with pytest.raises(IOError) as err_info:
+        fancytype_instance_A.dump(filename, overwrite=False)
+
+    serializable_rep = fancytype_instance_A.pre_serialize()
+    serialized_rep = fancytype_instance_A.dumps()
+
+    cls_alias = PreSerializableAndUpdatableCls1
+    cls_methods = (cls_alias.loads, cls_alias.load, cls_alias.de_pre_serialize)
+    param_name_subset = ("serialized_rep", "filename", "serializable_rep")
+    param_val_subset = (serialized_rep, filename, serializable_rep)
+    zip_obj = zip(cls_methods, param_name_subset, param_val_subset)
+
+    for cls_method, param_name, param_val in zip_obj:
+        for skip_validation_and_conversion in (True, False):
+            kwargs = {"skip_validation_and_conversion": \
+                      skip_validation_and_conversion,
+                      param_name: \
+                      param_val}
+            fancytype_instance_B = cls_method(**kwargs)
+
+            core_attrs_A = fancytype_instance_A.core_attrs
+            core_attrs_B = fancytype_instance_B.core_attrs
+            assert (core_attrs_A == core_attrs_B)
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.loads(serialized_rep="foo")
+
+    pathlib.Path(filename).unlink()
+
+    with pytest.raises(IOError) as err_info:
+        kwargs = {"filename": filename, "skip_validation_and_conversion": False}
+        cls_alias.load(**kwargs)
+
+    with pytest.raises(ValueError) as err_info:
+        serializable_rep["foo"] = None
+        kwargs = {"serializable_rep": serializable_rep,
+                  "skip_validation_and_conversion": False}
+        cls_alias.de_pre_serialize(**kwargs)
+
+    return None
+
+
+
+def test_3_of_PreSerializableAndUpdatable():
+    slice_obj_1 = slice(None, 6, 1)
+    slice_obj_2 = slice(3, None, 1)
+
+    kwargs = {"slice_obj": slice_obj_1,
+              "nonnegative_int": 5.0,
+              "word": "foo"}
+    fancytype_instance = PreSerializableAndUpdatableCls2(**kwargs)
+
+    new_core_attr_subset_candidate = {"slice_obj": slice_obj_2,
+                                      "not_a_core_attr": None}
+    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
+              "skip_validation_and_conversion": False}
+    fancytype_instance.update(**kwargs)
+        
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    assert core_attrs["slice_obj"] == slice_obj_2
+    assert core_attrs["slice_obj"] is not slice_obj_2
+
+    new_core_attr_subset_candidate = {"slice_obj": slice_obj_1}
+    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
+              "skip_validation_and_conversion": True}
+    fancytype_instance.update(**kwargs)
+
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    assert core_attrs["slice_obj"] is slice_obj_1
+
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=True)
+    assert core_attrs["slice_obj"] is not slice_obj_1
+
+    kwargs = {"serializable_rep": fancytype_instance.pre_serialize(),
+              "skip_validation_and_conversion": False}
+    PreSerializableAndUpdatableCls2.de_pre_serialize(**kwargs)
+        
+    return None
+
+
+
+def test_4_of_PreSerializableAndUpdatable():
+    cls_set_1 = (fancytypes.Checkable,
+                 fancytypes.Updatable,
+                 fancytypes.PreSerializable,
+                 fancytypes.PreSerializableAndUpdatable)
+    for cls in cls_set_1:
+        with pytest.raises(NotImplementedError) as err_info:
+            cls()
+
+    with pytest.raises(NotImplementedError) as err_info:
+        fancytypes.PreSerializable.get_pre_serialization_funcs()
+    with pytest.raises(NotImplementedError) as err_info:
+        fancytypes.PreSerializable.get_de_pre_serialization_funcs()
+
+    with pytest.raises(ValueError) as err_info:
+        kwargs = {"slice_obj": slice(None, 6, 1),
+                  "nonnegative_int": 5.0,
+                  "skip_validation_and_conversion": False,
+                  "skip_cls_tests": False}
+        PreSerializableAndUpdatableCls3(**kwargs)
+
+    with pytest.raises(ValueError) as err_info:
+        serializable_rep = {"slice_obj": {"start": 0, "stop": 1, "step": 1},
+                            "nonnegative_int": 5}
+        kwargs = {"serializable_rep": serializable_rep,
+                  "skip_validation_and_conversion": False}
+        PreSerializableAndUpdatableCls3.de_pre_serialize(**kwargs)
+
+    kwargs = {"slice_obj": slice(None, 6, 1),
+              "nonnegative_int": 5.0,
+              "skip_validation_and_conversion": False,
+              "skip_cls_tests": False}
+    with pytest.raises(ValueError) as err_info:
+        PreSerializableAndUpdatableCls4(**kwargs)
+
+    kwargs["skip_cls_tests"] = True
+    fancytype_instance = PreSerializableAndUpdatableCls4(**kwargs)
+
+    with pytest.raises(IOError) as err_info:
+        kwargs = {"filename": "fancytype.json", "overwrite": True}
+        fancytype_instance.dump(**kwargs)
+
+    cls_set_2 = (PreSerializableAndUpdatableCls5,
+                 PreSerializableAndUpdatableCls6,
+                 PreSerializableAndUpdatableCls7)
+    for cls in cls_set_2:
+        with pytest.raises(TypeError) as err_info:
+            cls()
+        
+    return None
+
+
+
+def test_5_of_PreSerializableAndUpdatable():
+    cls_set = (PreSerializableAndUpdatableCls8,
+               PreSerializableAndUpdatableCls9,
+               PreSerializableAndUpdatableCls10)
+    for cls in cls_set:
+        with pytest.raises(KeyError) as err_info:
+            cls()
+
+    PreSerializableAndUpdatableCls11()
+        
+    return None
+
+
+
+def test_6_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls12
+    fancytype_instance_A = cls_alias(real_array=np.arange(6.0).reshape(2, 3))
+
+    filename = "fancytype.fta"
+    kwargs = {"filename": filename, "overwrite": True, "file_format": "archive"}
+    fancytype_instance_A.dump(**kwargs)
+
+    for mmap in (False, True):
+        for skip_validation_and_conversion in (False, True):
+            kwargs = {"filename": \
+                      filename,
+                      "skip_validation_and_conversion": \
+                      skip_validation_and_conversion,
+                      "mmap": \
+                      mmap}
+            fancytype_instance_B = cls_alias.load(**kwargs)
+
+            core_attrs_A = fancytype_instance_A.get_core_attrs(deep_copy=False)
+            core_attrs_B = fancytype_instance_B.get_core_attrs(deep_copy=False)
+            assert np.all(core_attrs_A["real_array"]
+                          == core_attrs_B["real_array"])
+            assert core_attrs_A["word"] == core_attrs_B["word"]
+            assert (isinstance(core_attrs_B["real_array"], np.memmap) == mmap)
+
+    with pytest.raises(ValueError) as err_info:
+        core_attrs_B["real_array"][0, 0] = 1.0
+
+    fancytype_instance_A.update({"real_array": np.zeros((0, 3))})
+    fancytype_instance_A.dump(filename, overwrite=True, file_format="archive")
+    fancytype_instance_B = cls_alias.load(filename, mmap=True)
+    assert fancytype_instance_B.core_attrs["real_array"].shape == (0, 3)
+
+    with open(filename, "r+b") as file_obj:
+        archive_contents = file_obj.read().replace(b"[0, 3]", b"[1, 3]")
+        file_obj.seek(0)
+        file_obj.write(archive_contents)
+    with pytest.raises(IOError) as err_info:
+        cls_alias.load(filename, mmap=False)
+
+    fancytype_instance_A.update({"real_array": np.ones((3,))})
+    fancytype_instance_A.dump(filename, overwrite=True, file_format="archive")
+    with open(filename, "r+b") as file_obj:
+        file_obj.truncate(pathlib.Path(filename).stat().st_size-8)
+    for mmap in (False, True):
+        with pytest.raises(IOError) as err_info:
+            cls_alias.load(filename, mmap=mmap)
+
+    def check_and_convert_real_matrix(params):
+        real_array = _check_and_convert_real_array(params)
+        if real_array.ndim != 2:
+            raise ValueError("The real array must be 2-dimensional.")
+
+        return real_array
+
+    def check_and_convert_single_precision_real_array(params):
+        real_array = _check_and_convert_real_array(params)
+
+        return real_array.astype(np.float32)
+
+    fancytype_instance_A.update({"real_array": np.ones((5,))})
+    fancytype_instance_A.dump(filename, overwrite=True, file_format="archive")
+    monkeypatch.setitem(cls_alias._validation_and_conversion_funcs_,
+                        "real_array",
+                        check_and_convert_real_matrix)
+    for mmap in (False, True):
+        with pytest.raises(ValueError) as err_info:
+            cls_alias.load(filename, mmap=mmap)
+
+    fancytype_instance_A.update({"real_array": np.ones((5, 1))})
+    fancytype_instance_A.dump(filename, overwrite=True, file_format="archive")
+    fancytype_instance_B = cls_alias.load(filename, mmap=True)
+    core_attrs_B = fancytype_instance_B.get_core_attrs(deep_copy=False)
+    assert isinstance(core_attrs_B["real_array"], np.memmap)
+
+    monkeypatch.setitem(cls_alias._validation_and_conversion_funcs_,
+                        "real_array",
+                        check_and_convert_single_precision_real_array)
+    fancytype_instance_B = cls_alias.load(filename, mmap=True)
+    core_attrs_B = fancytype_instance_B.get_core_attrs(deep_copy=False)
+    assert (core_attrs_B["real_array"].dtype == np.float32)
+    monkeypatch.undo()
+
+    fancytype_instance_A.dump(filename, overwrite=True, file_format="json")
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename, mmap=True)
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance_A.dump(filename, overwrite=True, file_format="foo")
+
+    pathlib.Path(filename).unlink()
+        
+    return None
+
+
+
+def test_7_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls12
+    fancytype_instance_A = cls_alias()
+
+    dirname = "fancytype_dir"
+    pathlib.Path(dirname).mkdir(exist_ok=True)
+    filename = dirname + "/fancytype.json"
+
+    for fsync_policy in ("none", "file", "file_and_dir"):
+        kwargs = {"filename": filename,
+                  "overwrite": True,
+                  "fsync_policy": fsync_policy}
+        fancytype_instance_A.dump(**kwargs)
+    pathlib.Path(filename).chmod(0o600)
+    fancytype_instance_A.dump(filename, overwrite=True)
+    assert (pathlib.Path(filename).stat().st_mode & 0o777) == 0o600
+    
+    with open(filename, "r") as file_obj:
+        original_file_contents = file_obj.read()
+
+    kwargs = {"real_array": np.zeros((2,)),
+              "word": slice(None),
+              "skip_validation_and_conversion": True,
+              "skip_cls_tests": True}
+    fancytype_instance_B = cls_alias(**kwargs)
+    with pytest.raises(IOError) as err_info:
+        fancytype_instance_B.dump(filename, overwrite=True)
+
+    with open(filename, "r") as file_obj:
+        assert file_obj.read() == original_file_contents
+    assert len(tuple(pathlib.Path(dirname).iterdir())) == 1
+
+    filenames = (filename, dirname + "/fancytype_2.json")
+    kwargs = {"fancytype_instances": [fancytype_instance_A]*2,
+              "filenames": filenames,
+              "overwrite": True,
+              "fsync_policy": "file_and_dir"}
+    fancytypes.batch_dump(**kwargs)
+    for filename_of_loaded_instance in filenames:
+        fancytype_instance_C = cls_alias.load(filename_of_loaded_instance)
+        assert (fancytype_instance_C.dumps() == fancytype_instance_A.dumps())
+
+    kwargs["fancytype_instances"] = [fancytype_instance_A, fancytype_instance_B]
+    with pytest.raises(IOError) as err_info:
+        fancytypes.batch_dump(**kwargs)
+    assert len(tuple(pathlib.Path(dirname).iterdir())) == 2
+
+    kwargs["overwrite"] = False
+    with pytest.raises(IOError) as err_info:
+        fancytypes.batch_dump(**kwargs)
+
+    kwargs["filenames"] = (filename,)
+    with pytest.raises(ValueError) as err_info:
+        fancytypes.batch_dump(**kwargs)
+
+    kwargs["filenames"] = (filename, filename)
+    with pytest.raises(ValueError) as err_info:
+        fancytypes.batch_dump(**kwargs)
+
+    for fancytype_instances in (None, (None,)):
+        kwargs["fancytype_instances"] = fancytype_instances
+        with pytest.raises(TypeError) as err_info:
+            fancytypes.batch_dump(**kwargs)
+
+    for path in pathlib.Path(dirname).iterdir():
+        path.unlink()
+    pathlib.Path(dirname).rmdir()
+        
+    return None
+
+
+
+def test_8_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls12
+    fancytype_instance_A = cls_alias(real_array=np.arange(6.0).reshape(2, 3))
+
+    filenames = ("fancytype.json",
+                 "fancytype.json.gz",
+                 "fancytype.json.bz2",
+                 "fancytype.json.xz",
+                 "fancytype.json.lzma")
+    for filename in filenames:
+        for compression in ("infer", "gzip"):
+            kwargs = {"filename": filename,
+                      "overwrite": True,
+                      "compression": compression}
+            fancytype_instance_A.dump(**kwargs)
+            fancytype_instance_B = cls_alias.load(filename)
+            assert (fancytype_instance_B.dumps()
+                    == fancytype_instance_A.dumps())
+        pathlib.Path(filename).unlink()
+
+    filename = "fancytype.fta.gz"
+    kwargs = {"filename": filename, "overwrite": True, "file_format": "archive"}
+    fancytype_instance_A.dump(**kwargs)
+    fancytype_instance_B = cls_alias.load(filename, compression="gzip")
+    assert (fancytype_instance_B.dumps() == fancytype_instance_A.dumps())
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename, mmap=True)
+    with pytest.raises(IOError) as err_info:
+        cls_alias.load(filename, compression="bz2")
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename, compression="foo")
+    pathlib.Path(filename).unlink()
+
+    monkeypatch.setattr(fancytypes, "_min_num_chars_per_json_read", 1)
+
+    filename = "fancytype.json"
+    serialized_reps = (" {\n \"word\" : \"bar\" , \"real_array\":[1, 2] }\n",
+                       fancytype_instance_A.dumps())
+    for serialized_rep in serialized_reps:
+        with open(filename, "w") as file_obj:
+            file_obj.write(serialized_rep)
+        fancytype_instance_B = cls_alias.load(filename)
+        assert (fancytype_instance_B.dumps()
+                == cls_alias.loads(serialized_rep).dumps())
+
+    with open(filename, "w") as file_obj:
+        file_obj.write("{ }")
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename)
+
+    with open(filename, "w") as file_obj:
+        file_obj.write("{\"foo\": 1, \"word\": \"bar\"}")
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename)
+    assert isinstance(err_info.value.__cause__, KeyError)
+
+    def raise_keyboard_interrupt(serializable_rep):
+        raise KeyboardInterrupt
+
+    monkeypatch.setitem(cls_alias._de_pre_serialization_funcs_,
+                        "word",
+                        raise_keyboard_interrupt)
+    with open(filename, "w") as file_obj:
+        file_obj.write("{\"word\": \"bar\"}")
+    with pytest.raises(KeyboardInterrupt) as err_info:
+        cls_alias.load(filename)
+    with pytest.raises(KeyboardInterrupt) as err_info:
+        cls_alias.loads("{\"word\": \"bar\"}")
+    monkeypatch.setitem(cls_alias._de_pre_serialization_funcs_,
+                        "word",
+                        _de_pre_serialize_word)
+
+    serialized_reps = ("[1]",
+                       "{\"word\" \"bar\"}",
+                       "{1: \"bar\"}",
+                       "{\"word\": \"bar\"} {}",
+                       "{\"word\": ",
+                       "{\"word\": \"bar\"",
+                       "{\"real_array\": [tru]}",
+                       "")
+    for serialized_rep in serialized_reps:
+        with open(filename, "w") as file_obj:
+            file_obj.write(serialized_rep)
+        with pytest.raises(IOError) as err_info:
+            cls_alias.load(filename)
+
+    pathlib.Path(filename).unlink()
+        
+    return None
+
+
+
+def test_9_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls12
+    kwargs = {"real_array": np.arange(6.0).reshape(2, 3), "word": "caf\u00e9"}
+    fancytype_instance_A = cls_alias(**kwargs)
+
+    class ReadOnlyStream():
+        def __init__(self, data):
+            self.read = io.BytesIO(data).read
+
+    class WriteOnlyStream():
+        def __init__(self):
+            self.chunks = []
+
+        def write(self, data):
+            self.chunks.append(bytes(data))
+
+            return len(data)
+
+    for file_format in ("json", "archive"):
+        for compression in ("infer", "none", "gzip", "lzma"):
+            kwargs = {"file_format": file_format, "compression": compression}
+
+            file_obj = io.BytesIO()
+            fancytype_instance_A.dump(filename=file_obj, **kwargs)
+            file_obj.seek(0)
+            fancytype_instance_B = cls_alias.load(filename=file_obj)
+            assert (fancytype_instance_B.dumps()
+                    == fancytype_instance_A.dumps())
+
+            file_obj = WriteOnlyStream()
+            fancytype_instance_A.dump(filename=file_obj, **kwargs)
+            file_obj = ReadOnlyStream(b"".join(file_obj.chunks))
+            fancytype_instance_B = cls_alias.load(filename=file_obj)
+            assert (fancytype_instance_B.dumps()
+                    == fancytype_instance_A.dumps())
+
+    file_obj = io.StringIO()
+    fancytype_instance_A.dump(filename=file_obj)
+    file_obj.seek(0)
+    fancytype_instance_B = cls_alias.load(filename=file_obj)
+    assert (fancytype_instance_B.dumps() == fancytype_instance_A.dumps())
+
+    monkeypatch.setattr(fancytypes, "_min_num_chars_per_json_write", 1)
+    file_obj = io.StringIO()
+    fancytype_instance_A.dump(filename=file_obj)
+    serializable_rep = fancytype_instance_A.pre_serialize()
+    kwargs = {"obj": serializable_rep, "ensure_ascii": False, "indent": 4}
+    assert (file_obj.getvalue() == json.dumps(**kwargs))
+
+    for kwargs in ({"file_format": "archive"}, {"compression": "gzip"}):
+        with pytest.raises(ValueError) as err_info:
+            fancytype_instance_A.dump(filename=io.StringIO(), **kwargs)
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename=io.StringIO("{}"), compression="gzip")
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename=io.BytesIO(b"{}"), mmap=True)
+
+    file_obj = io.BytesIO()
+    file_obj.close()
+    with pytest.raises(IOError) as err_info:
+        fancytype_instance_A.dump(filename=file_obj)
+    with pytest.raises(IOError) as err_info:
+        cls_alias.load(filename=file_obj)
+    for data in (b"{", b"\x1f\x8b\x00"):
+        with pytest.raises(IOError) as err_info:
+            cls_alias.load(filename=io.BytesIO(data))
+    with pytest.raises(IOError) as err_info:
+        cls_alias.load(filename=io.StringIO("{"))
+
+    file_obj = io.BytesIO()
+    fancytype_instance_A.dump(filename=file_obj, file_format="archive")
+    file_obj = io.BytesIO(file_obj.getvalue()[:-1])
+    with pytest.raises(IOError) as err_info:
+        cls_alias.load(filename=file_obj)
+
+    monkeypatch.setattr(fancytypes, "_min_num_chars_per_json_read", 1)
+    serialized_rep = fancytype_instance_A.dumps()
+    for encoding in ("utf-8", "utf-16"):
+        encoded_serialized_rep = serialized_rep.encode(encoding)
+        for serialized_rep_candidate in (encoded_serialized_rep,
+                                         bytearray(encoded_serialized_rep),
+                                         memoryview(encoded_serialized_rep)):
+            fancytype_instance_B = cls_alias.loads(serialized_rep_candidate)
+            assert (fancytype_instance_B.dumps() == serialized_rep)
+
+    serialized_rep_candidates = (memoryview(b"{}  ")[::2],
+                                 b"{\"word\": \"caf\xc3\"}")
+    for serialized_rep_candidate in serialized_rep_candidates:
+        with pytest.raises(ValueError) as err_info:
+            cls_alias.loads(serialized_rep_candidate)
+        
+    return None
+
+
+
+def test_10_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls12
+    fancytype_instance_A = cls_alias(real_array=np.arange(3.0))
+    fancytype_instance_B = cls_alias(real_array=np.arange(3.0), word="bar")
+
+    assert (fancytype_instance_A.diff(fancytype_instance_A) == dict())
+    assert (fancytype_instance_A.diff(fancytype_instance_B) == {"word": "bar"})
+
+    fancytype_instance_C = cls_alias(real_array=np.arange(5.0))
+    patch = fancytype_instance_A.diff(fancytype_instance_C)
+    assert (tuple(patch.keys()) == ("real_array",))
+    fancytype_instance_A.apply_patch(patch)
+    assert (fancytype_instance_A.dumps() == fancytype_instance_C.dumps())
+
+    serialized_patch = fancytype_instance_A.dumps_diff(fancytype_instance_B)
+    for serialized_patch_candidate in (serialized_patch,
+                                       serialized_patch.encode("utf-8")):
+        fancytype_instance_C = cls_alias(real_array=np.arange(5.0))
+        kwargs = {"serialized_patch": serialized_patch_candidate,
+                  "skip_validation_and_conversion": True}
+        fancytype_instance_C.apply_serialized_patch(**kwargs)
+        assert (fancytype_instance_C.dumps() == fancytype_instance_B.dumps())
+
+    with pytest.raises(TypeError) as err_info:
+        fancytype_instance_A.diff(None)
+    with pytest.raises(TypeError) as err_info:
+        fancytype_instance_A.apply_patch(None)
+    with pytest.raises(TypeError) as err_info:
+        fancytype_instance_A.apply_serialized_patch(None)
+
+    serialized_rep = fancytype_instance_A.dumps()
+    for patch in ({"foo": 1}, {"word": "bar", "real_array": "baz"}):
+        with pytest.raises(ValueError) as err_info:
+            fancytype_instance_A.apply_patch(patch)
+        assert (fancytype_instance_A.dumps() == serialized_rep)
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance_A.apply_serialized_patch("{")
+
+    return None
+
+
+
+def test_11_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls12
+    fancytype_instance_A = cls_alias(real_array=np.arange(3.0))
+
+    filename = "fancytype_journal.jsonl"
+    kwargs = {"filename": filename, "overwrite": True, "fsync_policy": "file"}
+    fancytype_instance_A.enable_journaling(**kwargs)
+    fancytype_instance_A.update({"word": "bar"})
+    fancytype_instance_A.update({"foo": "bar"})
+    fancytype_instance_A.update({"real_array": np.arange(4.0)})
+
+    def raise_runtime_error(names_of_changed_core_attrs):
+        raise RuntimeError
+
+    subscription_id = fancytype_instance_A.subscribe(raise_runtime_error)
+    with pytest.raises(RuntimeError) as err_info:
+        fancytype_instance_A.update({"word": "qux"})
+    fancytype_instance_A.unsubscribe(subscription_id)
+
+    with open(filename, "rb") as file_obj:
+        assert (len(file_obj.readlines()) == 5)
+
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.pre_serialize()
+            == fancytype_instance_A.pre_serialize())
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename, mmap=True)
+    with pytest.raises(IOError) as err_info:
+        fancytype_instance_B.enable_journaling(filename, overwrite=False)
+
+    with open(filename, "ab") as file_obj:
+        file_obj.write(b"{\"word\": \"ba")
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.pre_serialize()
+            == fancytype_instance_A.pre_serialize())
+
+    fancytype_instance_C = copy.deepcopy(fancytype_instance_A)
+    fancytype_instance_C.update({"word": "baz"})
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.pre_serialize()
+            == fancytype_instance_A.pre_serialize())
+
+    fancytype_instance_A.disable_journaling()
+    fancytype_instance_A.disable_journaling()
+
+    fancytype_instance_C = UpdatableCls1()
+    fancytype_instance_C.update({"word": "bar"})
+    assert (fancytype_instance_C.core_attrs["word"] == "bar")
+    fancytype_instance_A.update({"word": "baz"})
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.pre_serialize()
+            != fancytype_instance_A.pre_serialize())
+
+    kwargs = {"filename": filename,
+              "overwrite": True,
+              "compaction_threshold": 0}
+    fancytype_instance_A.enable_journaling(**kwargs)
+    for word in ("foo", "bar", "baz"):
+        fancytype_instance_A.update({"word": word})
+    with open(filename, "rb") as file_obj:
+        assert (len(file_obj.readlines()) == 3)
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.pre_serialize()
+            == fancytype_instance_A.pre_serialize())
+
+    with pytest.raises(IOError) as err_info:
+        kwargs = {"new_core_attr_subset_candidate": {"word": slice(None)},
+                  "skip_validation_and_conversion": True}
+        fancytype_instance_A.update(**kwargs)
+    assert (fancytype_instance_A._journal is None)
+
+    with pytest.raises(IOError) as err_info:
+        fancytype_instance_A.enable_journaling(filename, overwrite=True)
+
+    kwargs = {"filename": filename,
+              "overwrite": True,
+              "compaction_threshold": -1}
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance_B.enable_journaling(**kwargs)
+
+    for journal_contents in (b"\x93FANCYTYPES-JOURNAL\n",
+                             b"\x93FANCYTYPES-JOURNAL\n{}\n1\n"):
+        with open(filename, "wb") as file_obj:
+            file_obj.write(journal_contents)
+        with pytest.raises(IOError) as err_info:
+            cls_alias.load(filename)
+
+    pathlib.Path(filename).unlink()
+
+    return None
+
+
+
+def test_12_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls13
+    assert (cls_alias.get_load_cache_stats() is None)
+    cls_alias.enable_load_caching(capacity=1)
+    assert (PreSerializableAndUpdatableCls14.get_load_cache_stats() is None)
+
+    fancytype_instance_A = cls_alias(nonnegative_int=3)
+    filename = "serialized_rep_of_fancytype.json"
+    fancytype_instance_A.dump(filename, overwrite=True)
+
+    for _ in range(3):
+        fancytype_instance_B = cls_alias.load(filename)
+        assert (fancytype_instance_B.pre_serialize()
+                == fancytype_instance_A.pre_serialize())
+        core_attrs = fancytype_instance_B.get_core_attrs(deep_copy=False)
+        core_attrs["real_array"][0, 0] = 100.0
+    expected_load_cache_stats = \
+        {"capacity": 1, "num_entries": 1, "num_hits": 2, "num_misses": 1}
+    assert (cls_alias.get_load_cache_stats() == expected_load_cache_stats)
+
+    cls_alias.load(filename, skip_validation_and_conversion=True)
+    cls_alias.load(filename, skip_validation_and_conversion=1)
+    expected_load_cache_stats["num_misses"] += 1
+    expected_load_cache_stats["num_hits"] += 1
+    assert (cls_alias.get_load_cache_stats() == expected_load_cache_stats)
+
+    fancytype_instance_A.update({"nonnegative_int": 30})
+    fancytype_instance_A.dump(filename, overwrite=True)
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.core_attrs["nonnegative_int"] == 30)
+
+    monkeypatch.setattr(fancytypes,
+                        "_generate_load_cache_key",
+                        lambda **kwargs: object())
+    cls_alias.enable_load_caching()
+    cls_alias.load(filename)
+    assert (cls_alias.get_load_cache_stats()["num_entries"] == 0)
+    monkeypatch.undo()
+
+    pathlib.Path(filename).unlink()
+    with pytest.raises(IOError) as err_info:
+        cls_alias.load(filename)
+    cls_alias.disable_load_caching()
+    assert (cls_alias.get_load_cache_stats() is None)
+
+    cls_alias = PreSerializableAndUpdatableCls11
+    cls_alias.enable_load_caching()
+    cls_alias(nonnegative_int=5).dump(filename, overwrite=True)
+    for _ in range(2):
+        assert (cls_alias.load(filename).core_attrs["nonnegative_int"] == 5)
+    pathlib.Path(filename).unlink()
+    cls_alias.disable_load_caching()
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.enable_load_caching(capacity=0)
+
+    return None
+
+
+
+def test_13_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls13
+    fancytype_instance_A = cls_alias(nonnegative_int=3)
+    digest = fancytype_instance_A.compute_digest()
+
+    filename = "serialized_rep_of_fancytype.json"
+    kwargs = {"filename": filename, "overwrite": True, "embed_digest": True}
+    fancytype_instance_A.dump(**kwargs)
+
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance_A.dump(**kwargs, file_format="archive")
+    with pytest.raises(TypeError) as err_info:
+        cls_alias.load(filename, trusted_digests=1)
+
+    def raise_value_error(params):
+        raise ValueError
+
+    monkeypatch.setattr(fancytypes,
+                        "_check_and_convert_subset_of_core_attrs_candidate",
+                        raise_value_error)
+    fancytype_instance_B = cls_alias.load(filename, trusted_digests={digest})
+    assert (fancytype_instance_B.pre_serialize()
+            == fancytype_instance_A.pre_serialize())
+    for trusted_digests in (None, set()):
+        with pytest.raises(ValueError) as err_info:
+            cls_alias.load(filename, trusted_digests=trusted_digests)
+    monkeypatch.undo()
+
+    kwargs = {"nonnegative_int": 1,
+              "word": "way_too_long",
+              "real_array": np.zeros((2, 2)),
+              "skip_validation_and_conversion": True,
+              "skip_cls_tests": True}
+    tampered_instance = PreSerializableAndUpdatableCls15(**kwargs)
+    tampered_instance.dump(filename, overwrite=True, embed_digest=True)
+    with pytest.raises(ValueError) as err_info:
+        PreSerializableAndUpdatableCls15.load(filename,
+                                              fields=("word",
+                                                      "nonnegative_int"))
+    fancytype_instance_A.dump(filename, overwrite=True, embed_digest=True)
+
+    projected_core_attrs = cls_alias.load(filename, fields=("word",))
+    assert (projected_core_attrs["word"] == "foo")
+
+    with open(filename, "r") as file_obj:
+        serializable_rep = json.load(file_obj)
+    serializable_rep["__fancytypes_digest__"] = \
+        serializable_rep.pop("__fancytypes_digest__")
+    serialized_rep = json.dumps(serializable_rep)
+    assert (tuple(serializable_rep)[-1] == "__fancytypes_digest__")
+    fancytype_instance_B = cls_alias.load(io.StringIO(serialized_rep),
+                                          trusted_digests={digest})
+    assert (fancytype_instance_B.dumps() == fancytype_instance_A.dumps())
+    fancytype_instance_B = cls_alias.loads(serialized_rep)
+    assert (fancytype_instance_B.dumps() == fancytype_instance_A.dumps())
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.loads(serialized_rep.replace("foo", "bar"))
+
+    for cls_candidate in (PreSerializableAndUpdatableCls14,
+                          PreSerializableAndUpdatableCls12):
+        with pytest.raises(ValueError) as err_info:
+            cls_candidate.load(filename)
+
+    with open(filename, "r") as file_obj:
+        serialized_rep = file_obj.read()
+    with open(filename, "w") as file_obj:
+        file_obj.write(serialized_rep.replace("foo", "bar"))
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename)
+
+    pathlib.Path(filename).unlink()
+
+    return None
+
+
+
+def test_14_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls15
+    fancytype_instance_A = cls_alias(nonnegative_int=5, word="foo")
+    serializable_rep = fancytype_instance_A.pre_serialize()
+    serializable_rep["real_array"] = "invalid"
+    serialized_rep = json.dumps(serializable_rep)
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.loads(serialized_rep)
+    for skip_validation_and_conversion in (False, True):
+        kwargs = {"serialized_rep": serialized_rep,
+                  "skip_validation_and_conversion": \
+                  skip_validation_and_conversion,
+                  "fields": ("word",)}
+        projected_core_attrs = cls_alias.loads(**kwargs)
+        assert (dict(projected_core_attrs) == {"word": "foo"})
+        with pytest.raises(TypeError) as err_info:
+            projected_core_attrs["word"] = "bar"
+
+    serialized_rep = serialized_rep.replace("5", "1")
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.loads(serialized_rep, fields=("word",))
+    with pytest.raises(KeyError) as err_info:
+        cls_alias.loads(serialized_rep, fields=("foo",))
+
+    filename = "serialized_rep_of_fancytype.json"
+    for file_format in ("json", "archive"):
+        kwargs = {"filename": filename,
+                  "overwrite": True,
+                  "file_format": file_format}
+        fancytype_instance_A.dump(**kwargs)
+        projected_core_attrs = cls_alias.load(filename,
+                                              fields=("real_array", "word"))
+        assert (tuple(projected_core_attrs) == ("real_array", "word"))
+        assert np.all(projected_core_attrs["real_array"]
+                      == fancytype_instance_A.core_attrs["real_array"])
+    pathlib.Path(filename).unlink()
+
+    return None
+
+
+
+def test_15_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls13
+    fancytype_instance_A = cls_alias(nonnegative_int=3)
+
+    monkeypatch.delattr(fancytypes, "_read_json_obj")
+
+    filename = "serialized_rep_of_fancytype.json"
+    for embed_digest in (False, True):
+        kwargs = {"filename": filename,
+                  "overwrite": True,
+                  "embed_digest": embed_digest}
+        fancytype_instance_A.dump(**kwargs)
+        fancytype_instance_B = cls_alias.load(filename)
+        assert (fancytype_instance_B.pre_serialize()
+                == fancytype_instance_A.pre_serialize())
+
+    serializable_rep = {**fancytype_instance_A.pre_serialize(), "foo": 1}
+    with open(filename, "w") as file_obj:
+        json.dump(serializable_rep, file_obj)
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(filename)
+    pathlib.Path(filename).unlink()
+
+    return None
+
+
+
+def test_16_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls13
+    fancytype_instances = [cls_alias(nonnegative_int=nonnegative_int)
+                           for nonnegative_int in range(3)]
+    fancytype_instances[1].update({"word": "bar"})
+    fancytype_instances.append(PreSerializableAndUpdatableCls15(word="",
+                                                                real_array=[]))
+
+    serializable_reps = cls_alias.pre_serialize_many(fancytype_instances)
+    assert (serializable_reps
+            == [fancytype_instance.pre_serialize()
+                for fancytype_instance in fancytype_instances])
+
+    serialized_rep = cls_alias.dumps_many(fancytype_instances)
+    assert (serialized_rep == json.dumps(serializable_reps))
+    serialized_rep = cls_alias.dumps_many(fancytype_instances, "jsonl")
+    assert (serialized_rep.splitlines()
+            == [fancytype_instance.dumps()
+                for fancytype_instance in fancytype_instances])
+    assert (cls_alias.dumps_many(tuple(), "jsonl") == "")
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.dumps_many(fancytype_instances, "xml")
+    with pytest.raises(TypeError) as err_info:
+        PreSerializableAndUpdatableCls15.pre_serialize_many(fancytype_instances)
+
+    return None
+
+
+
+def test_17_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls15
+    fancytype_instance = cls_alias(nonnegative_int=5, word="abc")
+    word = fancytype_instance.get_core_attrs(deep_copy=False)["word"]
+    equal_word = "".join(("ab", "c"))
+    assert (equal_word is not word)
+
+    new_core_attr_subset_candidate = {"nonnegative_int": 1, "word": word}
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance.update(new_core_attr_subset_candidate)
+    assert (fancytype_instance.core_attrs["nonnegative_int"] == 5)
+
+    names_of_changed_core_attrs = []
+    fancytype_instance.subscribe(names_of_changed_core_attrs.append)
+    new_core_attr_subset_candidate = {"nonnegative_int": 4, "word": equal_word}
+    kwargs = {"new_core_attr_subset_candidate": new_core_attr_subset_candidate,
+              "compare_by_equality": True}
+    fancytype_instance.update(**kwargs)
+    assert (fancytype_instance.core_attrs["nonnegative_int"] == 4)
+    fancytype_instance.update({"word": word, "real_array": [[1.0]]})
+    assert (names_of_changed_core_attrs
+            == [frozenset(("nonnegative_int",)),
+                frozenset(("real_array", "word"))])
+
+    fancytype_instance = PreSerializableAndUpdatableCls17(word="abc")
+    word = fancytype_instance.get_core_attrs(deep_copy=False)["word"]
+    new_core_attr_subset_candidate = {"nonnegative_int": 1, "word": word}
+    fancytype_instance.subscribe(names_of_changed_core_attrs.append)
+    fancytype_instance.update(new_core_attr_subset_candidate)
+    assert (names_of_changed_core_attrs[-1] == frozenset(("nonnegative_int",)))
+
+    fancytype_instance = cls_alias(nonnegative_int=5, word="abc")
+    word = fancytype_instance.get_core_attrs(deep_copy=False)["word"]
+    with pytest.raises(ValueError) as err_info:
+        with fancytype_instance.batch_update():
+            fancytype_instance.update({"nonnegative_int": 1})
+            fancytype_instance.update({"word": word})
+
+    fancytype_instance.update({"nonnegative_int": 3, "word": "abc", "foo": 1})
+    core_attrs = fancytype_instance.core_attrs
+    assert ((core_attrs["nonnegative_int"] == 3) and ("foo" not in core_attrs))
+
+    with pytest.raises(TypeError) as err_info:
+        fancytype_instance.update(compare_by_equality=None)
+
+    validation_and_conversion_funcs = \
+        PreSerializableAndUpdatableCls13._validation_and_conversion_funcs_
+    validation_and_conversion_func = validation_and_conversion_funcs["word"]
+    num_validator_calls = [0]
+
+    def check_and_convert_word_and_count_calls(params):
+        num_validator_calls[0] += 1
+        
+        return validation_and_conversion_func(params)
+
+    monkeypatch.setitem(validation_and_conversion_funcs,
+                        "word",
+                        check_and_convert_word_and_count_calls)
+
+    # Without a declaration of what it depends on, the validator of ``word``
+    # is called even though only ``nonnegative_int`` changes.
+    expected_num_validator_calls = {PreSerializableAndUpdatableCls13: 1,
+                                    PreSerializableAndUpdatableCls17: 0}
+    for cls_alias in expected_num_validator_calls:
+        fancytype_instance = cls_alias()
+        new_core_attr_subset_candidate = \
+            {**fancytype_instance.get_core_attrs(deep_copy=False),
+             "nonnegative_int": 3}
+        num_validator_calls[0] = 0
+        fancytype_instance.update(new_core_attr_subset_candidate)
+        assert (num_validator_calls[0]
+                == expected_num_validator_calls[cls_alias])
+
+    return None
+
+
+
+def test_18_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls15
+    fancytype_instance = cls_alias(nonnegative_int=5, word="abc")
+    word = fancytype_instance.get_core_attrs(deep_copy=False)["word"]
+
+    with fancytype_instance.batch_update():
+        fancytype_instance.update({"word": "abcdefg"})
+        with fancytype_instance.batch_update():
+            fancytype_instance.update({"nonnegative_int": 10})
+        assert (fancytype_instance.core_attrs["word"] == "abc")
+    core_attrs = fancytype_instance.core_attrs
+    assert (core_attrs["word"] == "abcdefg")
+    assert (core_attrs["nonnegative_int"] == 10)
+
+    serialized_rep = fancytype_instance.dumps()
+    with pytest.raises(ValueError) as err_info:
+        with fancytype_instance.batch_update():
+            fancytype_instance.update({"word": "abcdefghijk"})
+            fancytype_instance.update({"nonnegative_int": 1})
+    assert (fancytype_instance.dumps() == serialized_rep)
+
+    with pytest.raises(RuntimeError) as err_info:
+        with fancytype_instance.batch_update():
+            fancytype_instance.update({"nonnegative_int": 3})
+            raise RuntimeError
+    assert (fancytype_instance.dumps() == serialized_rep)
+
+    word = fancytype_instance.get_core_attrs(deep_copy=False)["word"]
+    with fancytype_instance.batch_update():
+        fancytype_instance.update({"word": "a"})
+        fancytype_instance.update({"word": word})
+        fancytype_instance.update({"nonnegative_int": 10.0},
+                                  skip_validation_and_conversion=True)
+        fancytype_instance.update({"real_array": [[1.0]]},
+                                  skip_validation_and_conversion=True)
+        fancytype_instance.update({"real_array": [[2.0]]})
+    core_attrs = fancytype_instance.core_attrs
+    assert (core_attrs["word"] == "abcdefg")
+    assert isinstance(core_attrs["nonnegative_int"], float)
+    assert isinstance(core_attrs["real_array"], np.ndarray)
+
+    with fancytype_instance.batch_update():
+        fancytype_instance.update({"word": "foo", "nonnegative_int": 5})
+        fancytype_instance.update({"foo": 1})
+        with pytest.raises(TypeError) as err_info:
+            fancytype_instance.update({"word": "bar"},
+                                      skip_validation_and_conversion=None)
+    assert (fancytype_instance.core_attrs["word"] == "foo")
+
+    return None
+
+
+
+def test_19_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls13
+    fancytype_instance = cls_alias()
+    core_attrs_version = fancytype_instance.core_attrs_version
+    core_attrs_snapshot = fancytype_instance.get_core_attrs_snapshot()
+
+    fancytype_instance.update({"word": "bar"})
+    assert (fancytype_instance.core_attrs_version == core_attrs_version+1)
+    assert (core_attrs_snapshot["word"] == "foo")
+    assert (fancytype_instance.get_core_attrs_snapshot()["word"] == "bar")
+    with pytest.raises(TypeError) as err_info:
+        core_attrs_snapshot["word"] = "bar"
+
+    fancytype_instance.update({"word": "bar"}, compare_by_equality=True)
+    with fancytype_instance.batch_update():
+        pass
+    assert (fancytype_instance.core_attrs_version == core_attrs_version+1)
+
+    update_lock = fancytype_instance._update_lock
+    kwargs = {"target": fancytype_instance.enable_thread_safety}
+    threads = tuple(threading.Thread(**kwargs) for _ in range(4))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    fancytype_instance.enable_thread_safety()
+    assert (fancytype_instance._update_lock is update_lock)
+
+    def increment_nonnegative_int(num_increments):
+        for _ in range(num_increments):
+            with fancytype_instance.batch_update():
+                core_attrs_snapshot = \
+                    fancytype_instance.get_core_attrs_snapshot()
+                nonnegative_int = core_attrs_snapshot["nonnegative_int"]
+                new_core_attr_subset_candidate = \
+                    {"nonnegative_int": nonnegative_int+1}
+                fancytype_instance.update(new_core_attr_subset_candidate)
+
+        return None
+
+    threads = tuple(threading.Thread(target=increment_nonnegative_int,
+                                     args=(50,))
+                    for _ in range(4))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    core_attrs_snapshot = fancytype_instance.get_core_attrs_snapshot()
+    assert (core_attrs_snapshot["nonnegative_int"] == 200)
+    assert (fancytype_instance.core_attrs_version == core_attrs_version+201)
+
+    for fancytype_instance in (fancytype_instance, UpdatableCls1()):
+        fancytype_instance_copy = copy.deepcopy(fancytype_instance)
+        fancytype_instance_copy.update({"word": "baz"})
+        assert (fancytype_instance.core_attrs["word"] != "baz")
+        assert (fancytype_instance_copy._update_lock
+                is not fancytype_instance._update_lock)
+
+    return None
+
+
+
+def test_20_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls13
+    fancytype_instance = cls_alias()
+    fancytype_instance.enable_journaling("journal_of_fancytype.jsonl")
+
+    notifications = []
+    coalesced_notifications = []
+    kwargs = {"callback": notifications.append}
+    subscription_id_1 = fancytype_instance.subscribe(**kwargs)
+    kwargs = {"callback": coalesced_notifications.append, "coalesce": True}
+    subscription_id_2 = fancytype_instance.subscribe(**kwargs)
+
+    fancytype_instance.update({"word": "bar", "nonnegative_int": 5})
+    fancytype_instance.update({"word": "bar"}, compare_by_equality=True)
+    with fancytype_instance.batch_update():
+        fancytype_instance.update({"nonnegative_int": 1})
+        fancytype_instance.update({"nonnegative_int": 2})
+    assert (notifications == [frozenset({"word", "nonnegative_int"}),
+                              frozenset({"nonnegative_int"})])
+    assert (coalesced_notifications == [])
+
+    fancytype_instance.flush_notifications()
+    fancytype_instance.flush_notifications()
+    assert (coalesced_notifications
+            == [frozenset({"word", "nonnegative_int"})])
+
+    fancytype_instance_copy = copy.deepcopy(fancytype_instance)
+    fancytype_instance_copy.update({"word": "baz"})
+    assert (len(notifications) == 2)
+    
+    fancytype_instance.unsubscribe(subscription_id_1)
+    fancytype_instance.update({"word": "baz"})
+    assert (len(notifications) == 2)
+    with pytest.raises(KeyError) as err_info:
+        fancytype_instance.unsubscribe(subscription_id_1)
+    fancytype_instance.unsubscribe(subscription_id_2)
+    fancytype_instance.flush_notifications()
+    assert (len(coalesced_notifications) == 1)
+
+    with pytest.raises(TypeError) as err_info:
+        fancytype_instance.subscribe(callback=None)
+
+    fancytype_instance.enable_thread_safety()
+    subscription_ids = []
+
+    def subscribe_repeatedly(num_subscriptions):
+        for _ in range(num_subscriptions):
+            kwargs = {"callback": notifications.append}
+            subscription_ids.append(fancytype_instance.subscribe(**kwargs))
+
+        return None
+
+    threads = tuple(threading.Thread(target=subscribe_repeatedly, args=(50,))
+                    for _ in range(4))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (len(set(subscription_ids)) == 200)
+    for subscription_id in subscription_ids:
+        fancytype_instance.unsubscribe(subscription_id)
+    
+    fancytype_instance.disable_journaling()
+    pathlib.Path("journal_of_fancytype.jsonl").unlink()
+
+    return None
+
+
+
+def test_21_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls13
+    fancytype_instance = cls_alias()
+    notifications = []
+    fancytype_instance.subscribe(notifications.append)
+
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance.undo()
+    assert (fancytype_instance.num_undoable_steps == 0)
+    assert (fancytype_instance.num_redoable_steps == 0)
+
+    fancytype_instance.enable_history(max_depth=2)
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    real_array = core_attrs["real_array"]
+    for word in ("bar", "baz", "qux"):
+        fancytype_instance.update({"word": word})
+    with fancytype_instance.batch_update():
+        fancytype_instance.update({"nonnegative_int": 3})
+        with pytest.raises(ValueError) as err_info:
+            fancytype_instance.undo()
+    assert (fancytype_instance.num_undoable_steps == 2)
+
+    fancytype_instance.undo()
+    fancytype_instance.undo()
+    core_attrs = fancytype_instance.get_core_attrs(deep_copy=False)
+    assert (core_attrs["word"] == "baz")
+    assert (core_attrs["nonnegative_int"] == 0)
+    assert (core_attrs["real_array"] is real_array)
+    assert (notifications[-1] == frozenset({"word"}))
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance.undo()
+
+    fancytype_instance.redo()
+    assert (fancytype_instance.core_attrs["word"] == "qux")
+    assert (fancytype_instance.num_redoable_steps == 1)
+    fancytype_instance.update({"word": "quux"})
+    assert (fancytype_instance.num_redoable_steps == 0)
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance.redo()
+
+    fancytype_instance_copy = copy.deepcopy(fancytype_instance)
+    assert (fancytype_instance_copy.num_undoable_steps == 0)
+
+    fancytype_instance.disable_history()
+    assert (fancytype_instance.num_undoable_steps == 0)
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance.enable_history(max_depth=0)
+
+    return None
+
+
+
+def test_22_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls17
+    base = cls_alias()
+    axes = {"word": ("a", "b"), "nonnegative_int": range(3)}
+    variants = tuple(fancytypes.sweep(base, axes))
+    assert (len(variants) == 6)
+    
+    core_attrs = variants[4].get_core_attrs(deep_copy=False)
+    base_core_attrs = base.get_core_attrs(deep_copy=False)
+    assert (core_attrs["word"] == "b")
+    assert (core_attrs["nonnegative_int"] == 1)
+    assert (core_attrs["real_array"] is base_core_attrs["real_array"])
+    assert (variants[0].dumps() == cls_alias(word="a").dumps())
+
+    axes = {"real_array": ([[1.0]], [[2.0, 3.0]])}
+    variants = tuple(fancytypes.sweep(base, axes))
+    assert (variants[1].core_attrs["real_array"].shape == (1, 2))
+    assert (len(tuple(fancytypes.sweep(base))) == 1)
+
+    cls_alias = PreSerializableAndUpdatableCls15
+    base = cls_alias(nonnegative_int=5, word="abc")
+    variants = fancytypes.sweep(base, {"nonnegative_int": (5, 1)})
+    assert (next(variants).core_attrs["nonnegative_int"] == 5)
+    with pytest.raises(ValueError) as err_info:
+        next(variants)
+    variants = fancytypes.sweep(base, {"word": ("a", "abcdef")})
+    assert (next(variants).core_attrs["word"] == "a")
+    with pytest.raises(ValueError) as err_info:
+        next(variants)
+
+    with pytest.raises(TypeError) as err_info:
+        fancytypes.sweep(None, {"word": ("a",)})
+    with pytest.raises(KeyError) as err_info:
+        fancytypes.sweep(base, {"foo": ("a",)})
+
+    cls_alias = PreSerializableAndUpdatableCls21
+    base = cls_alias(nonnegative_int=5, word="abc")
+    axes = {"nonnegative_int": (1, 2), "real_array": ([[1.0]], [[1.0], [2.0]])}
+    variants = fancytypes.sweep(base, axes)
+    assert (next(variants).core_attrs["word"] == "a")
+    with pytest.raises(ValueError) as err_info:
+        next(variants)
+
+    kwargs = {"slice_obj": slice(None), "nonnegative_int": 5, "word": "foo"}
+    base = PreSerializableAndUpdatableCls2(**kwargs)
+    names_of_changed_core_attrs = []
+    base.subscribe(names_of_changed_core_attrs.append)
+    base.enable_history()
+    monkeypatch.setattr(fancytypes,
+                        "_preliminary_check_of_pre_serialization_funcs",
+                        None)
+    variants = tuple(fancytypes.sweep(base, {"nonnegative_int": (3, 4)}))
+    assert (variants[1].core_attrs["nonnegative_int"] == 4)
+    variants[1].update({"nonnegative_int": 6})
+    assert (base.core_attrs["nonnegative_int"] == 5)
+    assert (variants[1].num_undoable_steps == 0)
+    assert (len(names_of_changed_core_attrs) == 0)
+
+    return None
+
+
+
+def test_23_of_PreSerializableAndUpdatable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls18
+    fancytype_instance = cls_alias(nested=cls_alias())
+    nested_instance = fancytype_instance._core_attrs["nested"]
+    innermost_instance = nested_instance._core_attrs["nested"]
+    core_attrs_snapshot = fancytype_instance.get_core_attrs_snapshot()
+    fancytype_instance_copy = copy.copy(fancytype_instance)
+
+    names_of_changed_core_attrs = []
+    fancytype_instance.subscribe(names_of_changed_core_attrs.append)
+    fancytype_instance.enable_history()
+
+    fancytype_instance.update({"nested.nested.word": "ab"})
+    assert (fancytype_instance._core_attrs["nested"] is not nested_instance)
+    assert (core_attrs_snapshot["nested"] is nested_instance)
+    assert (fancytype_instance_copy._core_attrs["nested"] is nested_instance)
+    assert (nested_instance._core_attrs["nested"] is innermost_instance)
+    assert (innermost_instance.core_attrs["word"] == "abc")
+    assert (nested_instance.core_attrs_version == 0)
+    assert (fancytype_instance.core_attrs_version == 1)
+    assert (names_of_changed_core_attrs == [frozenset(("nested",))])
+    assert (fancytype_instance.num_undoable_steps == 1)
+
+    nested_instance = fancytype_instance._core_attrs["nested"]
+    innermost_instance = nested_instance._core_attrs["nested"]
+    assert (innermost_instance.core_attrs["word"] == "ab")
+
+    fancytype_instance.update({"nested.nested.word": "ab",
+                               "nested.foo": 1,
+                               "foo.bar": 1},
+                              compare_by_equality=True)
+    assert (fancytype_instance.core_attrs_version == 1)
+
+    for path in ("nested.nonnegative_int", "nested.nested.nonnegative_int"):
+        with pytest.raises(ValueError) as err_info:
+            fancytype_instance.update({path: 7})
+        assert (fancytype_instance._core_attrs["nested"] is nested_instance)
+        assert (nested_instance.core_attrs["nonnegative_int"] == 5)
+        assert (innermost_instance.core_attrs["nonnegative_int"] == 5)
+
+    kwargs = {"new_core_attr_subset_candidate": {"nested.nonnegative_int": 7},
+              "skip_validation_and_conversion": True}
+    fancytype_instance.update(**kwargs)
+    nested_core_attrs = fancytype_instance.core_attrs["nested"].core_attrs
+    assert (nested_core_attrs["nonnegative_int"] == 7)
+    assert (fancytype_instance.core_attrs_version == 2)
+
+    fancytype_instance.undo()
+    assert (fancytype_instance._core_attrs["nested"] is nested_instance)
+
+    fancytype_instance.update({"nonnegative_int": 7, "nested.nested.word": "a"})
+    core_attrs = fancytype_instance.core_attrs
+    assert (core_attrs["nonnegative_int"] == 7)
+    assert (core_attrs["nested"].core_attrs["nested"].core_attrs["word"] == "a")
+
+    nested_instance = PreSerializableAndUpdatableCls15(nonnegative_int=5)
+    fancytype_instance.update({"nested": nested_instance, "nested.word": "a"})
+    assert (fancytype_instance.core_attrs["nested"].core_attrs["word"] == "a")
+    assert (nested_instance.core_attrs["word"] == "foo")
+
+    with pytest.raises(TypeError) as err_info:
+        fancytype_instance.update({"nonnegative_int.foo": 1})
+    with pytest.raises(ValueError) as err_info:
+        with fancytype_instance.batch_update():
+            fancytype_instance.update({"nested.nonnegative_int": 7})
+
+    serializable_rep = fancytype_instance.pre_serialize()
+    kwargs = {"serializable_rep": serializable_rep}
+    assert (cls_alias.de_pre_serialize(**kwargs).pre_serialize()
+            == serializable_rep)
+
+    num_validator_calls = [0]
+
+    def check_and_convert_nested_and_count_calls(params):
+        num_validator_calls[0] += 1
+        
+        return _check_and_convert_nested(params)
+
+    monkeypatch.setitem(cls_alias._validation_and_conversion_funcs_,
+                        "nested",
+                        check_and_convert_nested_and_count_calls)
+
+    fancytype_instance = cls_alias(nested=cls_alias())
+    num_validator_calls[0] = 0
+    fancytype_instance.update({"nested.nested.word": "ab"})
+    assert (num_validator_calls[0] == 0)
+    with pytest.raises(ValueError) as err_info:
+        fancytype_instance.update({"nested.nonnegative_int": 7})
+    fancytype_instance.update({"nonnegative_int": 7, "nested.nested.word": "a"})
+    assert (num_validator_calls[0] == 1)
+
+    return None
+
+
+
+def test_24_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls19
+    real_array = np.arange(400.0).reshape((20, 20))
+    kwargs = {"nonnegative_int": 5, "word": "abc", "real_array": real_array}
+    nested = PreSerializableAndUpdatableCls15(**kwargs)
+    kwargs = {"nested": nested,
+              "real_array": real_array.copy(),
+              "other_nested": copy.deepcopy(nested),
+              "skip_validation_and_conversion": True}
+    fancytype_instance = cls_alias(**kwargs)
+
+    serializable_rep = fancytype_instance.pre_serialize(deduplicate=True)
+    shared_reps = serializable_rep["__fancytypes_shared_reps__"]
+    assert (len(shared_reps) == 1)
+    assert (serializable_rep["other_nested"]["core_attrs"]["real_array"]
+            == {"__fancytypes_ref__": "0"})
+
+    kwargs["other_nested"] = nested
+    fancytype_instance = cls_alias(**kwargs)
+
+    serializable_rep = fancytype_instance.pre_serialize(deduplicate=True)
+    shared_reps = serializable_rep["__fancytypes_shared_reps__"]
+    assert (tuple(serializable_rep)[0] == "__fancytypes_shared_reps__")
+    assert (len(shared_reps) == 2)
+    assert (serializable_rep["real_array"] == {"__fancytypes_ref__": "0"})
+    assert (serializable_rep["nested"] == {"__fancytypes_ref__": "1"})
+    assert (serializable_rep["other_nested"] == {"__fancytypes_ref__": "1"})
+    assert (shared_reps["1"]["core_attrs"]["real_array"]
+            == {"__fancytypes_ref__": "0"})
+    
+    serialized_rep = fancytype_instance.dumps(deduplicate=True)
+    assert (len(serialized_rep) < len(fancytype_instance.dumps()) // 2)
+    assert ("__fancytypes_shared_reps__"
+            not in cls_alias().pre_serialize(deduplicate=True))
+
+    expected_serializable_rep = fancytype_instance.pre_serialize()
+    kwargs = {"serialized_rep": serialized_rep}
+    for skip_validation_and_conversion in (False, True):
+        kwargs["skip_validation_and_conversion"] = \
+            skip_validation_and_conversion
+        fancytype_instance_B = cls_alias.loads(**kwargs)
+        assert (fancytype_instance_B.pre_serialize()
+                == expected_serializable_rep)
+    core_attrs = fancytype_instance_B.get_core_attrs(deep_copy=False)
+    assert (core_attrs["nested"] is core_attrs["other_nested"])
+
+    fancytype_instance_B = cls_alias.load(io.StringIO(serialized_rep))
+    assert (fancytype_instance_B.pre_serialize() == expected_serializable_rep)
+
+    kwargs = {"filename": io.StringIO(serialized_rep),
+              "fields": ("real_array", "other_nested")}
+    projected_core_attrs = cls_alias.load(**kwargs)
+    assert (projected_core_attrs["real_array"].shape == (20, 20))
+
+    file_obj = io.BytesIO()
+    fancytype_instance.dump(file_obj, embed_digest=True, deduplicate=True)
+    digest = fancytype_instance.compute_digest(deduplicate=True)
+    serializable_rep_B = json.loads(file_obj.getvalue())
+    assert (tuple(serializable_rep_B)[:2]
+            == ("__fancytypes_digest__", "__fancytypes_shared_reps__"))
+    assert (serializable_rep_B["__fancytypes_digest__"]["sha256"] == digest)
+    assert (digest != fancytype_instance.compute_digest())
+    file_obj.seek(0)
+    fancytype_instance_B = cls_alias.load(file_obj, trusted_digests={digest})
+    assert (fancytype_instance_B.pre_serialize() == expected_serializable_rep)
+    core_attrs = fancytype_instance_B.get_core_attrs(deep_copy=False)
+    assert (core_attrs["nested"] is core_attrs["other_nested"])
+
+    filename = "fancytype.fta"
+    kwargs = {"fancytype_instances": (fancytype_instance,),
+              "filenames": (filename,),
+              "overwrite": True,
+              "file_format": "archive",
+              "deduplicate": True}
+    fancytypes.batch_dump(**kwargs)
+    fancytype_instance_B = cls_alias.load(filename)
+    assert (fancytype_instance_B.pre_serialize() == expected_serializable_rep)
+    pathlib.Path(filename).unlink()
+
+    serializable_rep["__fancytypes_shared_reps__"] = None
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.load(io.StringIO(json.dumps(serializable_rep)))
+
+    return None
+
+
+
+def test_25_of_PreSerializableAndUpdatable():
+    cls_alias = PreSerializableAndUpdatableCls20
+    serialized_rep = cls_alias(nonnegative_int=3, word="abc").dumps()
+    projected_core_attrs = cls_alias.loads(serialized_rep, fields=("word",))
+    assert (projected_core_attrs["word"] == "abc")
+
+    serialized_rep = serialized_rep.replace("3", "1", 1)
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.loads(serialized_rep, fields=("word",))
+
+    serializable_rep = json.loads(serialized_rep)
+    del serializable_rep["nonnegative_int"]
+    kwargs = {"serializable_rep": \
+              serializable_rep,
+              "array_attrs": \
+              dict(),
+              "de_pre_serialization_funcs": \
+              cls_alias.get_de_pre_serialization_funcs(),
+              "validation_and_conversion_funcs": \
+              cls_alias.get_validation_and_conversion_funcs(),
+              "skip_validation_and_conversion": \
+              False}
+    core_attrs_candidate = fancytypes._ProjectedCoreAttrsCandidate(**kwargs)
+    assert (len(core_attrs_candidate) == 2)
+    assert (tuple(core_attrs_candidate) == ("word", "real_array"))
+    assert (tuple(core_attrs_candidate.keys()) == ("word", "real_array"))
+    assert ("nonnegative_int" not in core_attrs_candidate)
+    assert (core_attrs_candidate.get("nonnegative_int", 3) == 3)
+    assert (core_attrs_candidate.values()[0] == "abc")
+    assert (tuple(core_attrs_candidate.copy()) == ("word", "real_array"))
+    with pytest.raises(KeyError) as err_info:
+        core_attrs_candidate["nonnegative_int"]
+
+    return None
+
+
+
+def _check_and_convert_nonnegative_int_column(params):
+    obj_name = "nonnegative_int"
+    nonnegative_int_column = np.asarray(params[obj_name])
+    if (nonnegative_int_column.dtype.kind not in "iu"
+        or np.any(nonnegative_int_column < 0)):
+        raise ValueError("Invalid column.")
+
+    return nonnegative_int_column
+
+
+
+def test_1_of_ColumnarCollection():
+    cls_alias = PreSerializableAndUpdatableCls13
+    columns = {"nonnegative_int": [3, 2.0, 1],
+               "word": ["foo", "bar", "baz"],
+               "real_array": [[1.0, 2.0], [3.0], []]}
+    columnar_collection_A = fancytypes.ColumnarCollection(cls_alias, columns)
+
+    assert (columnar_collection_A.fancytype_cls is cls_alias)
+    assert (len(columnar_collection_A) == 3)
+    assert isinstance(columnar_collection_A.columns["nonnegative_int"],
+                      np.ndarray)
+    columns_A = columnar_collection_A.get_columns(deep_copy=False)
+    assert isinstance(columns_A["word"], list)
+
+    fancytype_instance = columnar_collection_A[-2]
+    assert isinstance(fancytype_instance, cls_alias)
+    assert (fancytype_instance.core_attrs["nonnegative_int"] == 2)
+    assert (type(fancytype_instance.core_attrs["nonnegative_int"]) is int)
+    assert (fancytype_instance.core_attrs["word"] == "bar")
+    with pytest.raises(IndexError) as err_info:
+        columnar_collection_A[3]
+
+    fancytype_instances = list(columnar_collection_A)
+    columnar_collection_B = \
+        fancytypes.ColumnarCollection.from_instances(cls_alias,
+                                                     fancytype_instances)
+    assert (columnar_collection_B.pre_serialize()
+            == columnar_collection_A.pre_serialize())
+    assert (len(columnar_collection_A[1:]) == 2)
+    assert (columnar_collection_A[1:].dumps()
+            == fancytypes.ColumnarCollection(cls_alias,
+                                             {key: column[1:]
+                                              for key, column
+                                              in columns.items()}).dumps())
+
+    column_validation_and_conversion_funcs = \
+        {"nonnegative_int": _check_and_convert_nonnegative_int_column}
+    kwargs = {"fancytype_cls": \
+              cls_alias,
+              "columns": \
+              {**columns, "nonnegative_int": np.array([3, 2, 1])},
+              "column_validation_and_conversion_funcs": \
+              column_validation_and_conversion_funcs}
+    columnar_collection_B = fancytypes.ColumnarCollection(**kwargs)
+    assert (columnar_collection_B.dumps() == columnar_collection_A.dumps())
+
+    for nonnegative_int_column in (np.array([3, -2, 1]), np.array([3, 2])):
+        kwargs["columns"] = {**columns,
+                             "nonnegative_int": nonnegative_int_column}
+        if len(nonnegative_int_column) == 2:
+            kwargs["columns"] = {key: column[:2]
+                                 for key, column in kwargs["columns"].items()}
+            kwargs["column_validation_and_conversion_funcs"] = \
+                {"nonnegative_int": lambda params: [0]}
+        with pytest.raises(ValueError) as err_info:
+            fancytypes.ColumnarCollection(**kwargs)
+
+    serialized_rep = columnar_collection_A.dumps()
+    serializable_rep = columnar_collection_A.pre_serialize()
+    for columnar_collection_B in \
+        (fancytypes.ColumnarCollection.loads(cls_alias, serialized_rep),
+         fancytypes.ColumnarCollection.de_pre_serialize(cls_alias,
+                                                        serializable_rep)):
+        assert (columnar_collection_B.dumps() == serialized_rep)
+
+    filename = "columnar_collection"
+    for file_format in ("json", "npz"):
+        kwargs = {"filename": filename,
+                  "overwrite": True,
+                  "file_format": file_format}
+        columnar_collection_A.dump(**kwargs)
+        kwargs = {"fancytype_cls": cls_alias,
+                  "filename": filename,
+                  "skip_validation_and_conversion": True}
+        columnar_collection_B = fancytypes.ColumnarCollection.load(**kwargs)
+        assert (columnar_collection_B.dumps() == serialized_rep)
+        assert (columnar_collection_B[0].dumps()
+                == columnar_collection_A[0].dumps())
+        with pytest.raises(IOError) as err_info:
+            columnar_collection_A.dump(filename, overwrite=False)
+
+    with open(filename, "w") as file_obj:
+        file_obj.write("{")
+    with pytest.raises(IOError) as err_info:
+        fancytypes.ColumnarCollection.load(cls_alias, filename)
+    pathlib.Path(filename).unlink()
+
+    columnar_collection_B = fancytypes.ColumnarCollection(cls_alias)
+    assert (len(columnar_collection_B) == 0)
+    assert (columnar_collection_B.pre_serialize()
+            == {"nonnegative_int": [], "word": [], "real_array": []})
+
+    kwargs = {"fancytype_cls": cls_alias,
+              "columns": {**columns, "nonnegative_int": [2**70, 1, 0]},
+              "skip_validation_and_conversion": True}
+    columnar_collection_B = fancytypes.ColumnarCollection(**kwargs)
+    assert isinstance(columnar_collection_B.columns["nonnegative_int"], list)
+
+    kwargs["columns"] = {**columns,
+                         "word": [slice(None)]*3,
+                         "real_array": [np.zeros((1,))]*3}
+    columnar_collection_B = fancytypes.ColumnarCollection(**kwargs)
+    with pytest.raises(IOError) as err_info:
+        columnar_collection_B.dump(filename, overwrite=True)
+    assert (not pathlib.Path(filename).exists())
+
+    kwargs = {"fancytype_cls": PreSerializableAndUpdatableCls11,
+              "columns": {"slice_obj": [slice(2)], "nonnegative_int": [2]}}
+    fancytype_instance = fancytypes.ColumnarCollection(**kwargs)[0]
+    assert (fancytype_instance.core_attrs["slice_obj"] == slice(2))
+
+    func_alias = fancytypes.ColumnarCollection
+    for fancytype_cls in (None, int):
+        with pytest.raises(TypeError) as err_info:
+            func_alias(fancytype_cls)
+    with pytest.raises(KeyError) as err_info:
+        func_alias(cls_alias, {"word": ["foo"]})
+    with pytest.raises(ValueError) as err_info:
+        func_alias(cls_alias, {**columns, "word": ["foo"]})
+    with pytest.raises(KeyError) as err_info:
+        kwargs = {"fancytype_cls": cls_alias,
+                  "column_validation_and_conversion_funcs": {"foo": len}}
+        func_alias(**kwargs)
+    with pytest.raises(TypeError) as err_info:
+        kwargs = {"fancytype_cls": cls_alias,
+                  "column_validation_and_conversion_funcs": {"word": None}}
+        func_alias(**kwargs)
+        
+    with pytest.raises(TypeError) as err_info:
+        func_alias.from_instances(cls_alias, None)
+    with pytest.raises(TypeError) as err_info:
+        func_alias.from_instances(cls_alias, [None])
+    with pytest.raises(TypeError) as err_info:
+        func_alias(UpdatableCls1).pre_serialize()
+    with pytest.raises(TypeError) as err_info:
+        func_alias.de_pre_serialize(UpdatableCls1, dict())
+    with pytest.raises(ValueError) as err_info:
+        func_alias.de_pre_serialize(cls_alias, {"foo": [1]})
+    with pytest.raises(TypeError) as err_info:
+        func_alias.loads(cls_alias, None)
+    with pytest.raises(ValueError) as err_info:
+        func_alias.loads(cls_alias, "{")
+
+    return None
+
+
+
+def test_2_of_ColumnarCollection():
+    cls_alias = PreSerializableAndUpdatableCls13
+    assert (cls_alias.get_column_validation_and_conversion_funcs() == dict())
+
+    cls_alias = PreSerializableAndUpdatableCls14
+    columns = {"nonnegative_int": np.array([3, 2, 1]),
+               "word": ["foo", "bar", "baz"],
+               "real_array": [[1.0, 2.0], [3.0], []]}
+    columnar_collection_A = fancytypes.ColumnarCollection(cls_alias, columns)
+    assert (columnar_collection_A[0].core_attrs["nonnegative_int"] == 3)
+
+    kwargs = {"fancytype_cls": cls_alias,
+              "columns": {**columns, "nonnegative_int": [3, 2.0, 1]}}
+    with pytest.raises(ValueError) as err_info:
+        fancytypes.ColumnarCollection(**kwargs)
+
+    kwargs["column_validation_and_conversion_funcs"] = \
+        {"nonnegative_int": lambda params: [3, 2, 1]}
+    columnar_collection_B = fancytypes.ColumnarCollection(**kwargs)
+    assert (columnar_collection_B.dumps() == columnar_collection_A.dumps())
+
+    serialized_rep = columnar_collection_A.dumps().replace("3", "-3", 1)
+    with pytest.raises(ValueError) as err_info:
+        fancytypes.ColumnarCollection.loads(cls_alias, serialized_rep)
+
+    return None
+
+
+
+def test_1_of_SQLiteStore():
+    cls_alias = PreSerializableAndUpdatableCls13
+    kwargs = {"fancytype_cls": cls_alias,
+              "filename": ":memory:",
+              "indexed_attr_names": ("nonnegative_int", "word", "word")}
+    sqlite_store = fancytypes.SQLiteStore(**kwargs)
+    assert (sqlite_store.fancytype_cls is cls_alias)
+    assert (sqlite_store.indexed_attr_names == ("nonnegative_int", "word"))
+
+    fancytype_instances = tuple(cls_alias(nonnegative_int=nonnegative_int,
+                                          word=word)
+                                for nonnegative_int, word
+                                in zip(range(5), ("foo", "bar")*3))
+    sqlite_store.add_many(fancytype_instances[:4])
+    sqlite_store.add(fancytype_instances[4])
+    assert (len(sqlite_store) == 5)
+
+    conditions = {"word": "foo", "nonnegative_int": (1, None)}
+    assert (sqlite_store.count(conditions) == 2)
+    for conditions, expected_nonnegative_ints in (({}, [0, 1, 2, 3, 4]),
+                                                  (conditions, [2, 4]),
+                                                  ({"word": "bar",
+                                                    "nonnegative_int": [0, 2]},
+                                                   [1])):
+        kwargs = {"conditions": conditions,
+                  "skip_validation_and_conversion": True}
+        fancytype_instances = list(sqlite_store.query(**kwargs))
+        assert ([fancytype_instance.core_attrs["nonnegative_int"]
+                 for fancytype_instance in fancytype_instances]
+                == expected_nonnegative_ints)
+        assert isinstance(fancytype_instances[0], cls_alias)
+
+    for conditions in ({"real_array": 1}, {"word": ("foo",)}):
+        with pytest.raises((KeyError, ValueError)) as err_info:
+            sqlite_store.count(conditions)
+
+    with pytest.raises(ValueError) as err_info:
+        sqlite_store.add_many([cls_alias(), cls_alias(nonnegative_int=2**63)])
+    assert (len(sqlite_store) == 5)
+    with pytest.raises(TypeError) as err_info:
+        sqlite_store.add(UpdatableCls1())
+
+    sqlite_store.close()
+
+    filename = "store_of_fancytype_instances.sqlite3"
+    sqlite_store = fancytypes.SQLiteStore(cls_alias, filename, ("word",))
+    sqlite_store.add(cls_alias())
+    sqlite_store.close()
+    sqlite_store = fancytypes.SQLiteStore(cls_alias, filename, ("word",))
+    assert (len(sqlite_store) == 1)
+    sqlite_store.close()
+    with pytest.raises(ValueError) as err_info:
+        fancytypes.SQLiteStore(cls_alias, filename, ("nonnegative_int",))
+    pathlib.Path(filename).write_bytes(b"not a database" * 100)
+    with pytest.raises(IOError) as err_info:
+        fancytypes.SQLiteStore(cls_alias, filename)
+    pathlib.Path(filename).unlink()
+
+    with pytest.raises(IOError) as err_info:
+        fancytypes.SQLiteStore(cls_alias, "nonexistent_dir/store.sqlite3")
+    with pytest.raises(KeyError) as err_info:
+        fancytypes.SQLiteStore(cls_alias, ":memory:", ("foo",))
+    with pytest.raises(TypeError) as err_info:
+        fancytypes.SQLiteStore(UpdatableCls1, ":memory:")
+
+    return None
+
+
+
+def test_1_of_Checkable(monkeypatch):
+    params_iterable = ({"nonnegative_int": 3},
+                       {"nonnegative_int": -1},
+                       {"word": "bar", "foo": 1},
+                       {"nonnegative_int": 2, "word": "ab"})
+
+    for cls_alias in (PreSerializableAndUpdatableCls13,
+                      PreSerializableAndUpdatableCls14,
+                      PreSerializableAndUpdatableCls16):
+        for chunk_size in (1, 2, 4):
+            kwargs = {"params_iterable": params_iterable,
+                      "on_error": "yield",
+                      "chunk_size": chunk_size}
+            results = tuple(cls_alias.iter_validate(**kwargs))
+            assert (results[0].core_attrs["nonnegative_int"] == 3)
+            assert (results[1][0] == 1)
+            assert isinstance(results[1][1], ValueError)
+            assert (results[2][0] == 2)
+            assert isinstance(results[2][1], TypeError)
+            assert (results[3].core_attrs["word"] == "ab")
+
+            kwargs["on_error"] = "skip"
+            results = tuple(cls_alias.iter_validate(**kwargs))
+            assert (len(results) == 2)
+
+            kwargs["on_error"] = "raise"
+            with pytest.raises(ValueError) as err_info:
+                tuple(cls_alias.iter_validate(**kwargs))
+
+    cls_alias = PreSerializableAndUpdatableCls16
+    kwargs = {"params_iterable": ({"word": "bar"}, {"nonnegative_int": 1}),
+              "on_error": "yield",
+              "chunk_size": 2}
+    results = tuple(cls_alias.iter_validate(**kwargs))
+    assert isinstance(results[0][1], TypeError)
+
+    cls_alias = PreSerializableAndUpdatableCls14
+    kwargs = {"params_iterable": [params_iterable[0]]*5, "chunk_size": 2}
+    results = tuple(cls_alias.iter_validate(**kwargs))
+    assert (results[4].dumps() == results[0].dumps())
+
+    cls_alias = PreSerializableAndUpdatableCls11
+    kwargs = {"params_iterable": ({"nonnegative_int": 1}, [("foo", 1)])}
+    results = tuple(cls_alias.iter_validate(**kwargs, on_error="yield"))
+    assert (results[0].core_attrs["nonnegative_int"] == 1)
+    assert (results[1][0] == 1)
+
+    cls_alias = PreSerializableAndUpdatableCls14
+    validation_and_conversion_funcs = \
+        cls_alias._validation_and_conversion_funcs_
+    validation_and_conversion_func = validation_and_conversion_funcs["word"]
+    num_validator_calls = [0]
+
+    def check_and_convert_word_and_count_calls(params):
+        num_validator_calls[0] += 1
+        
+        return validation_and_conversion_func(params)
+
+    monkeypatch.setitem(validation_and_conversion_funcs,
+                        "word",
+                        check_and_convert_word_and_count_calls)
+
+    kwargs = {"params_iterable": ({"nonnegative_int": 1},
+                                  {"nonnegative_int": 2, "word": 3},
+                                  {"nonnegative_int": 3, "word": "bar"},
+                                  {"nonnegative_int": 4}),
+              "on_error": "yield",
+              "chunk_size": 4}
+    results = tuple(cls_alias.iter_validate(**kwargs))
+    assert (num_validator_calls[0] == 5)
+    assert isinstance(results[1][1], TypeError)
+    assert ([results[idx].core_attrs["nonnegative_int"] for idx in (0, 2, 3)]
+            == [1, 3, 4])
+
+    def generate_params(num_params):
+        for nonnegative_int in range(num_params):
+            yield {"nonnegative_int": nonnegative_int}
+        raise RuntimeError
+
+    cls_alias = PreSerializableAndUpdatableCls13
+    kwargs = {"params_iterable": generate_params(3), "prefetch_size": 2}
+    results = cls_alias.iter_validate(**kwargs)
+    for nonnegative_int in range(3):
+        assert (next(results).core_attrs["nonnegative_int"] == nonnegative_int)
+    with pytest.raises(RuntimeError) as err_info:
+        next(results)
+
+    kwargs = {"params_iterable": generate_params(10), "prefetch_size": 1}
+    results = cls_alias.iter_validate(**kwargs)
+    next(results)
+    time.sleep(0.05)
+    results.close()
+    time.sleep(0.05)
+
+    kwargs = {"params_iterable": generate_params(0), "prefetch_size": 1}
+    results = cls_alias.iter_validate(**kwargs, on_error="skip")
+    with pytest.raises(RuntimeError) as err_info:
+        tuple(results)
+
+    kwargs = {"params_iterable": iter(({},)), "prefetch_size": 1}
+    assert (len(tuple(cls_alias.iter_validate(**kwargs))) == 1)
+
+    for kwargs in ({"on_error": "ignore"},
+                   {"chunk_size": 0},
+                   {"prefetch_size": -1}):
+        with pytest.raises(ValueError) as err_info:
+            cls_alias.iter_validate(**kwargs)
+
+    return None
+
+
+
+def test_2_of_Checkable(monkeypatch):
+    params_iterable = ({"nonnegative_int": -1, "word": "toolong", "foo": 1},
+                       {"nonnegative_int": 7, "word": "toolong"},
+                       ("foo",))
+
+    cls_alias = PreSerializableAndUpdatableCls15
+    for chunk_size in (1, 3):
+        kwargs = {"params_iterable": params_iterable,
+                  "on_error": "collect",
+                  "chunk_size": chunk_size}
+        results = tuple(cls_alias.iter_validate(**kwargs))
+        idx, error_report = results[0]
+        assert (idx == 0)
+        assert ([entry["attr_name"] for entry in error_report]
+                == ["foo", "nonnegative_int", "word"])
+        assert (error_report[0]["exception_type"] == KeyError)
+        assert (error_report[2]["message"] == "The word is too long.")
+        assert (results[1].core_attrs["word"] == "toolong")
+        assert (results[2][1][0]["attr_name"] is None)
+
+        kwargs["error_budget"] = 1
+        results = cls_alias.iter_validate(**kwargs)
+        assert (next(results)[0] == 0)
+        assert (next(results).core_attrs["nonnegative_int"] == 7)
+        with pytest.raises(ValueError) as err_info:
+            next(results)
+
+    cls_alias = PreSerializableAndUpdatableCls16
+    kwargs = {"params_iterable": ({"word": "bar"},), "on_error": "collect"}
+    error_report = next(cls_alias.iter_validate(**kwargs))[1]
+    assert (error_report[0]["attr_name"] == "nonnegative_int")
+    assert (error_report[0]["exception_type"] == TypeError)
+
+    kwargs = {"params_iterable": ({"nonnegative_int": 1}, {"word": 1}),
+              "on_error": "skip",
+              "error_budget": 0}
+    results = cls_alias.iter_validate(**kwargs)
+    assert (next(results).core_attrs["nonnegative_int"] == 1)
+    with pytest.raises(ValueError) as err_info:
+        next(results)
+
+    with pytest.raises(ValueError) as err_info:
+        cls_alias.iter_validate(error_budget=-1)
+
+    cls_alias = PreSerializableAndUpdatableCls11
+    kwargs = {"params_iterable": ({"nonnegative_int": 2},),
+              "on_error": "collect"}
+    fancytype_instance = next(cls_alias.iter_validate(**kwargs))
+    assert (fancytype_instance.core_attrs["nonnegative_int"] == 2)
+
+    def raise_runtime_error(self, **kwargs):
+        raise RuntimeError("The instance cannot be constructed.")
+
+    cls_alias = PreSerializableAndUpdatableCls13
+    with monkeypatch.context() as monkeypatch_ctx:
+        monkeypatch_ctx.setattr(fancytypes.PreSerializableAndUpdatable,
+                                "__init__",
+                                raise_runtime_error)
+        kwargs = {"params_iterable": ({"nonnegative_int": 2},),
+                  "on_error": "collect"}
+        error_report = next(cls_alias.iter_validate(**kwargs))[1]
+    assert (error_report[0]["attr_name"] is None)
+    assert (error_report[0]["exception_type"] == RuntimeError)
+    assert (error_report[0]["message"]
+            == "The instance cannot be constructed.")
+
+    return None
+
+
+
+def test_3_of_Checkable(monkeypatch):
+    cls_alias = PreSerializableAndUpdatableCls17
+    assert (cls_alias.get_validator_memoization_stats() is None)
+
+    cls_alias.enable_validator_memoization(capacity=3)
+    fancytype_instances = tuple(cls_alias(word="foo") for _ in range(3))
+    validator_memoization_stats = cls_alias.get_validator_memoization_stats()
+    assert (validator_memoization_stats["num_hits"] == 4)
+    assert (validator_memoization_stats["num_misses"] == 2)
+    assert (validator_memoization_stats["num_entries"] == 2)
+    assert (fancytype_instances[2].dumps() == fancytype_instances[0].dumps())
+
+    fancytype_instance = fancytype_instances[0]
+    fancytype_instance.update({"word": "bar"})
+    fancytype_instance.update({"word": "foo"})
+    assert (fancytype_instance.core_attrs["word"] == "foo")
+    validator_memoization_stats = cls_alias.get_validator_memoization_stats()
+    assert (validator_memoization_stats["num_hits"] == 5)
+    assert (validator_memoization_stats["num_misses"] == 3)
+
+    real_array = [[5.0, 6.0]]
+    fancytype_instance = cls_alias(real_array=tuple(map(tuple, real_array)))
+    fancytype_instance.update({"real_array": real_array})
+    assert (fancytype_instance.core_attrs["real_array"].tolist() == real_array)
+    
+    with pytest.raises(TypeError) as err_info:
+        cls_alias(word=3)
+    with pytest.raises(TypeError) as err_info:
+        cls_alias(word=3)
+
+    validator_memoization_stats = fancytypes.get_validator_memoization_stats()
+    assert (validator_memoization_stats["num_caches"] >= 1)
+    assert (validator_memoization_stats["num_entries"] == 3)
+    fancytypes.clear_validator_memoization_caches()
+    validator_memoization_stats = cls_alias.get_validator_memoization_stats()
+    assert (validator_memoization_stats["num_hits"] == 0)
+    assert (validator_memoization_stats["num_entries"] == 0)
+
+    kwargs = {"params_iterable": ({"word": "foo"}, {"word": "foo"}),
+              "on_error": "collect"}
+    fancytype_instances = tuple(cls_alias.iter_validate(**kwargs))
+    assert (fancytype_instances[1].core_attrs["word"] == "foo")
+    validator_memoization_stats = cls_alias.get_validator_memoization_stats()
+    assert (validator_memoization_stats["num_hits"] ==2)
+    assert (validator_memoization_stats["num_misses"] == 2)
+
+    cls_alias.disable_validator_memoization()
+    assert (cls_alias.get_validator_memoization_stats() is None)
+    assert (cls_alias(word="foo").core_attrs["word"] == "foo")
+
+    def get_validation_and_conversion_funcs(cls):
+        validation_and_conversion_funcs = \
+            cls._validation_and_conversion_funcs_.copy()
+        kwargs = {"validation_and_conversion_func": \
+                  validation_and_conversion_funcs["real_array"],
+                  "relevant_attr_names": \
+                  ("real_array",),
+                  "deep_copy": \
+                  False}
+        validation_and_conversion_funcs["real_array"] = \
+            fancytypes.mark_as_memoizable(**kwargs)
+
+        return validation_and_conversion_funcs
+
+    monkeypatch.setattr(cls_alias,
+                        "get_validation_and_conversion_funcs",
+                        classmethod(get_validation_and_conversion_funcs))
+    cls_alias.enable_validator_memoization()
+    fancytype_instances = tuple(cls_alias() for _ in range(2))
+    core_attr_sets = tuple(fancytype_instance.get_core_attrs(deep_copy=False)
+                           for fancytype_instance in fancytype_instances)
+    assert (core_attr_sets[0]["real_array"] is core_attr_sets[1]["real_array"])
+    assert (core_attr_sets[0]["word"] == core_attr_sets[1]["word"])
+    cls_alias.disable_validator_memoization()
+
+    with pytest.raises(TypeError) as err_info:
+        fancytypes.mark_as_memoizable(None, ("word",))
+    with pytest.raises(TypeError) as err_info:
+        fancytypes.mark_as_memoizable(len, 3)
+
     return None
 
 